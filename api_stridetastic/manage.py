@@ -7,6 +7,8 @@ import sys
 def main():
     """Run administrative tasks."""
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "stridetastic_api.settings")
+    # Must be set before anything imports google.protobuf; see settings.py.
+    os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
@@ -2,6 +2,8 @@ from django.contrib import admin
 from unfold.admin import ModelAdmin
 
 from ..models.packet_models import (
+    DeviceTelemetryPayload,
+    EnvironmentTelemetryPayload,
     NodeInfoPayload,
     Packet,
     PacketData,
@@ -9,7 +11,6 @@ from ..models.packet_models import (
     RouteDiscoveryPayload,
     RouteDiscoveryRoute,
     RoutingPayload,
-    TelemetryPayload,
 )
 
 
@@ -17,7 +18,7 @@ from ..models.packet_models import (
 class PacketAdmin(ModelAdmin):
     list_display = (
         "packet_id",
-        "channel_ids",
+        "channel__channel_id",
         "data__port",
         "from_node__node_id",
         "from_node__long_name",
@@ -44,7 +45,7 @@ class PacketAdmin(ModelAdmin):
 
     readonly_fields = (
         "packet_id",
-        "channels",
+        "channel",
         "from_node",
         "to_node",
         "hop_start",
@@ -76,9 +77,6 @@ class PacketAdmin(ModelAdmin):
         "to_node__long_name",
     )
 
-    def channel_ids(self, obj):
-        return ", ".join(str(channel.channel_id) for channel in obj.channels.all())
-
     def gateway_nodes_node_id(self, obj):
         return ", ".join(str(node.node_id) for node in obj.gateway_nodes.all())
 
@@ -88,7 +86,6 @@ class PacketAdmin(ModelAdmin):
     def gateway_nodes_short_name(self, obj):
         return ", ".join(str(node.short_name) for node in obj.gateway_nodes.all())
 
-    channel_ids.short_description = "Channel IDs"
     gateway_nodes_node_id.short_description = "Gateways Node IDs"
     gateway_nodes_long_name.short_description = "Gateways Long Name"
     gateway_nodes_short_name.short_description = "Gateways Short Name"
@@ -284,16 +281,16 @@ class RouteDiscoveryRouteAdmin(ModelAdmin):
     ordering = ("-time",)
 
 
-@admin.register(TelemetryPayload)
-class TelemetryPayloadAdmin(ModelAdmin):
+@admin.register(DeviceTelemetryPayload)
+class DeviceTelemetryPayloadAdmin(ModelAdmin):
     list_display = (
         "packet_data__packet__from_node__node_id",
         "packet_data__packet__from_node__short_name",
         "packet_data__packet__from_node__long_name",
+        "battery_level",
         "voltage",
         "channel_utilization",
         "uptime_seconds",
-        "temperature",
         "time",
     )
 
@@ -304,7 +301,6 @@ class TelemetryPayloadAdmin(ModelAdmin):
         "voltage",
         "channel_utilization",
         "uptime_seconds",
-        "temperature",
     )
 
     readonly_fields = (
@@ -314,6 +310,44 @@ class TelemetryPayloadAdmin(ModelAdmin):
         "channel_utilization",
         "air_util_tx",
         "uptime_seconds",
+        "time",
+    )
+
+    fieldsets = (
+        (
+            None,
+            {
+                "fields": readonly_fields,
+            },
+        ),
+    )
+
+    list_select_related = ("packet_data",)
+
+    ordering = ("-time",)
+
+
+@admin.register(EnvironmentTelemetryPayload)
+class EnvironmentTelemetryPayloadAdmin(ModelAdmin):
+    list_display = (
+        "packet_data__packet__from_node__node_id",
+        "packet_data__packet__from_node__short_name",
+        "packet_data__packet__from_node__long_name",
+        "temperature",
+        "relative_humidity",
+        "barometric_pressure",
+        "time",
+    )
+
+    list_filter = (
+        "packet_data__packet__from_node__node_id",
+        "packet_data__packet__from_node__short_name",
+        "packet_data__packet__from_node__long_name",
+        "temperature",
+    )
+
+    readonly_fields = (
+        "packet_data",
         "temperature",
         "relative_humidity",
         "barometric_pressure",
@@ -14,10 +14,12 @@ from .controllers import (
     VirtualNodeMetaController,
 )
 from .controllers.interface_controller import InterfaceController
+from .renderers import ORJSONRenderer
 
 api = NinjaExtraAPI(
     title="Stridetastic API",
     version="1.0.0",
+    renderer=ORJSONRenderer(),
 )
 
 
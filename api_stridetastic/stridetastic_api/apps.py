@@ -9,6 +9,11 @@ class StridetasticApiConfig(AppConfig):
     name = "stridetastic_api"
 
     def ready(self):
+        if self._is_web_server():
+            from .schemas._warmup import start_schema_warmup
+
+            start_schema_warmup()
+
         if not self._should_start_services():
             return
 
@@ -18,6 +23,10 @@ class StridetasticApiConfig(AppConfig):
     def _is_celery_worker(self) -> bool:
         return any(arg == "worker" for arg in sys.argv)
 
+    def _is_web_server(self) -> bool:
+        program = os.path.basename(sys.argv[0]) if sys.argv else ""
+        return "runserver" in sys.argv or program in ("gunicorn", "uvicorn")
+
     def _should_start_services(self) -> bool:
         """Check if services should be started"""
         if self._is_celery_worker():
@@ -27,7 +36,7 @@ class StridetasticApiConfig(AppConfig):
     def register_signals(self):
         """Registra todas las señales de la aplicación"""
         # Importa las señales para que se registren
-        from .signals import user_signals  # noqa
+        from .signals import node_signals, user_signals  # noqa
 
     def start_services(self):
         """Initialize and start all services"""
@@ -7,7 +7,11 @@ from ninja import Schema
 from ninja_extra import api_controller, permissions, route
 from ninja_jwt.authentication import JWTAuth
 
-from ..schemas.capture_schemas import CaptureSessionSchema, CaptureStartSchema
+from ..schemas.capture_schemas import (
+    CAPTURE_SESSIONS_ADAPTER,
+    CaptureSessionSchema,
+    CaptureStartSchema,
+)
 from ..schemas.common_schemas import MessageSchema
 from ..services.service_manager import ServiceManager
 
@@ -39,7 +43,9 @@ class CaptureController:
     def list_sessions(self, request):
         service = self._get_service()
         sessions = service.list_sessions()
-        return [service.to_dict(session) for session in sessions]
+        return CAPTURE_SESSIONS_ADAPTER.validate_python(
+            [service.to_dict(session) for session in sessions]
+        )
 
     @route.post(
         "/start", response={201: CaptureStartResponse, 400: MessageSchema}, auth=auth
@@ -12,9 +12,9 @@ from ..models import Channel
 from ..schemas import (
     ChannelSchema,
     ChannelsStatisticsSchema,
-    ChannelStatisticsSchema,
     MessageSchema,
 )
+from ..schemas.channel_schemas import CHANNEL_STATS_ADAPTER
 from ..utils.node_serialization import serialize_node
 
 auth = JWTAuth()
@@ -47,17 +47,14 @@ class ChannelController:
         if not channels:
             return 404, MessageSchema(message="No channels found")
 
-        statistics = []
-        for channel in channels:
-            channel_stats = channel.get_statistics()
-            if not channel_stats:
-                continue
-            statistics.append(ChannelStatisticsSchema(**channel_stats))
-
-        if not statistics:
+        rows = [channel.get_statistics() for channel in channels]
+        rows = [channel_stats for channel_stats in rows if channel_stats]
+        if not rows:
             return 404, MessageSchema(message="No channel statistics available")
 
-        return 200, ChannelsStatisticsSchema(channels=statistics)
+        return 200, ChannelsStatisticsSchema(
+            channels=CHANNEL_STATS_ADAPTER.validate_python(rows)
+        )
 
     @route.get(
         "/{channel_id}/{channel_num}",
@@ -9,6 +9,7 @@ from ninja_jwt.authentication import JWTAuth  # type: ignore[import]
 
 from ..models.graph_models import Edge
 from ..schemas import EdgeSchema, MessageSchema
+from ..utils.json_response import trusted_json_response
 from ..utils.time_filters import parse_time_window
 
 auth = JWTAuth()
@@ -46,9 +47,9 @@ class GraphController:
             return 400, MessageSchema(message=str(e))
 
         # Queryset with optional time filter and perf optimizations
-        edges_qs = Edge.objects.select_related(
-            "source_node", "target_node", "last_packet"
-        ).prefetch_related("interfaces")
+        edges_qs = Edge.objects.select_related("last_packet").prefetch_related(
+            "interfaces"
+        )
         if since_utc is not None:
             edges_qs = edges_qs.filter(last_seen__gte=since_utc)
         if until_utc is not None:
@@ -57,17 +58,27 @@ class GraphController:
         edges = list(edges_qs)
         if not edges:
             return 404, MessageSchema(message="No edges found")
-        return 200, [
-            EdgeSchema(
-                source_node_id=edge.source_node.id,
-                target_node_id=edge.target_node.id,
-                first_seen=edge.first_seen,
-                last_seen=edge.last_seen,
-                last_packet_id=edge.last_packet.packet_id if edge.last_packet else None,
-                last_rx_rssi=edge.last_rx_rssi,
-                last_rx_snr=edge.last_rx_snr,
-                last_hops=edge.last_hops,
-                interfaces_names=[iface.name for iface in edge.interfaces.all()],
-            )
-            for edge in edges
-        ]
+        # Edges are outbound-only and built from trusted rows, so encode the
+        # payload directly instead of constructing one EdgeSchema per edge.
+        return trusted_json_response(
+            [
+                {
+                    "source_node_id": edge.source_node_id,
+                    "target_node_id": edge.target_node_id,
+                    "first_seen": edge.first_seen,
+                    "last_seen": edge.last_seen,
+                    "last_packet_id": (
+                        edge.last_packet.packet_id if edge.last_packet else None
+                    ),
+                    "last_rx_rssi": edge.last_rx_rssi,
+                    "last_rx_snr": (
+                        float(edge.last_rx_snr)
+                        if edge.last_rx_snr is not None
+                        else None
+                    ),
+                    "last_hops": edge.last_hops,
+                    "interfaces_names": [iface.name for iface in edge.interfaces.all()],
+                }
+                for edge in edges
+            ]
+        )
@@ -11,9 +11,9 @@ from ..schemas import (
     KeepaliveConfigSchema,
     KeepaliveConfigUpdateSchema,
     KeepaliveInterfaceSchema,
-    KeepaliveNodeSummarySchema,
     KeepaliveStatusSchema,
     KeepaliveTransitionSchema,
+    LinkNodeSchema,
     MessageSchema,
 )
 from ..utils.time_filters import parse_time_window
@@ -59,7 +59,7 @@ class KeepaliveController:
             scope=config.scope,
             selected_node_ids=[node.id for node in selected_nodes],
             selected_nodes=[
-                KeepaliveNodeSummarySchema(
+                LinkNodeSchema.from_trusted(
                     id=node.id,
                     node_id=node.node_id,
                     node_num=node.node_num,
@@ -193,7 +193,7 @@ class KeepaliveController:
 
         entries = list(qs.order_by("-time")[:max_limit])
         return [
-            KeepaliveTransitionSchema(
+            KeepaliveTransitionSchema.from_trusted(
                 id=entry.id,
                 node_id=entry.node.node_id,
                 node_num=entry.node.node_num,
@@ -8,7 +8,9 @@ from ninja_jwt.authentication import JWTAuth  # type: ignore[import]
 from ..models import NodeLink
 from ..models.packet_models import Packet
 from ..schemas import MessageSchema, NodeLinkPacketSchema, NodeLinkSchema
-from ..utils.link_serialization import serialize_link_packet, serialize_node_link
+from ..utils.json_response import trusted_json_response
+from ..utils.link_serialization import node_link_row, serialize_link_packet
+from ..utils.response_cache import cache_response
 from ..utils.time_filters import parse_time_window
 
 auth = JWTAuth()
@@ -17,6 +19,7 @@ auth = JWTAuth()
 @api_controller("/links", tags=["Links"], permissions=[permissions.IsAuthenticated])
 class LinkController:
     @route.get("/", response={200: List[NodeLinkSchema], 400: MessageSchema}, auth=auth)
+    @cache_response("short")
     def list_links(self, request):
         query_params = request.GET
         last = query_params.get("last")
@@ -42,8 +45,9 @@ class LinkController:
                 "last_packet__from_node",
                 "last_packet__to_node",
                 "last_packet__data",
+                "last_packet__channel",
             )
-            .prefetch_related("channels", "last_packet__channels")
+            .prefetch_related("channels")
             .order_by("-last_activity", "-first_seen")
         )
 
@@ -107,8 +111,7 @@ class LinkController:
                 return 400, MessageSchema(message="Invalid offset parameter")
 
         links = list(queryset[offset : offset + limit])
-        serialized = [serialize_node_link(link) for link in links]
-        return 200, serialized
+        return trusted_json_response([node_link_row(link) for link in links])
 
     @route.get(
         "/{link_id}",
@@ -124,7 +127,8 @@ class LinkController:
                 "last_packet__from_node",
                 "last_packet__to_node",
                 "last_packet__data",
-                "last_packet__data__telemetry_payload",
+                "last_packet__data__device_telemetry_payload",
+                "last_packet__data__environment_telemetry_payload",
                 "last_packet__data__position_payload",
                 "last_packet__data__node_info_payload",
                 "last_packet__data__neighbor_info_payload",
@@ -132,10 +136,10 @@ class LinkController:
                 "last_packet__data__route_discovery_payload__route_towards",
                 "last_packet__data__route_discovery_payload__route_back",
                 "last_packet__data__routing_payload",
+                "last_packet__channel",
             )
             .prefetch_related(
                 "channels",
-                "last_packet__channels",
                 "last_packet__data__neighbor_info_payload__neighbors",
                 "last_packet__data__neighbor_info_payload__neighbors__node",
                 "last_packet__data__route_discovery_payload__route_towards__nodes",
@@ -146,7 +150,7 @@ class LinkController:
         )
         if not link:
             return 404, MessageSchema(message="Link not found")
-        return 200, serialize_node_link(link)
+        return trusted_json_response(node_link_row(link))
 
     @route.get(
         "/{link_id}/packets",
@@ -201,7 +205,8 @@ class LinkController:
                 "from_node",
                 "to_node",
                 "data",
-                "data__telemetry_payload",
+                "data__device_telemetry_payload",
+                "data__environment_telemetry_payload",
                 "data__position_payload",
                 "data__node_info_payload",
                 "data__neighbor_info_payload",
@@ -209,8 +214,8 @@ class LinkController:
                 "data__route_discovery_payload__route_towards",
                 "data__route_discovery_payload__route_back",
                 "data__routing_payload",
+                "channel",
             )
-            .prefetch_related("channels")
             .prefetch_related(
                 "data__neighbor_info_payload__neighbors",
                 "data__neighbor_info_payload__neighbors__node",
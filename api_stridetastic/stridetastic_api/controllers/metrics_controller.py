@@ -1,20 +1,19 @@
 from datetime import timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Optional
 
+import orjson
 from django.db.models import Avg
+from django.http import HttpResponse
 from django.utils import timezone
 from ninja_extra import permissions  # type: ignore[import]
 from ninja_extra import api_controller, route
 from ninja_jwt.authentication import JWTAuth  # type: ignore[import]
 
 from ..models import Channel, Edge, NetworkOverviewSnapshot, Node, NodeLink
-from ..schemas import (
-    MessageSchema,
-    OverviewMetricSnapshotSchema,
-    OverviewMetricsResponseSchema,
-    OverviewMetricsSchema,
-)
+from ..renderers import ORJSONRenderer
+from ..schemas import MessageSchema, OverviewMetricsResponseSchema
+from ..utils.response_cache import cache_response
 from ..utils.time_filters import parse_time_window
 
 auth = JWTAuth()
@@ -31,20 +30,31 @@ def _to_float(value: Optional[Decimal | float | int]) -> Optional[float]:
     return float(value)
 
 
-def _build_snapshot_payload(
-    snapshot: NetworkOverviewSnapshot,
-) -> OverviewMetricSnapshotSchema:
-    return OverviewMetricSnapshotSchema(
-        timestamp=snapshot.time,
-        total_nodes=snapshot.total_nodes,
-        active_nodes=snapshot.active_nodes,
-        reachable_nodes=snapshot.reachable_nodes,
-        active_connections=snapshot.active_connections,
-        channels=snapshot.channels,
-        avg_battery=_to_float(snapshot.avg_battery),
-        avg_rssi=_to_float(snapshot.avg_rssi),
-        avg_snr=_to_float(snapshot.avg_snr),
-    )
+SNAPSHOT_COLUMNS = (
+    "time",
+    "total_nodes",
+    "active_nodes",
+    "reachable_nodes",
+    "active_connections",
+    "channels",
+    "avg_battery",
+    "avg_rssi",
+    "avg_snr",
+)
+
+
+def _snapshot_entry(row: tuple[Any, ...]) -> dict[str, Any]:
+    return {
+        "timestamp": row[0],
+        "total_nodes": row[1],
+        "active_nodes": row[2],
+        "reachable_nodes": row[3],
+        "active_connections": row[4],
+        "channels": row[5],
+        "avg_battery": _to_float(row[6]),
+        "avg_rssi": _to_float(row[7]),
+        "avg_snr": _to_float(row[8]),
+    }
 
 
 @api_controller("/metrics", tags=["Metrics"], permissions=[permissions.IsAuthenticated])
@@ -54,6 +64,8 @@ class MetricsController:
         response={200: OverviewMetricsResponseSchema, 400: MessageSchema},
         auth=auth,
     )
+    # Requests that record a snapshot must always run; a cache hit would drop it.
+    @cache_response("normal", bypass=lambda kwargs: kwargs.get("record_snapshot", True))
     def get_overview_metrics(
         self,
         request,
@@ -115,7 +127,7 @@ class MetricsController:
                 avg_snr=avg_snr,
             )
 
-        history_payload: List[OverviewMetricSnapshotSchema] = []
+        history: list[dict[str, Any]] = []
         if include_history:
             try:
                 since_utc, until_utc = parse_time_window(
@@ -136,23 +148,25 @@ class MetricsController:
             if until_utc is not None:
                 history_qs = history_qs.filter(time__lte=until_utc)
 
-            snapshots = list(history_qs[:limit])
-            history_payload = [
-                _build_snapshot_payload(snapshot) for snapshot in reversed(snapshots)
-            ]
-
-        response_payload = OverviewMetricsResponseSchema(
-            current=OverviewMetricsSchema(
-                total_nodes=total_nodes,
-                active_nodes=active_nodes,
-                reachable_nodes=reachable_nodes,
-                active_connections=active_connections,
-                channels=channels_count,
-                avg_battery=avg_battery,
-                avg_rssi=avg_rssi,
-                avg_snr=avg_snr,
-            ),
-            history=history_payload,
+            rows = list(history_qs.values_list(*SNAPSHOT_COLUMNS)[:limit])
+            history = [_snapshot_entry(row) for row in reversed(rows)]
+
+        # Encoded straight from the value rows; the shape is
+        # OverviewMetricsResponseSchema.
+        body = orjson.dumps(
+            {
+                "current": {
+                    "total_nodes": total_nodes,
+                    "active_nodes": active_nodes,
+                    "reachable_nodes": reachable_nodes,
+                    "active_connections": active_connections,
+                    "channels": channels_count,
+                    "avg_battery": avg_battery,
+                    "avg_rssi": avg_rssi,
+                    "avg_snr": avg_snr,
+                },
+                "history": history,
+            },
+            option=ORJSONRenderer.option,
         )
-
-        return 200, response_payload
+        return HttpResponse(body, content_type=ORJSONRenderer.media_type)
@@ -6,7 +6,7 @@
 
 
 from collections import defaultdict
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from django.db.models import Count, Max, Q  # type: ignore[import]
 from meshtastic.protobuf import portnums_pb2  # type: ignore[attr-defined]
@@ -14,12 +14,22 @@ from ninja_extra import permissions  # type: ignore[import]
 from ninja_extra import api_controller, route
 from ninja_jwt.authentication import JWTAuth  # type: ignore[import]
 
-from ..models import Node, NodeLatencyHistory  # type: ignore[import]
-from ..models.packet_models import PacketData, PositionPayload, TelemetryPayload
+from ..models import (  # type: ignore[import]
+    Node,
+    NodeLatencyHistory,
+    NodeTelemetryHourly,
+)
+from ..models.packet_models import (
+    DeviceTelemetryPayload,
+    EnvironmentTelemetryPayload,
+    PacketData,
+    PositionPayload,
+)
 from ..schemas import (
     MessageSchema,
     NodeKeyHealthSchema,
     NodeLatencyHistorySchema,
+    NodeListItemSchema,
     NodePortActivitySchema,
     NodePortPacketSchema,
     NodePositionHistorySchema,
@@ -31,13 +41,40 @@ from ..schemas import (
     VirtualNodeUpdateSchema,
 )
 from ..services.virtual_node_service import VirtualNodeError, VirtualNodeService
-from ..utils.node_serialization import serialize_node
+from ..utils.json_response import schema_list_response, trusted_json_response
+from ..utils.node_serialization import (
+    NODE_LIST_ITEM_FIELDS,
+    NODE_TELEMETRY_FIELDS,
+    node_row,
+    serialize_node,
+    serialize_node_list_item,
+)
 from ..utils.packet_payloads import build_packet_payload_schema
 from ..utils.ports import resolve_port_identity
+from ..utils.response_cache import cache_response
 from ..utils.time_filters import parse_time_window
 
 auth = JWTAuth()
 
+TELEMETRY_RESOLUTIONS = ("raw", "1h")
+
+
+def _as_float(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def _filter_last_seen(queryset, query_params):
+    since_utc, until_utc = parse_time_window(
+        last=query_params.get("last"),
+        since=query_params.get("since"),
+        until=query_params.get("until"),
+    )
+    if since_utc is not None:
+        queryset = queryset.filter(last_seen__gte=since_utc)
+    if until_utc is not None:
+        queryset = queryset.filter(last_seen__lte=until_utc)
+    return queryset
+
 
 @api_controller("/nodes", tags=["Nodes"], permissions=[permissions.IsAuthenticated])
 class NodeController:
@@ -58,30 +95,49 @@ class NodeController:
 
         Here we should rethink the interfaces logic, maybe its not optimal.
         """
-        query_params = request.GET
-        last = query_params.get("last")
-        since = query_params.get("since")
-        until = query_params.get("until")
-
         try:
-            since_utc, until_utc = parse_time_window(
-                last=last, since=since, until=until
-            )
+            nodes_qs = _filter_last_seen(Node.objects.all(), request.GET)
         except ValueError as e:
             return 400, MessageSchema(message=str(e))
 
-        nodes_qs = Node.objects.all().prefetch_related("interfaces")
-        if since_utc is not None:
-            nodes_qs = nodes_qs.filter(last_seen__gte=since_utc)
-        if until_utc is not None:
-            nodes_qs = nodes_qs.filter(last_seen__lte=until_utc)
-
-        nodes = list(nodes_qs)
+        nodes = list(nodes_qs.prefetch_related("interfaces"))
         if not nodes:
             return 404, MessageSchema(message="No nodes found")
-        return 200, [self._serialize_node(node) for node in nodes]
+        return trusted_json_response([node_row(node) for node in nodes])
+
+    @route.get(
+        "/summary",
+        response={
+            200: List[NodeListItemSchema],
+            404: MessageSchema,
+            400: MessageSchema,
+        },
+        auth=auth,
+    )
+    def get_node_summaries(self, request, include_telemetry: bool = False):
+        """
+        Get a compact list of nodes with identity and position only.
+
+        Only the listed columns are selected. Pass ``include_telemetry=true``
+        to attach the latest device and environment readings to each item.
+        """
+        try:
+            nodes_qs = _filter_last_seen(Node.objects.all(), request.GET)
+        except ValueError as e:
+            return 400, MessageSchema(message=str(e))
+
+        columns = NODE_LIST_ITEM_FIELDS
+        if include_telemetry:
+            columns += NODE_TELEMETRY_FIELDS
+        rows = list(nodes_qs.order_by("-last_seen").values(*columns))
+        if not rows:
+            return 404, MessageSchema(message="No nodes found")
+        return schema_list_response(
+            NodeListItemSchema, [serialize_node_list_item(row) for row in rows]
+        )
 
     @route.get("/keys/health", response=List[NodeKeyHealthSchema], auth=auth)
+    @cache_response("normal")
     def get_node_key_health(self):
         """Return nodes that have low-entropy keys or duplicate public keys."""
         nodes = list(
@@ -153,7 +209,7 @@ class NodeController:
             .prefetch_related("interfaces")
             .order_by("long_name", "node_id")
         )
-        return [self._serialize_node(node) for node in nodes]
+        return trusted_json_response([node_row(node) for node in nodes])
 
     @route.post(
         "/virtual",
@@ -311,7 +367,7 @@ class NodeController:
             packet = getattr(payload.packet_data, "packet", None)
             packet_id = getattr(packet, "packet_id", None) if packet else None
             history.append(
-                NodePositionHistorySchema(
+                NodePositionHistorySchema.from_trusted(
                     timestamp=payload.time,
                     latitude=latitude,
                     longitude=longitude,
@@ -323,7 +379,7 @@ class NodeController:
                 )
             )
 
-        return 200, history
+        return schema_list_response(NodePositionHistorySchema, history)
 
     @route.get(
         "/{node_id}/telemetry",
@@ -361,68 +417,110 @@ class NodeController:
                 return 400, MessageSchema(message="Invalid limit parameter")
         limit = max(1, min(limit, 500))
 
-        telemetry_qs = (
-            TelemetryPayload.objects.filter(
-                packet_data__packet__from_node=node,
+        resolution = query_params.get("resolution") or "raw"
+        if resolution not in TELEMETRY_RESOLUTIONS:
+            return 400, MessageSchema(message="Invalid resolution parameter")
+        if resolution == "1h":
+            return schema_list_response(
+                NodeTelemetryHistorySchema,
+                self._telemetry_rollup_history(node, since_utc, until_utc, limit),
             )
-            .select_related("packet_data__packet")
-            .order_by("-time")
+
+        device_qs = DeviceTelemetryPayload.objects.filter(
+            packet_data__packet__from_node=node,
+        )
+        environment_qs = EnvironmentTelemetryPayload.objects.filter(
+            packet_data__packet__from_node=node,
         )
 
         if since_utc is not None:
-            telemetry_qs = telemetry_qs.filter(time__gte=since_utc)
+            device_qs = device_qs.filter(time__gte=since_utc)
+            environment_qs = environment_qs.filter(time__gte=since_utc)
         if until_utc is not None:
-            telemetry_qs = telemetry_qs.filter(time__lte=until_utc)
-
-        telemetry = list(telemetry_qs[:limit])
-        if not telemetry:
+            device_qs = device_qs.filter(time__lte=until_utc)
+            environment_qs = environment_qs.filter(time__lte=until_utc)
+
+        # Device and environment metrics live in separate tables; merge them
+        # back into one row per telemetry packet before applying the limit.
+        samples: Dict[int, Dict[str, Any]] = {}
+        for payload in device_qs.order_by("-time")[:limit]:
+            samples[payload.packet_data_id] = {"time": payload.time, "device": payload}
+        for payload in environment_qs.order_by("-time")[:limit]:
+            sample = samples.setdefault(payload.packet_data_id, {"time": payload.time})
+            sample["environment"] = payload
+
+        if not samples:
             return 200, []
 
+        telemetry = sorted(
+            samples.values(), key=lambda sample: sample["time"], reverse=True
+        )[:limit]
+
         history: List[NodeTelemetryHistorySchema] = []
-        for payload in reversed(telemetry):
+        for sample in reversed(telemetry):
+            device = sample.get("device")
+            environment = sample.get("environment")
             history.append(
-                NodeTelemetryHistorySchema(
-                    timestamp=payload.time,
-                    battery_level=payload.battery_level,
-                    voltage=(
-                        float(payload.voltage) if payload.voltage is not None else None
-                    ),
+                NodeTelemetryHistorySchema.from_trusted(
+                    timestamp=sample["time"],
+                    battery_level=device.battery_level if device else None,
+                    voltage=_as_float(device.voltage) if device else None,
                     channel_utilization=(
-                        float(payload.channel_utilization)
-                        if payload.channel_utilization is not None
-                        else None
+                        _as_float(device.channel_utilization) if device else None
                     ),
-                    air_util_tx=(
-                        float(payload.air_util_tx)
-                        if payload.air_util_tx is not None
-                        else None
-                    ),
-                    uptime_seconds=payload.uptime_seconds,
+                    air_util_tx=_as_float(device.air_util_tx) if device else None,
+                    uptime_seconds=device.uptime_seconds if device else None,
                     temperature=(
-                        float(payload.temperature)
-                        if payload.temperature is not None
-                        else None
+                        _as_float(environment.temperature) if environment else None
                     ),
                     relative_humidity=(
-                        float(payload.relative_humidity)
-                        if payload.relative_humidity is not None
+                        _as_float(environment.relative_humidity)
+                        if environment
                         else None
                     ),
                     barometric_pressure=(
-                        float(payload.barometric_pressure)
-                        if payload.barometric_pressure is not None
+                        _as_float(environment.barometric_pressure)
+                        if environment
                         else None
                     ),
                     gas_resistance=(
-                        float(payload.gas_resistance)
-                        if payload.gas_resistance is not None
-                        else None
+                        _as_float(environment.gas_resistance) if environment else None
                     ),
-                    iaq=float(payload.iaq) if payload.iaq is not None else None,
+                    iaq=_as_float(environment.iaq) if environment else None,
                 )
             )
 
-        return 200, history
+        return schema_list_response(NodeTelemetryHistorySchema, history)
+
+    def _telemetry_rollup_history(
+        self, node: Node, since_utc, until_utc, limit: int
+    ) -> List[NodeTelemetryHistorySchema]:
+        rollups = NodeTelemetryHourly.objects.filter(node=node)
+        if since_utc is not None:
+            rollups = rollups.filter(bucket__gte=since_utc)
+        if until_utc is not None:
+            rollups = rollups.filter(bucket__lte=until_utc)
+
+        return [
+            NodeTelemetryHistorySchema.from_trusted(
+                timestamp=rollup.bucket,
+                battery_level=(
+                    round(rollup.battery_level)
+                    if rollup.battery_level is not None
+                    else None
+                ),
+                voltage=rollup.voltage,
+                channel_utilization=rollup.channel_utilization,
+                air_util_tx=rollup.air_util_tx,
+                uptime_seconds=rollup.uptime_seconds,
+                temperature=rollup.temperature,
+                relative_humidity=rollup.relative_humidity,
+                barometric_pressure=rollup.barometric_pressure,
+                gas_resistance=rollup.gas_resistance,
+                iaq=rollup.iaq,
+            )
+            for rollup in reversed(list(rollups.order_by("-bucket")[:limit]))
+        ]
 
     @route.get(
         "/{node_id}/latency",
@@ -474,7 +572,7 @@ class NodeController:
         response_payload: List[NodeLatencyHistorySchema] = []
         for record in reversed(entries):
             response_payload.append(
-                NodeLatencyHistorySchema(
+                NodeLatencyHistorySchema.from_trusted(
                     timestamp=record.time,
                     probe_message_id=record.probe_message_id,
                     reachable=record.reachable,
@@ -483,7 +581,7 @@ class NodeController:
                 )
             )
 
-        return 200, response_payload
+        return schema_list_response(NodeLatencyHistorySchema, response_payload)
 
     @route.get(
         "/{node_id}/ports",
@@ -511,13 +609,10 @@ class NodeController:
         def build_port_map(queryset):
             port_map = {}
             for entry in queryset:
-                port_key, display_name = resolve_port_identity(
-                    entry["port"], entry["portnum"]
-                )
+                port_key, _ = resolve_port_identity(entry["port"], entry["portnum"])
                 port_map[port_key] = {
                     "count": entry["count"],
                     "last_seen": entry["last_seen"],
-                    "display": display_name,
                 }
             return port_map
 
@@ -530,12 +625,9 @@ class NodeController:
         for port_key in sorted(all_ports):
             sent_entry = sent_map.get(port_key)
             received_entry = received_map.get(port_key)
-            display_entry = sent_entry if sent_entry else received_entry
-            display_name = display_entry["display"] if display_entry else port_key
             results.append(
-                NodePortActivitySchema(
+                NodePortActivitySchema.from_trusted(
                     port=port_key,
-                    display_name=display_name,
                     sent_count=sent_entry["count"] if sent_entry else 0,
                     received_count=received_entry["count"] if received_entry else 0,
                     last_sent=sent_entry["last_seen"] if sent_entry else None,
@@ -634,7 +726,8 @@ class NodeController:
                 "packet",
                 "packet__from_node",
                 "packet__to_node",
-                "telemetry_payload",
+                "device_telemetry_payload",
+                "environment_telemetry_payload",
                 "position_payload",
                 "node_info_payload",
                 "neighbor_info_payload",
@@ -672,20 +765,17 @@ class NodeController:
             if packet is None:
                 continue
 
-            port_key, port_display = resolve_port_identity(
-                packet_data.port, packet_data.portnum
-            )
+            port_key, _ = resolve_port_identity(packet_data.port, packet_data.portnum)
 
             direction = "sent" if packet.from_node_id == node.pk else "received"
             payload_schema = build_packet_payload_schema(packet_data)
 
             results.append(
-                NodePortPacketSchema(
+                NodePortPacketSchema.from_trusted(
                     packet_id=packet.packet_id,
                     timestamp=packet_data.time,
                     direction=direction,
                     port=port_key,
-                    display_name=port_display,
                     portnum=packet_data.portnum,
                     from_node_id=getattr(packet.from_node, "node_id", None),
                     to_node_id=getattr(packet.to_node, "node_id", None),
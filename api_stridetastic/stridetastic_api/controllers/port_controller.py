@@ -10,6 +10,7 @@ from ninja_jwt.authentication import JWTAuth  # type: ignore[import]
 from ..models.packet_models import PacketData
 from ..schemas import MessageSchema, PortActivitySchema, PortNodeActivitySchema
 from ..utils.ports import resolve_port_identity
+from ..utils.response_cache import cache_response
 
 auth = JWTAuth()
 
@@ -17,6 +18,7 @@ auth = JWTAuth()
 @api_controller("/ports", tags=["Ports"], permissions=[permissions.IsAuthenticated])
 class PortController:
     @route.get("/activity", response={200: List[PortActivitySchema]}, auth=auth)
+    @cache_response("short")
     def get_port_activity(self):
         queryset = (
             PacketData.objects.filter(Q(port__isnull=False) | Q(portnum__isnull=False))
@@ -27,13 +29,10 @@ class PortController:
 
         results: List[PortActivitySchema] = []
         for entry in queryset:
-            canonical_port, display_name = resolve_port_identity(
-                entry["port"], entry["portnum"]
-            )
+            canonical_port, _ = resolve_port_identity(entry["port"], entry["portnum"])
             results.append(
-                PortActivitySchema(
+                PortActivitySchema.from_trusted(
                     port=canonical_port,
-                    display_name=display_name,
                     total_packets=entry["total_packets"],
                     last_seen=entry["last_seen"],
                 )
@@ -46,6 +45,7 @@ class PortController:
         response={200: List[PortNodeActivitySchema], 400: MessageSchema},
         auth=auth,
     )
+    @cache_response("short")
     def get_port_node_activity(self, port: str):
         raw_port = unquote(port).strip()
         if not raw_port:
@@ -102,7 +102,7 @@ class PortController:
             last_sent = entry["last_sent"]
 
             results.append(
-                PortNodeActivitySchema(
+                PortNodeActivitySchema.from_trusted(
                     node_id=node_id,
                     node_num=entry.get("packet__from_node__node_num"),
                     short_name=entry.get("packet__from_node__short_name"),
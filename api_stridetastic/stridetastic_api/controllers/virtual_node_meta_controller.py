@@ -1,3 +1,5 @@
+import orjson
+from django.http import HttpResponse
 from ninja_extra import permissions  # type: ignore[import]
 from ninja_extra import api_controller, route
 from ninja_jwt.authentication import JWTAuth  # type: ignore[import]
@@ -8,15 +10,23 @@ from ..schemas import (
     VirtualNodePrefillSchema,
 )
 from ..services.virtual_node_service import VirtualNodeService
+from ..utils.response_cache import cache_response
 
 auth = JWTAuth()
 
+# Derived from the Meshtastic protobuf enums, which are fixed for the process
+# lifetime, so the response body is encoded once at import.
+_VIRTUAL_NODE_OPTIONS_JSON: bytes = orjson.dumps(
+    VirtualNodeService.get_virtual_node_options()
+)
+
 
 @api_controller("/nodes", tags=["Nodes"], permissions=[permissions.IsAuthenticated])
 class VirtualNodeMetaController:
     @route.get("/virtual/options", response=VirtualNodeOptionsSchema, auth=auth)
+    @cache_response("long")
     def get_virtual_node_options(self):
-        return VirtualNodeService.get_virtual_node_options()
+        return HttpResponse(_VIRTUAL_NODE_OPTIONS_JSON, content_type="application/json")
 
     @route.get("/virtual/prefill", response=VirtualNodePrefillSchema, auth=auth)
     def get_virtual_node_prefill(self):
@@ -0,0 +1,69 @@
+"""In-process cache of Node primary keys keyed by Meshtastic node number.
+
+The same nodes show up in packet after packet, so ingest paths that only need
+a node's primary key resolve it here instead of querying by ``node_num`` every
+time. Entries are kept up to date by the Node signals in
+``signals/node_signals.py``; callers must still tolerate a stale key (e.g. a
+node deleted from another process) and fall back to the database.
+
+Only pk-only lookups use it (NeighborInfo's neighbour and last_sent_by
+resolution). The per-packet from/to/gateway resolution in ``on_message`` needs
+full instances that later handlers modify and save, and a hit there would
+still cost the same single indexed SELECT, so it keeps querying by node_num.
+"""
+
+import threading
+from typing import Optional
+
+MAX_CACHED_NODES = 16384
+
+_lock = threading.Lock()
+_pk_by_num: dict[int, int] = {}
+_num_by_pk: dict[int, int] = {}
+
+
+def get_node_pk(node_num: int) -> Optional[int]:
+    return _pk_by_num.get(node_num)
+
+
+def remember_node(node_num: int, node_pk: int) -> None:
+    with _lock:
+        previous_num = _num_by_pk.get(node_pk)
+        if previous_num is not None and previous_num != node_num:
+            _pk_by_num.pop(previous_num, None)
+        if node_num not in _pk_by_num and len(_pk_by_num) >= MAX_CACHED_NODES:
+            evicted_num = next(iter(_pk_by_num))
+            _num_by_pk.pop(_pk_by_num.pop(evicted_num), None)
+        _pk_by_num[node_num] = node_pk
+        _num_by_pk[node_pk] = node_num
+
+
+def forget_node(node_pk: int) -> None:
+    with _lock:
+        node_num = _num_by_pk.pop(node_pk, None)
+        if node_num is not None:
+            _pk_by_num.pop(node_num, None)
+
+
+def clear_node_cache() -> None:
+    with _lock:
+        _pk_by_num.clear()
+        _num_by_pk.clear()
+
+
+def warm_node_cache() -> int:
+    """Load the most recently seen nodes into the cache and return how many."""
+    from ..models import Node
+
+    rows = list(
+        Node.objects.order_by("-last_seen").values_list("node_num", "pk")[
+            :MAX_CACHED_NODES
+        ]
+    )
+    with _lock:
+        _pk_by_num.clear()
+        _num_by_pk.clear()
+        for node_num, node_pk in reversed(rows):
+            _pk_by_num[node_num] = node_pk
+            _num_by_pk[node_pk] = node_num
+    return len(rows)
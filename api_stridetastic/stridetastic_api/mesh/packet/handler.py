@@ -11,6 +11,8 @@ from meshtastic.protobuf import mesh_pb2, portnums_pb2, telemetry_pb2
 
 from ...models import Channel, Edge, Interface, Node, NodeLatencyHistory, NodeLink
 from ...models.packet_models import (
+    DeviceTelemetryPayload,
+    EnvironmentTelemetryPayload,
     NeighborInfoNeighbor,
     NeighborInfoPayload,
     NodeInfoPayload,
@@ -21,9 +23,9 @@ from ...models.packet_models import (
     RouteDiscoveryPayload,
     RouteDiscoveryRoute,
     RoutingPayload,
-    TelemetryPayload,
 )
 from ..encryption.aes import decrypt_packet
+from ..node_cache import get_node_pk, remember_node
 from ..utils import (
     error_reason_num_to_str,
     hw_num_to_model,
@@ -71,9 +73,38 @@ def _get_or_update_node(
             update_fields.append("mac_address")
         if update_fields:
             node.save(update_fields=update_fields)
+    remember_node(node.node_num, node.pk)
     return node
 
 
+def _touch_node(node_num: int) -> int:
+    """Mark the node as seen and return its primary key, creating it if needed.
+
+    Uses the node cache so known nodes cost a single UPDATE instead of a
+    lookup followed by a full save. The shortcut only applies while the row
+    already carries the identity _get_or_update_node would write; otherwise
+    (or for a stale cache entry) the full path runs, so the backfill and
+    Node.save() still happen. last_seen is the only column skipped, and
+    nothing Node.save() derives depends on it.
+    """
+    node_id = num_to_id(node_num)
+    mac_address = num_to_mac(node_num).upper()
+    node_pk = get_node_pk(node_num)
+    if node_pk is not None:
+        touched = Node.objects.filter(
+            pk=node_pk, node_id=node_id, mac_address=mac_address
+        ).update(last_seen=timezone.now())
+        if touched:
+            return node_pk
+    node = _get_or_update_node(
+        node_num=node_num,
+        node_id=node_id,
+        mac_address=mac_address,
+    )
+    node.update_last_seen()
+    return node.pk
+
+
 def _decimal_from(
     value: Optional[float | int], *, places: Optional[int] = None
 ) -> Optional[Decimal]:
@@ -313,19 +344,12 @@ def handle_neighborinfo(payload: bytes, packet_data: PacketData) -> None:
     if reporting_node:
         reporting_node.update_last_seen()
 
-    last_sent_by_node: Optional[Node] = None
+    last_sent_by_node_pk: Optional[int] = None
     last_sent_by_node_num: Optional[int] = None
     if neighbor_info.last_sent_by_id:
         last_sent_by_node_num = neighbor_info.last_sent_by_id
         try:
-            last_sent_by_node_id = num_to_id(last_sent_by_node_num)
-            mac_address = num_to_mac(last_sent_by_node_num)
-            last_sent_by_node = _get_or_update_node(
-                node_num=last_sent_by_node_num,
-                node_id=last_sent_by_node_id,
-                mac_address=mac_address,
-            )
-            last_sent_by_node.update_last_seen()
+            last_sent_by_node_pk = _touch_node(last_sent_by_node_num)
         except ValueError:
             logging.debug(
                 f"[NeighborInfo] Invalid last_sent_by_id {neighbor_info.last_sent_by_id}"
@@ -336,7 +360,7 @@ def handle_neighborinfo(payload: bytes, packet_data: PacketData) -> None:
     )
     neighbor_payload.reporting_node = reporting_node
     neighbor_payload.reporting_node_id_text = reporting_node_id
-    neighbor_payload.last_sent_by_node = last_sent_by_node
+    neighbor_payload.last_sent_by_node_id = last_sent_by_node_pk
     neighbor_payload.last_sent_by_node_num = last_sent_by_node_num
     neighbor_payload.node_broadcast_interval_secs = (
         neighbor_info.node_broadcast_interval_secs
@@ -351,7 +375,7 @@ def handle_neighborinfo(payload: bytes, packet_data: PacketData) -> None:
     interfaces = list(packet_obj.interfaces.all()) if packet_obj else []
 
     for advertised in neighbor_info.neighbors:
-        neighbor_node: Optional[Node] = None
+        neighbor_node_pk: Optional[int] = None
         neighbor_node_num: Optional[int] = advertised.node_id or None
         neighbor_node_id: Optional[str] = None
         if neighbor_node_num is not None:
@@ -362,12 +386,7 @@ def handle_neighborinfo(payload: bytes, packet_data: PacketData) -> None:
 
         if neighbor_node_num is not None:
             try:
-                mac_address = num_to_mac(neighbor_node_num)
-                neighbor_node = _get_or_update_node(
-                    node_num=neighbor_node_num,
-                    node_id=neighbor_node_id,
-                    mac_address=mac_address,
-                )
+                neighbor_node_pk = _touch_node(neighbor_node_num)
             except ValueError:
                 logging.debug(
                     f"[NeighborInfo] Invalid neighbor node num {neighbor_node_num}"
@@ -375,9 +394,6 @@ def handle_neighborinfo(payload: bytes, packet_data: PacketData) -> None:
                 neighbor_node_id = None
                 neighbor_node_num = None
 
-        if neighbor_node:
-            neighbor_node.update_last_seen()
-
         snr_value = _decimal_from(advertised.snr, places=2)
         last_rx_time_raw = advertised.last_rx_time if advertised.last_rx_time else None
         last_rx_time_dt = _epoch_to_datetime(last_rx_time_raw)
@@ -389,7 +405,7 @@ def handle_neighborinfo(payload: bytes, packet_data: PacketData) -> None:
 
         NeighborInfoNeighbor.objects.create(
             payload=neighbor_payload,
-            node=neighbor_node,
+            node_id=neighbor_node_pk,
             advertised_node_id=neighbor_node_id,
             advertised_node_num=neighbor_node_num,
             snr=snr_value,
@@ -398,10 +414,10 @@ def handle_neighborinfo(payload: bytes, packet_data: PacketData) -> None:
             node_broadcast_interval_secs=broadcast_interval,
         )
 
-        if reporting_node and neighbor_node:
+        if reporting_node and neighbor_node_pk is not None:
             link_edge, _ = Edge.objects.get_or_create(
                 source_node=reporting_node,
-                target_node=neighbor_node,
+                target_node_id=neighbor_node_pk,
             )
             if packet_obj:
                 link_edge.last_packet = packet_obj  # type: ignore[assignment]
@@ -493,7 +509,7 @@ def handle_telemetry(payload: bytes, packet_data: PacketData) -> None:
             logging.info(
                 f"[Telemetry] device_metrics: battery_level={device_metrics.battery_level}, voltage={voltage}, channel_utilization={channel_utilization}, air_util_tx={air_util_tx}, uptime_seconds={device_metrics.uptime_seconds}"
             )
-            telemetry_payload, _ = TelemetryPayload.objects.get_or_create(
+            telemetry_payload, _ = DeviceTelemetryPayload.objects.get_or_create(
                 packet_data=packet_data,
             )
             telemetry_payload.battery_level = (
@@ -547,7 +563,7 @@ def handle_telemetry(payload: bytes, packet_data: PacketData) -> None:
             logging.info(
                 f"[Telemetry] environment_metrics: temperature={temperature}, relative_humidity={relative_humidity}, barometric_pressure={barometric_pressure}, gas_resistance={gas_resistance}, iaq={iaq}"
             )
-            telemetry_payload, _ = TelemetryPayload.objects.get_or_create(
+            telemetry_payload, _ = EnvironmentTelemetryPayload.objects.get_or_create(
                 packet_data=packet_data,
             )
             telemetry_payload.temperature = temperature
@@ -1214,7 +1230,6 @@ def on_message(client, userdata, normalized, iface="MQTT"):
     )
     from_node.update_last_seen()
     from_node.interfaces.add(interface)
-    from_node.save()
     if gateway_node_id is not None:
         gateway_node = _get_or_update_node(
             node_num=gateway_node_num,
@@ -1223,7 +1238,6 @@ def on_message(client, userdata, normalized, iface="MQTT"):
         )
         gateway_node.update_last_seen()
         gateway_node.interfaces.add(interface)
-        gateway_node.save()
     logging.info(f"[Packet] To node: {to_node_num} ({to_node_id}, {to_node_mac})")
     to_node = _get_or_update_node(
         node_num=to_node_num,
@@ -1268,7 +1282,7 @@ def on_message(client, userdata, normalized, iface="MQTT"):
     _set_field("pki_encrypted", pki_encrypted)
     _set_field("public_key", public_key)
 
-    packet_obj.channels.add(channel)
+    packet_obj.channel = channel
     packet_obj.gateway_nodes.add(gateway_node) if gateway_node_id else None
     packet_obj.save()
 
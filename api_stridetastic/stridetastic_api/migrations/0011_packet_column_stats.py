@@ -0,0 +1,83 @@
+# Sparse min/max column statistics for compressed TimescaleDB chunks.
+#
+# Chunk skipping (``enable_chunk_skipping``, TimescaleDB >= 2.16; called
+# ``enable_column_stats`` in pre-release builds) lets the planner skip
+# compressed chunks for predicates on non-partitioning columns. The call is a
+# no-op unless the database runs TimescaleDB, exposes one of the functions and
+# the target table has been converted into a hypertable, so plain PostgreSQL
+# and SQLite deployments are unaffected. No migration in this tree creates
+# hypertables, so for now this does nothing until Packet becomes one.
+
+from django.db import migrations
+
+COLUMN_STATS = (
+    ("stridetastic_api_packet", "packet_id"),
+    ("stridetastic_api_packet", "rx_time"),
+    ("stridetastic_api_packet", "hop_limit"),
+    ("stridetastic_api_packetdata", "portnum"),
+)
+
+
+def _timescale_function_available(cursor, function_name):
+    cursor.execute(
+        "SELECT 1 FROM pg_proc WHERE proname = %s LIMIT 1",
+        [function_name],
+    )
+    return cursor.fetchone() is not None
+
+
+def _is_hypertable(cursor, table_name):
+    cursor.execute(
+        "SELECT 1 FROM timescaledb_information.hypertables "
+        "WHERE hypertable_name = %s LIMIT 1",
+        [table_name],
+    )
+    return cursor.fetchone() is not None
+
+
+# (function, guard keyword) pairs, released name first.
+ENABLE_FUNCTIONS = (
+    ("enable_chunk_skipping", "if_not_exists"),
+    ("enable_column_stats", "if_not_exists"),
+)
+DISABLE_FUNCTIONS = (
+    ("disable_chunk_skipping", "if_not_exists"),
+    ("disable_column_stats", "if_exists"),
+)
+
+
+def _apply_column_stats(schema_editor, candidates):
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        for function_name, guard_argument in candidates:
+            if _timescale_function_available(cursor, function_name):
+                break
+        else:
+            return
+        for table_name, column_name in COLUMN_STATS:
+            if not _is_hypertable(cursor, table_name):
+                continue
+            cursor.execute(
+                f"SELECT {function_name}(%s::regclass, %s, {guard_argument} => true)",
+                [table_name, column_name],
+            )
+
+
+def enable_column_stats(apps, schema_editor):
+    _apply_column_stats(schema_editor, ENABLE_FUNCTIONS)
+
+
+def disable_column_stats(apps, schema_editor):
+    _apply_column_stats(schema_editor, DISABLE_FUNCTIONS)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stridetastic_api", "0010_rename_interface_name_to_type"),
+    ]
+
+    operations = [
+        migrations.RunPython(enable_column_stats, disable_column_stats),
+    ]
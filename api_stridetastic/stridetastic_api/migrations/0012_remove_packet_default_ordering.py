@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stridetastic_api", "0011_packet_column_stats"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="packet",
+            options={"verbose_name": "Packet", "verbose_name_plural": "Packets"},
+        ),
+        migrations.AlterModelOptions(
+            name="packetdata",
+            options={
+                "verbose_name": "Packet Data",
+                "verbose_name_plural": "Packets Data",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="routediscoverypayload",
+            options={
+                "verbose_name": "Route Discovery Payload",
+                "verbose_name_plural": "Route Discovery Payloads",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="routediscoveryroute",
+            options={
+                "verbose_name": "Route Discovery Route",
+                "verbose_name_plural": "Route Discovery Routes",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="routingpayload",
+            options={
+                "verbose_name": "Routing Payload",
+                "verbose_name_plural": "Routing Payloads",
+            },
+        ),
+    ]
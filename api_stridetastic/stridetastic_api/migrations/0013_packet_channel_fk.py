@@ -0,0 +1,88 @@
+# Replace the Packet.channels many-to-many relation with a single channel FK.
+#
+# Meshtastic packets travel on exactly one channel, so the through table only
+# adds a join on every packet-by-channel lookup. The FK is added alongside the
+# legacy relation, back-filled from the through table (picking the first
+# association when several exist) and the through table is dropped in 0014.
+
+import logging
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_packet_channel(apps, schema_editor):
+    Packet = apps.get_model("stridetastic_api", "Packet")
+    through = Packet.channels.through
+
+    anomalies = (
+        through.objects.values("packet_id")
+        .annotate(channel_count=Count("channel_id"))
+        .filter(channel_count__gt=1)
+        .count()
+    )
+    if anomalies:
+        logger.warning(
+            "Packet channel back-fill: %d packets were linked to more than one "
+            "channel; keeping the first association for each.",
+            anomalies,
+        )
+
+    first_channel = (
+        through.objects.filter(packet_id=OuterRef("pk"))
+        .order_by("id")
+        .values("channel_id")[:1]
+    )
+    Packet.objects.filter(channel__isnull=True).update(
+        channel_id=Subquery(first_channel)
+    )
+
+
+def restore_packet_channels(apps, schema_editor):
+    Packet = apps.get_model("stridetastic_api", "Packet")
+    through = Packet.channels.through
+
+    through.objects.bulk_create(
+        [
+            through(packet_id=packet_id, channel_id=channel_id)
+            for packet_id, channel_id in Packet.objects.filter(
+                channel__isnull=False
+            ).values_list("pk", "channel_id")
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stridetastic_api", "0012_remove_packet_default_ordering"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="packet",
+            name="channels",
+            field=models.ManyToManyField(
+                help_text="The channels through which the packet was sent.",
+                related_name="legacy_packets",
+                to="stridetastic_api.channel",
+            ),
+        ),
+        migrations.AddField(
+            model_name="packet",
+            name="channel",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="The channel through which the packet was sent.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="packets",
+                to="stridetastic_api.channel",
+            ),
+        ),
+        migrations.RunPython(backfill_packet_channel, restore_packet_channels),
+    ]
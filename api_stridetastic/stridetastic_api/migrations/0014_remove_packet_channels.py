@@ -0,0 +1,14 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stridetastic_api", "0013_packet_channel_fk"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="packet",
+            name="channels",
+        ),
+    ]
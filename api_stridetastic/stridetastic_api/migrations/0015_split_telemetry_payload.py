@@ -0,0 +1,284 @@
+# Split TelemetryPayload into device and environment telemetry tables.
+#
+# Device and environment metrics almost never arrive in the same packet, so the
+# combined table is mostly NULL columns. Existing rows are copied into the
+# narrow table(s) matching the columns they populate before the old table is
+# dropped.
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+DEVICE_FIELDS = (
+    "battery_level",
+    "voltage",
+    "channel_utilization",
+    "air_util_tx",
+    "uptime_seconds",
+)
+ENVIRONMENT_FIELDS = (
+    "temperature",
+    "relative_humidity",
+    "barometric_pressure",
+    "gas_resistance",
+    "iaq",
+)
+BATCH_SIZE = 1000
+
+
+def _has_any(fields):
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f"{field}__isnull": False})
+    return condition
+
+
+def _copy_rows(source_qs, target_model, fields):
+    batch = []
+    for row in source_qs.values("packet_data_id", *fields).iterator(
+        chunk_size=BATCH_SIZE
+    ):
+        batch.append(target_model(**row))
+        if len(batch) >= BATCH_SIZE:
+            target_model.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        target_model.objects.bulk_create(batch)
+
+
+def _source_time(source_model):
+    return Subquery(
+        source_model.objects.filter(packet_data_id=OuterRef("packet_data_id")).values(
+            "time"
+        )[:1]
+    )
+
+
+def split_telemetry_rows(apps, schema_editor):
+    TelemetryPayload = apps.get_model("stridetastic_api", "TelemetryPayload")
+    DeviceTelemetryPayload = apps.get_model(
+        "stridetastic_api", "DeviceTelemetryPayload"
+    )
+    EnvironmentTelemetryPayload = apps.get_model(
+        "stridetastic_api", "EnvironmentTelemetryPayload"
+    )
+
+    _copy_rows(
+        TelemetryPayload.objects.filter(_has_any(DEVICE_FIELDS)),
+        DeviceTelemetryPayload,
+        DEVICE_FIELDS,
+    )
+    _copy_rows(
+        TelemetryPayload.objects.filter(_has_any(ENVIRONMENT_FIELDS)),
+        EnvironmentTelemetryPayload,
+        ENVIRONMENT_FIELDS,
+    )
+    # ``time`` is auto_now_add, so restore the original receive timestamps.
+    DeviceTelemetryPayload.objects.update(time=_source_time(TelemetryPayload))
+    EnvironmentTelemetryPayload.objects.update(time=_source_time(TelemetryPayload))
+
+
+def merge_telemetry_rows(apps, schema_editor):
+    TelemetryPayload = apps.get_model("stridetastic_api", "TelemetryPayload")
+    DeviceTelemetryPayload = apps.get_model(
+        "stridetastic_api", "DeviceTelemetryPayload"
+    )
+    EnvironmentTelemetryPayload = apps.get_model(
+        "stridetastic_api", "EnvironmentTelemetryPayload"
+    )
+
+    _copy_rows(DeviceTelemetryPayload.objects.all(), TelemetryPayload, DEVICE_FIELDS)
+    for row in EnvironmentTelemetryPayload.objects.values(
+        "packet_data_id", *ENVIRONMENT_FIELDS
+    ).iterator(chunk_size=BATCH_SIZE):
+        packet_data_id = row.pop("packet_data_id")
+        updated = TelemetryPayload.objects.filter(packet_data_id=packet_data_id).update(
+            **row
+        )
+        if not updated:
+            TelemetryPayload.objects.create(packet_data_id=packet_data_id, **row)
+    TelemetryPayload.objects.update(
+        time=Coalesce(
+            _source_time(DeviceTelemetryPayload),
+            _source_time(EnvironmentTelemetryPayload),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stridetastic_api", "0014_remove_packet_channels"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeviceTelemetryPayload",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "time",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Timestamp when the telemetry payload was received.",
+                    ),
+                ),
+                (
+                    "battery_level",
+                    models.IntegerField(
+                        blank=True,
+                        help_text="Battery level of the device in percentage.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "voltage",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Voltage of the device in volts.",
+                        max_digits=5,
+                        null=True,
+                    ),
+                ),
+                (
+                    "channel_utilization",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Channel utilization of the device in percentage.",
+                        max_digits=5,
+                        null=True,
+                    ),
+                ),
+                (
+                    "air_util_tx",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Air utilization for transmission of the device in percentage.",
+                        max_digits=5,
+                        null=True,
+                    ),
+                ),
+                (
+                    "uptime_seconds",
+                    models.IntegerField(
+                        blank=True,
+                        help_text="Uptime of the device in seconds.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "packet_data",
+                    models.OneToOneField(
+                        help_text="The packet data to which this device telemetry payload belongs. This field is required and must be unique.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="device_telemetry_payload",
+                        to="stridetastic_api.packetdata",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Device Telemetry Payload",
+                "verbose_name_plural": "Device Telemetry Payloads",
+            },
+        ),
+        migrations.CreateModel(
+            name="EnvironmentTelemetryPayload",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "time",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Timestamp when the telemetry payload was received.",
+                    ),
+                ),
+                (
+                    "temperature",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Temperature in degrees Celsius.",
+                        max_digits=5,
+                        null=True,
+                    ),
+                ),
+                (
+                    "relative_humidity",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Relative humidity in percentage.",
+                        max_digits=5,
+                        null=True,
+                    ),
+                ),
+                (
+                    "barometric_pressure",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Barometric pressure in hPa.",
+                        max_digits=7,
+                        null=True,
+                    ),
+                ),
+                (
+                    "gas_resistance",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Gas resistance in ohms.",
+                        max_digits=7,
+                        null=True,
+                    ),
+                ),
+                (
+                    "iaq",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Indoor Air Quality (IAQ) index.",
+                        max_digits=5,
+                        null=True,
+                    ),
+                ),
+                (
+                    "packet_data",
+                    models.OneToOneField(
+                        help_text="The packet data to which this environment telemetry payload belongs. This field is required and must be unique.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="environment_telemetry_payload",
+                        to="stridetastic_api.packetdata",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Environment Telemetry Payload",
+                "verbose_name_plural": "Environment Telemetry Payloads",
+            },
+        ),
+        migrations.RunPython(split_telemetry_rows, merge_telemetry_rows),
+        migrations.DeleteModel(
+            name="TelemetryPayload",
+        ),
+    ]
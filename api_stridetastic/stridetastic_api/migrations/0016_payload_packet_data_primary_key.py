@@ -0,0 +1,224 @@
+# Make the PacketData OneToOne the primary key of every payload table.
+#
+# Payload rows are strictly 1:1 with PacketData, so the surrogate ``id`` column
+# only adds a second unique index per table. Foreign keys pointing at
+# NeighborInfoPayload and RouteDiscoveryPayload are detached from the database
+# constraint, remapped from the old ``id`` to ``packet_data_id`` and then
+# re-attached once the new primary keys exist.
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+# (model, field, target model) for every FK that references a payload table.
+INBOUND_PAYLOAD_FKS = (
+    ("NeighborInfoNeighbor", "payload", "NeighborInfoPayload"),
+    ("RoutingPayload", "route_request", "RouteDiscoveryPayload"),
+    ("RoutingPayload", "route_reply", "RouteDiscoveryPayload"),
+)
+
+
+def _remap(apps, schema_editor, source_key, target_key):
+    for model_name, field_name, target_name in INBOUND_PAYLOAD_FKS:
+        model = apps.get_model("stridetastic_api", model_name)
+        target = apps.get_model("stridetastic_api", target_name)
+        column = f"{field_name}_id"
+        model.objects.filter(**{f"{column}__isnull": False}).update(
+            **{
+                column: Subquery(
+                    target.objects.filter(**{source_key: OuterRef(column)}).values(
+                        target_key
+                    )[:1]
+                )
+            }
+        )
+    if schema_editor.connection.vendor == "postgresql":
+        # Flush deferred FK checks so the following ALTER TABLEs can run.
+        schema_editor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+
+def remap_to_packet_data(apps, schema_editor):
+    _remap(apps, schema_editor, "id", "packet_data_id")
+
+
+def remap_to_surrogate_id(apps, schema_editor):
+    _remap(apps, schema_editor, "packet_data_id", "id")
+
+
+def _neighbor_payload_field(db_constraint=True):
+    return models.ForeignKey(
+        db_constraint=db_constraint,
+        help_text="Parent Neighbor Info payload that reported this neighbor.",
+        on_delete=django.db.models.deletion.CASCADE,
+        related_name="neighbors",
+        to="stridetastic_api.neighborinfopayload",
+    )
+
+
+def _route_request_field(db_constraint=True):
+    return models.OneToOneField(
+        blank=True,
+        db_constraint=db_constraint,
+        help_text="The route discovery payload associated with the route request. This field is required and must be unique.",
+        null=True,
+        on_delete=django.db.models.deletion.CASCADE,
+        related_name="route_request",
+        to="stridetastic_api.routediscoverypayload",
+    )
+
+
+def _route_reply_field(db_constraint=True):
+    return models.OneToOneField(
+        blank=True,
+        db_constraint=db_constraint,
+        help_text="The route discovery payload associated with the route reply. This field is optional and can be used to store additional information about the route reply.",
+        null=True,
+        on_delete=django.db.models.deletion.CASCADE,
+        related_name="route_reply",
+        to="stridetastic_api.routediscoverypayload",
+    )
+
+
+def _inbound_fk_operations(db_constraint):
+    return [
+        migrations.AlterField(
+            model_name="neighborinfoneighbor",
+            name="payload",
+            field=_neighbor_payload_field(db_constraint),
+        ),
+        migrations.AlterField(
+            model_name="routingpayload",
+            name="route_request",
+            field=_route_request_field(db_constraint),
+        ),
+        migrations.AlterField(
+            model_name="routingpayload",
+            name="route_reply",
+            field=_route_reply_field(db_constraint),
+        ),
+    ]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stridetastic_api", "0015_split_telemetry_payload"),
+    ]
+
+    operations = [
+        *_inbound_fk_operations(db_constraint=False),
+        migrations.RunPython(remap_to_packet_data, remap_to_surrogate_id),
+        migrations.RemoveField(
+            model_name="devicetelemetrypayload",
+            name="id",
+        ),
+        migrations.RemoveField(
+            model_name="environmenttelemetrypayload",
+            name="id",
+        ),
+        migrations.RemoveField(
+            model_name="neighborinfopayload",
+            name="id",
+        ),
+        migrations.RemoveField(
+            model_name="nodeinfopayload",
+            name="id",
+        ),
+        migrations.RemoveField(
+            model_name="positionpayload",
+            name="id",
+        ),
+        migrations.RemoveField(
+            model_name="routediscoverypayload",
+            name="id",
+        ),
+        migrations.RemoveField(
+            model_name="routingpayload",
+            name="id",
+        ),
+        migrations.AlterField(
+            model_name="devicetelemetrypayload",
+            name="packet_data",
+            field=models.OneToOneField(
+                help_text="The packet data to which this device telemetry payload belongs. This field is required and must be unique.",
+                on_delete=django.db.models.deletion.CASCADE,
+                primary_key=True,
+                related_name="device_telemetry_payload",
+                serialize=False,
+                to="stridetastic_api.packetdata",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="environmenttelemetrypayload",
+            name="packet_data",
+            field=models.OneToOneField(
+                help_text="The packet data to which this environment telemetry payload belongs. This field is required and must be unique.",
+                on_delete=django.db.models.deletion.CASCADE,
+                primary_key=True,
+                related_name="environment_telemetry_payload",
+                serialize=False,
+                to="stridetastic_api.packetdata",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="neighborinfopayload",
+            name="packet_data",
+            field=models.OneToOneField(
+                help_text="The packet data to which this Neighbor Info payload belongs. This field is required and must be unique.",
+                on_delete=django.db.models.deletion.CASCADE,
+                primary_key=True,
+                related_name="neighbor_info_payload",
+                serialize=False,
+                to="stridetastic_api.packetdata",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="nodeinfopayload",
+            name="packet_data",
+            field=models.OneToOneField(
+                help_text="The packet data to which this Node Info payload belongs. This field is required and must be unique.",
+                on_delete=django.db.models.deletion.CASCADE,
+                primary_key=True,
+                related_name="node_info_payload",
+                serialize=False,
+                to="stridetastic_api.packetdata",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="positionpayload",
+            name="packet_data",
+            field=models.OneToOneField(
+                help_text="The packet data to which this Position payload belongs. This field is required and must be unique.",
+                on_delete=django.db.models.deletion.CASCADE,
+                primary_key=True,
+                related_name="position_payload",
+                serialize=False,
+                to="stridetastic_api.packetdata",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="routediscoverypayload",
+            name="packet_data",
+            field=models.OneToOneField(
+                help_text="The packet data to which this Route Discovery payload belongs. This field is required and must be unique.",
+                on_delete=django.db.models.deletion.CASCADE,
+                primary_key=True,
+                related_name="route_discovery_payload",
+                serialize=False,
+                to="stridetastic_api.packetdata",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="routingpayload",
+            name="packet_data",
+            field=models.OneToOneField(
+                help_text="The packet data to which this Routing payload belongs. This field is required and must be unique.",
+                on_delete=django.db.models.deletion.CASCADE,
+                primary_key=True,
+                related_name="routing_payload",
+                serialize=False,
+                to="stridetastic_api.packetdata",
+            ),
+        ),
+        *_inbound_fk_operations(db_constraint=True),
+    ]
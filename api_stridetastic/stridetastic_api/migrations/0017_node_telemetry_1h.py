@@ -0,0 +1,177 @@
+# Hourly per-node telemetry rollup backing NodeTelemetryHourly.
+#
+# Telemetry history queries used to scan every raw device/environment payload
+# for a node. ``node_telemetry_1h`` pre-aggregates them into one row per node
+# and hour. It is a plain table keyed by (node, bucket) rather than a
+# materialized view (the packet tables are not hypertables, so a TimescaleDB
+# continuous aggregate cannot be defined on them, and refreshing a view would
+# re-aggregate the whole history every time). The
+# ``refresh_node_telemetry_rollups`` Celery task upserts only recent buckets;
+# this migration backfills the history that already exists.
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL_SQL = """
+INSERT INTO node_telemetry_1h (
+    node_id, bucket, battery_level, voltage, channel_utilization, air_util_tx,
+    uptime_seconds, temperature, relative_humidity, barometric_pressure,
+    gas_resistance, iaq, sample_count
+)
+SELECT
+    packet.from_node_id,
+    date_trunc('hour', COALESCE(device.time, environment.time)),
+    avg(device.battery_level),
+    avg(device.voltage),
+    avg(device.channel_utilization),
+    avg(device.air_util_tx),
+    max(device.uptime_seconds),
+    avg(environment.temperature),
+    avg(environment.relative_humidity),
+    avg(environment.barometric_pressure),
+    avg(environment.gas_resistance),
+    avg(environment.iaq),
+    count(*)
+FROM stridetastic_api_packetdata packet_data
+JOIN stridetastic_api_packet packet ON packet.id = packet_data.packet_id
+LEFT JOIN stridetastic_api_devicetelemetrypayload device
+    ON device.packet_data_id = packet_data.id
+LEFT JOIN stridetastic_api_environmenttelemetrypayload environment
+    ON environment.packet_data_id = packet_data.id
+WHERE packet.from_node_id IS NOT NULL
+    AND (
+        device.packet_data_id IS NOT NULL
+        OR environment.packet_data_id IS NOT NULL
+    )
+GROUP BY 1, 2
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stridetastic_api", "0016_payload_packet_data_primary_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NodeTelemetryHourly",
+            fields=[
+                (
+                    "pk",
+                    models.CompositePrimaryKey(
+                        "node",
+                        "bucket",
+                        blank=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "node",
+                    models.ForeignKey(
+                        help_text="The node that reported the telemetry.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="stridetastic_api.node",
+                    ),
+                ),
+                (
+                    "bucket",
+                    models.DateTimeField(help_text="Start of the hourly bucket."),
+                ),
+                (
+                    "battery_level",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Average battery level percentage.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "voltage",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Average battery voltage in volts.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "channel_utilization",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Average channel utilisation percentage.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "air_util_tx",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Average transmit air utilisation percentage.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "uptime_seconds",
+                    models.IntegerField(
+                        blank=True,
+                        help_text="Highest uptime reported in the bucket.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "temperature",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Average temperature in degrees Celsius.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "relative_humidity",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Average relative humidity percentage.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "barometric_pressure",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Average barometric pressure in hPa.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "gas_resistance",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Average gas resistance in ohms.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "iaq",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Average Indoor Air Quality index.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "sample_count",
+                    models.PositiveIntegerField(
+                        help_text="Number of telemetry packets aggregated into the bucket."
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Node Telemetry (Hourly)",
+                "verbose_name_plural": "Node Telemetry (Hourly)",
+                "db_table": "node_telemetry_1h",
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,113 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:52
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stridetastic_api", "0017_node_telemetry_1h"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="devicetelemetrypayload",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the telemetry payload was received.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="environmenttelemetrypayload",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the telemetry payload was received.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="neighborinfoneighbor",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the neighbor entry was processed.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="neighborinfopayload",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the neighbor info payload was received.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="nodeinfopayload",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the node info payload was received.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="packet",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the packet was received.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="packetdata",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the packet data was received.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="positionpayload",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the position payload was received.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="routediscoverypayload",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the route discovery payload was received.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="routediscoveryroute",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the route discovery payload was received.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="routingpayload",
+            name="time",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(),
+                editable=False,
+                help_text="Timestamp when the route discovery payload was received.",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stridetastic_api", "0018_packet_time_db_default"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="packet",
+            index=models.Index(
+                condition=models.Q(
+                    ("want_ack", True), models.Q(("ackd", True), _negated=True)
+                ),
+                fields=["from_node", "-time"],
+                name="pkt_pending_ack",
+            ),
+        ),
+    ]
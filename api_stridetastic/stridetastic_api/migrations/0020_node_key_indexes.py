@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 00:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stridetastic_api", "0019_packet_pending_ack_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="node",
+            index=models.Index(
+                condition=models.Q(("public_key__gt", "")),
+                fields=["public_key"],
+                name="node_public_key",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="node",
+            index=models.Index(
+                condition=models.Q(("private_key__gt", "")),
+                fields=["private_key"],
+                name="node_private_key",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 01:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stridetastic_api", "0020_node_key_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="devicetelemetrypayload",
+            index=models.Index(fields=["time"], name="dev_telemetry_time"),
+        ),
+        migrations.AddIndex(
+            model_name="environmenttelemetrypayload",
+            index=models.Index(fields=["time"], name="env_telemetry_time"),
+        ),
+    ]
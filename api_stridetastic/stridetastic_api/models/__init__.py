@@ -11,7 +11,7 @@ from .graph_models import Edge
 from .interface_models import Interface
 from .keepalive_models import KeepaliveConfig, NodePresenceHistory
 from .link_models import NodeLink
-from .metrics_models import NetworkOverviewSnapshot
+from .metrics_models import NetworkOverviewSnapshot, NodeTelemetryHourly
 from .node_models import Node, NodeLatencyHistory
 from .packet_models import NeighborInfoNeighbor, NeighborInfoPayload, Packet
 from .publisher_models import (
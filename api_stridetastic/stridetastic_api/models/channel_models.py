@@ -47,8 +47,7 @@ class Channel(models.Model):
         Returns statistics for the channel.
         This method should be implemented to return relevant statistics.
         """
-        packets = self.packets.all()
-        total_messages = packets.count()
+        total_messages = self.packets.count()
         has_broadcast = 1 if self.members.filter(node_id="!ffffffff").exists() else 0
         members_count = self.members.count() - has_broadcast
 
@@ -50,3 +50,60 @@ class NetworkOverviewSnapshot(TimescaleModel):
         verbose_name = "Network Overview Snapshot"
         verbose_name_plural = "Network Overview Snapshots"
         ordering = ["time"]
+
+
+class NodeTelemetryHourly(models.Model):
+    """Hourly telemetry rollup per node, stored in the ``node_telemetry_1h`` table.
+
+    The table is created and backfilled by migration 0017. The
+    ``refresh_node_telemetry_rollups`` Celery task then re-aggregates only the
+    recent buckets, so history queries read one row per node and hour instead
+    of every raw telemetry packet.
+    """
+
+    pk = models.CompositePrimaryKey("node", "bucket")
+    node = models.ForeignKey(
+        "Node",
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="The node that reported the telemetry.",
+    )
+    bucket = models.DateTimeField(help_text="Start of the hourly bucket.")
+    battery_level = models.FloatField(
+        blank=True, null=True, help_text="Average battery level percentage."
+    )
+    voltage = models.FloatField(
+        blank=True, null=True, help_text="Average battery voltage in volts."
+    )
+    channel_utilization = models.FloatField(
+        blank=True, null=True, help_text="Average channel utilisation percentage."
+    )
+    air_util_tx = models.FloatField(
+        blank=True, null=True, help_text="Average transmit air utilisation percentage."
+    )
+    uptime_seconds = models.IntegerField(
+        blank=True, null=True, help_text="Highest uptime reported in the bucket."
+    )
+    temperature = models.FloatField(
+        blank=True, null=True, help_text="Average temperature in degrees Celsius."
+    )
+    relative_humidity = models.FloatField(
+        blank=True, null=True, help_text="Average relative humidity percentage."
+    )
+    barometric_pressure = models.FloatField(
+        blank=True, null=True, help_text="Average barometric pressure in hPa."
+    )
+    gas_resistance = models.FloatField(
+        blank=True, null=True, help_text="Average gas resistance in ohms."
+    )
+    iaq = models.FloatField(
+        blank=True, null=True, help_text="Average Indoor Air Quality index."
+    )
+    sample_count = models.PositiveIntegerField(
+        help_text="Number of telemetry packets aggregated into the bucket."
+    )
+
+    class Meta:
+        db_table = "node_telemetry_1h"
+        verbose_name = "Node Telemetry (Hourly)"
+        verbose_name_plural = "Node Telemetry (Hourly)"
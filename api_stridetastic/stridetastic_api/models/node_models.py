@@ -209,13 +209,41 @@ class Node(models.Model):
         verbose_name = "Node"
         verbose_name_plural = "Nodes"
         ordering = ["last_seen", "first_seen"]
+        indexes = [
+            # Key-reuse checks for virtual nodes; most rows have no key, so
+            # only populated values are indexed.
+            models.Index(
+                fields=("public_key",),
+                name="node_public_key",
+                condition=models.Q(public_key__gt=""),
+            ),
+            models.Index(
+                fields=("private_key",),
+                name="node_private_key",
+                condition=models.Q(private_key__gt=""),
+            ),
+        ]
 
     def __str__(self):
         return self.node_id
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored key so full saves can tell whether it changed.
+        instance._loaded_public_key = instance.__dict__.get("public_key")
+        return instance
+
+    @property
+    def public_key_changed(self) -> bool:
+        """Whether public_key differs from the value last loaded or saved."""
+        if "public_key" not in self.__dict__:
+            return False
+        return self.public_key != getattr(self, "_loaded_public_key", None)
+
     def update_last_seen(self):
         self.last_seen = timezone.now()
-        self.save()
+        self.save(update_fields=["last_seen"])
 
     @property
     def has_private_key(self) -> bool:
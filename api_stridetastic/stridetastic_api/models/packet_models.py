@@ -1,6 +1,7 @@
 # https://github.com/meshtastic/python/blob/master/meshtastic/protobuf/mesh_pb2.pyi
 
 from django.db import models
+from django.db.models.functions import Now
 from timescale.db.models.models import TimescaleModel
 
 
@@ -26,7 +27,9 @@ class Packet(TimescaleModel):
     """
 
     time = models.DateTimeField(
-        auto_now_add=True, help_text="Timestamp when the packet was received."
+        db_default=Now(),
+        editable=False,
+        help_text="Timestamp when the packet was received.",
     )
 
     from_node = models.ForeignKey(
@@ -47,10 +50,13 @@ class Packet(TimescaleModel):
         related_name="packets_received",
         help_text="The node that received the packet.",
     )
-    channels = models.ManyToManyField(
+    channel = models.ForeignKey(
         "Channel",
+        on_delete=models.SET_NULL,
         related_name="packets",
-        help_text="The channels through which the packet was sent.",
+        blank=True,
+        null=True,
+        help_text="The channel through which the packet was sent.",
     )
 
     # Packet
@@ -147,8 +153,14 @@ class Packet(TimescaleModel):
     class Meta:
         verbose_name = "Packet"
         verbose_name_plural = "Packets"
-        ordering = [
-            "time",
+        indexes = [
+            # Only packets still waiting for an ACK are indexed, keeping the
+            # index tiny compared to a B-tree over the low-selectivity flags.
+            models.Index(
+                fields=("from_node", "-time"),
+                condition=models.Q(want_ack=True) & ~models.Q(ackd=True),
+                name="pkt_pending_ack",
+            ),
         ]
 
 
@@ -160,7 +172,9 @@ class PacketData(TimescaleModel):
     """
 
     time = models.DateTimeField(
-        auto_now_add=True, help_text="Timestamp when the packet data was received."
+        db_default=Now(),
+        editable=False,
+        help_text="Timestamp when the packet data was received.",
     )
 
     packet = models.OneToOneField(
@@ -227,9 +241,6 @@ class PacketData(TimescaleModel):
     class Meta:
         verbose_name = "Packet Data"
         verbose_name_plural = "Packets Data"
-        ordering = [
-            "time",
-        ]
 
 
 class NodeInfoPayload(TimescaleModel):
@@ -240,13 +251,15 @@ class NodeInfoPayload(TimescaleModel):
     """
 
     time = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="Timestamp when the node info payload was received.",
     )
 
     packet_data = models.OneToOneField(
         PacketData,
         on_delete=models.CASCADE,
+        primary_key=True,
         related_name="node_info_payload",
         help_text="The packet data to which this Node Info payload belongs. This field is required and must be unique.",
     )
@@ -283,8 +296,6 @@ class NodeInfoPayload(TimescaleModel):
         verbose_name = "Node Info Payload"
         verbose_name_plural = "Node Info Payloads"
 
-    ordering = ["time"]
-
 
 class PositionPayload(TimescaleModel):
     """
@@ -294,12 +305,15 @@ class PositionPayload(TimescaleModel):
     """
 
     time = models.DateTimeField(
-        auto_now_add=True, help_text="Timestamp when the position payload was received."
+        db_default=Now(),
+        editable=False,
+        help_text="Timestamp when the position payload was received.",
     )
 
     packet_data = models.OneToOneField(
         PacketData,
         on_delete=models.CASCADE,
+        primary_key=True,
         related_name="position_payload",
         help_text="The packet data to which this Position payload belongs. This field is required and must be unique.",
     )
@@ -339,29 +353,28 @@ class PositionPayload(TimescaleModel):
         verbose_name = "Position Payload"
         verbose_name_plural = "Position Payloads"
 
-    ordering = ["time"]
-
 
-class TelemetryPayload(TimescaleModel):
+class DeviceTelemetryPayload(TimescaleModel):
     """
-    Represents the payload of a Telemetry protobuf.
-    This model is linked to one and only one PacketData entity and contains specific fields for the telemetry data.
-    A PacketData entity may exist without a TelemetryPayload entity, but a TelemetryPayload entity must always be linked to a PacketData.
+    Represents the device metrics of a Telemetry protobuf.
+    This model is linked to one and only one PacketData entity and contains the battery, voltage, utilization and uptime readings.
+    A PacketData entity may exist without a DeviceTelemetryPayload entity, but a DeviceTelemetryPayload entity must always be linked to a PacketData.
     """
 
     time = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="Timestamp when the telemetry payload was received.",
     )
 
     packet_data = models.OneToOneField(
         PacketData,
         on_delete=models.CASCADE,
-        related_name="telemetry_payload",
-        help_text="The packet data to which this Telemetry payload belongs. This field is required and must be unique.",
+        primary_key=True,
+        related_name="device_telemetry_payload",
+        help_text="The packet data to which this device telemetry payload belongs. This field is required and must be unique.",
     )
 
-    # Device Telemetry
     battery_level = models.IntegerField(
         blank=True, null=True, help_text="Battery level of the device in percentage."
     )
@@ -390,7 +403,36 @@ class TelemetryPayload(TimescaleModel):
         blank=True, null=True, help_text="Uptime of the device in seconds."
     )
 
-    # Environment Telemetry
+    class Meta:
+        verbose_name = "Device Telemetry Payload"
+        verbose_name_plural = "Device Telemetry Payloads"
+        indexes = [
+            # Lets the telemetry rollup task read only recent payloads.
+            models.Index(fields=("time",), name="dev_telemetry_time"),
+        ]
+
+
+class EnvironmentTelemetryPayload(TimescaleModel):
+    """
+    Represents the environment metrics of a Telemetry protobuf.
+    This model is linked to one and only one PacketData entity and contains the temperature, humidity, pressure, gas and air quality readings.
+    A PacketData entity may exist without an EnvironmentTelemetryPayload entity, but an EnvironmentTelemetryPayload entity must always be linked to a PacketData.
+    """
+
+    time = models.DateTimeField(
+        db_default=Now(),
+        editable=False,
+        help_text="Timestamp when the telemetry payload was received.",
+    )
+
+    packet_data = models.OneToOneField(
+        PacketData,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="environment_telemetry_payload",
+        help_text="The packet data to which this environment telemetry payload belongs. This field is required and must be unique.",
+    )
+
     temperature = models.DecimalField(
         max_digits=5,
         decimal_places=2,
@@ -428,10 +470,12 @@ class TelemetryPayload(TimescaleModel):
     )
 
     class Meta:
-        verbose_name = "Telemetry Payload"
-        verbose_name_plural = "Telemetry Payloads"
-
-    ordering = ["time"]
+        verbose_name = "Environment Telemetry Payload"
+        verbose_name_plural = "Environment Telemetry Payloads"
+        indexes = [
+            # Lets the telemetry rollup task read only recent payloads.
+            models.Index(fields=("time",), name="env_telemetry_time"),
+        ]
 
 
 class NeighborInfoPayload(TimescaleModel):
@@ -441,13 +485,15 @@ class NeighborInfoPayload(TimescaleModel):
     """
 
     time = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="Timestamp when the neighbor info payload was received.",
     )
 
     packet_data = models.OneToOneField(
         PacketData,
         on_delete=models.CASCADE,
+        primary_key=True,
         related_name="neighbor_info_payload",
         help_text="The packet data to which this Neighbor Info payload belongs. This field is required and must be unique.",
     )
@@ -489,8 +535,6 @@ class NeighborInfoPayload(TimescaleModel):
         verbose_name = "Neighbor Info Payload"
         verbose_name_plural = "Neighbor Info Payloads"
 
-    ordering = ["time"]
-
 
 class NeighborInfoNeighbor(TimescaleModel):
     """
@@ -498,7 +542,9 @@ class NeighborInfoNeighbor(TimescaleModel):
     """
 
     time = models.DateTimeField(
-        auto_now_add=True, help_text="Timestamp when the neighbor entry was processed."
+        db_default=Now(),
+        editable=False,
+        help_text="Timestamp when the neighbor entry was processed.",
     )
 
     payload = models.ForeignKey(
@@ -554,8 +600,6 @@ class NeighborInfoNeighbor(TimescaleModel):
         verbose_name = "Neighbor Info Neighbor"
         verbose_name_plural = "Neighbor Info Neighbors"
 
-    ordering = ["time"]
-
 
 class RouteDiscoveryPayload(TimescaleModel):
     """
@@ -565,13 +609,15 @@ class RouteDiscoveryPayload(TimescaleModel):
     """
 
     time = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="Timestamp when the route discovery payload was received.",
     )
 
     packet_data = models.OneToOneField(
         PacketData,
         on_delete=models.CASCADE,
+        primary_key=True,
         related_name="route_discovery_payload",
         help_text="The packet data to which this Route Discovery payload belongs. This field is required and must be unique.",
     )
@@ -606,9 +652,6 @@ class RouteDiscoveryPayload(TimescaleModel):
     class Meta:
         verbose_name = "Route Discovery Payload"
         verbose_name_plural = "Route Discovery Payloads"
-        ordering = [
-            "time",
-        ]
 
 
 class RouteDiscoveryRoute(TimescaleModel):
@@ -619,7 +662,8 @@ class RouteDiscoveryRoute(TimescaleModel):
     """
 
     time = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="Timestamp when the route discovery payload was received.",
     )
 
@@ -642,9 +686,6 @@ class RouteDiscoveryRoute(TimescaleModel):
     class Meta:
         verbose_name = "Route Discovery Route"
         verbose_name_plural = "Route Discovery Routes"
-        ordering = [
-            "time",
-        ]
 
 
 class RoutingPayload(TimescaleModel):
@@ -655,13 +696,15 @@ class RoutingPayload(TimescaleModel):
     """
 
     time = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="Timestamp when the route discovery payload was received.",
     )
 
     packet_data = models.OneToOneField(
         PacketData,
         on_delete=models.CASCADE,
+        primary_key=True,
         related_name="routing_payload",
         help_text="The packet data to which this Routing payload belongs. This field is required and must be unique.",
     )
@@ -714,6 +757,3 @@ class RoutingPayload(TimescaleModel):
     class Meta:
         verbose_name = "Routing Payload"
         verbose_name_plural = "Routing Payloads"
-        ordering = [
-            "time",
-        ]
@@ -0,0 +1,24 @@
+from typing import Any
+
+import orjson
+from django.http import HttpRequest
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render API responses with orjson.
+
+    orjson serializes datetimes, UUIDs and dataclasses natively; anything it
+    does not know (Decimal, pydantic models, URLs, ...) falls back to the
+    encoder ninja uses by default so the response shapes stay the same.
+    """
+
+    media_type = "application/json"
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    _fallback_encoder = NinjaJSONEncoder()
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        return orjson.dumps(
+            data, default=self._fallback_encoder.default, option=self.option
+        )
@@ -11,7 +11,7 @@ from .channel_schemas import (
     ChannelsStatisticsSchema,
     ChannelStatisticsSchema,
 )
-from .common_schemas import MessageSchema
+from .common_schemas import DeferredSchema, FastSchema, MessageSchema
 from .graph_schemas import EdgeSchema
 from .keepalive_schemas import (
     KeepaliveConfigSchema,
@@ -35,10 +35,12 @@ from .metrics_schemas import (
 from .node_schemas import (
     NodeKeyHealthSchema,
     NodeLatencyHistorySchema,
+    NodeListItemSchema,
     NodePositionHistorySchema,
     NodeSchema,
     NodeStatisticsSchema,
     NodeTelemetryHistorySchema,
+    NodeTelemetrySchema,
     VirtualNodeCreateSchema,
     VirtualNodeEnumOptionSchema,
     VirtualNodeKeyPairSchema,
@@ -47,10 +49,14 @@ from .node_schemas import (
     VirtualNodeSecretsSchema,
     VirtualNodeUpdateSchema,
 )
+from .payload_schemas import (
+    PAYLOAD_REGISTRY,
+    OpaquePayloadSchema,
+    PacketPayloadSchema,
+)
 from .port_schemas import (
     NodePortActivitySchema,
     NodePortPacketSchema,
-    PacketPayloadSchema,
     PortActivitySchema,
     PortNodeActivitySchema,
 )
@@ -0,0 +1,18 @@
+"""Shared length-constrained string types for the schema modules.
+
+Fields with the same limit reuse one annotated type instead of each carrying
+its own ``max_length`` argument.
+"""
+
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+ShortName = Annotated[str, StringConstraints(max_length=4)]
+LongName = Annotated[str, StringConstraints(max_length=32)]
+NodeLabel = Annotated[str, StringConstraints(max_length=32)]
+NodeIdText = Annotated[str, StringConstraints(max_length=10)]
+MacAddress = Annotated[str, StringConstraints(max_length=17)]
+PublicKey = Annotated[str, StringConstraints(max_length=64)]
+KeyFingerprint = Annotated[str, StringConstraints(max_length=128)]
+ChannelKey = Annotated[str, StringConstraints(max_length=256)]
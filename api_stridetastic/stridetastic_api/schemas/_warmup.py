@@ -0,0 +1,96 @@
+"""Build deferred schemas ahead of the first request.
+
+Every API schema is declared with ``defer_build=True`` (see ``DeferredSchema``)
+so importing the package stays cheap for management commands. Web processes
+call :func:`start_schema_warmup` once at startup to compile the core schemas
+in a background thread instead of on the first request that touches them.
+"""
+
+import importlib
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Iterator
+
+from pydantic import BaseModel, TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+# Leaf modules first: a schema referencing another one is always built after
+# it, so each rebuild reuses the already compiled definitions.
+SCHEMA_MODULES = (
+    "common_schemas",
+    "interface_schemas",
+    "payload_schemas",
+    "port_schemas",
+    "link_schemas",
+    "graph_schemas",
+    "metrics_schemas",
+    "node_schemas",
+    "channel_schemas",
+    "capture_schemas",
+    "keepalive_schemas",
+    "auth_schemas",
+    "publisher_schemas",
+)
+
+_started = False
+_lock = threading.Lock()
+
+
+def iter_schemas() -> Iterator[type[BaseModel] | TypeAdapter]:
+    """Yield schemas and module-level adapters in leaf-to-root order.
+
+    Within a module, classes come out in definition order, which Python
+    already forces to be dependencies-first.
+    """
+    for name in SCHEMA_MODULES:
+        module = importlib.import_module(f"{__package__}.{name}")
+        for value in vars(module).values():
+            if isinstance(value, TypeAdapter):
+                yield value
+            elif (
+                inspect.isclass(value)
+                and issubclass(value, BaseModel)
+                and value.__module__ == module.__name__
+            ):
+                yield value
+
+
+def warm_schemas() -> int:
+    """Build every deferred schema that is not built yet; return how many."""
+    built = 0
+    for schema in iter_schemas():
+        if isinstance(schema, TypeAdapter):
+            if not schema.pydantic_complete:
+                schema.rebuild()
+                built += 1
+        elif not schema.__pydantic_complete__:
+            schema.model_rebuild()
+            built += 1
+    return built
+
+
+def _run() -> None:
+    started = time.perf_counter()
+    try:
+        built = warm_schemas()
+    except Exception:
+        logger.exception("Schema warm-up failed; schemas will build on first use")
+        return
+    logger.info(
+        "Built %d deferred schemas in %.0f ms",
+        built,
+        (time.perf_counter() - started) * 1000,
+    )
+
+
+def start_schema_warmup() -> None:
+    """Start the warm-up thread once per process."""
+    global _started
+    with _lock:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=_run, name="schema-warmup", daemon=True).start()
@@ -1,12 +1,14 @@
-from ninja import Field, Schema
+from ninja import Field
 
+from .common_schemas import DeferredSchema
 
-class LoginSchema(Schema):
+
+class LoginSchema(DeferredSchema):
     username: str = Field(..., description="Username of the user", example="root")
     password: str = Field(..., description="Password of the user", example="password")
 
 
-class TokenSchema(Schema):
+class TokenSchema(DeferredSchema):
     access: str = Field(
         ...,
         description="Access token",
@@ -19,7 +21,7 @@ class TokenSchema(Schema):
     )
 
 
-class RefreshTokenSchema(Schema):
+class RefreshTokenSchema(DeferredSchema):
     refresh: str = Field(
         ...,
         description="Refresh token to use for generating a new access token",
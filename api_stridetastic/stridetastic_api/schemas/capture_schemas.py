@@ -1,20 +1,23 @@
 from datetime import datetime
-from typing import Optional
 from uuid import UUID
 
-from ninja import Schema
+from pydantic import ConfigDict, TypeAdapter
 
+from .common_schemas import DeferredSchema
+
+
+class CaptureSessionSchema(DeferredSchema):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-class CaptureSessionSchema(Schema):
     id: UUID
     name: str
     status: str
     source_type: str
-    interface_id: Optional[int] = None
-    interface_name: Optional[str] = None
+    interface_id: int | None = None
+    interface_name: str | None = None
     started_at: datetime
-    ended_at: Optional[datetime] = None
-    last_packet_at: Optional[datetime] = None
+    ended_at: datetime | None = None
+    last_packet_at: datetime | None = None
     packet_count: int
     byte_count: int
     file_size: int
@@ -23,7 +26,12 @@ class CaptureSessionSchema(Schema):
     is_active: bool
 
 
-class CaptureStartSchema(Schema):
+CAPTURE_SESSIONS_ADAPTER = TypeAdapter(
+    list[CaptureSessionSchema], config=ConfigDict(defer_build=True)
+)
+
+
+class CaptureStartSchema(DeferredSchema):
     name: str
-    interface_id: Optional[int] = None
+    interface_id: int | None = None
     source_type: str = "mqtt"
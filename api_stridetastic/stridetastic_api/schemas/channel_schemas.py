@@ -1,16 +1,18 @@
 from datetime import datetime
-from typing import List, Optional
 
-from ninja import Field, Schema
+from ninja import Field
+from pydantic import ConfigDict, TypeAdapter
 
+from ._types import ChannelKey
+from .common_schemas import DeferredSchema
 from .node_schemas import NodeSchema
 
 
-class ChannelSchema(Schema):
+class ChannelSchema(DeferredSchema):
     channel_id: str = Field(..., description="Unique identifier for the channel.")
     channel_num: int = Field(..., description="Channel number (0-255).")
-    psk: Optional[str] = Field(
-        ..., description="AES encryption key for the channel.", max_length=256
+    psk: ChannelKey | None = Field(
+        ..., description="AES encryption key for the channel."
     )
     first_seen: datetime = Field(
         ..., description="Timestamp when the channel was first seen."
@@ -18,16 +20,18 @@ class ChannelSchema(Schema):
     last_seen: datetime = Field(
         ..., description="Timestamp when the channel was last seen."
     )
-    members: List[NodeSchema] = Field(
+    members: list[NodeSchema] = Field(
         ..., description="List of nodes associated with the channel."
     )
-    interfaces: Optional[List[str]] = Field(
+    interfaces: list[str] | None = Field(
         ...,
         description="Interfaces where this channel has been listened to. Should be a list of interface names.",
     )
 
 
-class ChannelStatisticsSchema(Schema):
+class ChannelStatisticsSchema(DeferredSchema):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     channel_id: str = Field(..., description="Unique identifier for the channel.")
     channel_num: int = Field(..., description="Channel number (0-255).")
     total_messages: int = Field(
@@ -44,7 +48,14 @@ class ChannelStatisticsSchema(Schema):
     )
 
 
-class ChannelsStatisticsSchema(Schema):
-    channels: List[ChannelStatisticsSchema] = Field(
+class ChannelsStatisticsSchema(DeferredSchema):
+    channels: list[ChannelStatisticsSchema] = Field(
         ..., description="List of statistics for all channels."
     )
+
+
+# Validates a whole list of statistics rows in one pass instead of building
+# each schema instance separately.
+CHANNEL_STATS_ADAPTER = TypeAdapter(
+    list[ChannelStatisticsSchema], config=ConfigDict(defer_build=True)
+)
@@ -1,5 +1,88 @@
+import functools
+import sys
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, Self
+
 from ninja import Field, Schema
+from pydantic import ConfigDict, TypeAdapter
+
+
+class DeferredSchema(Schema):
+    """Root for every API schema.
 
+    Core schemas are not built at import; each class is compiled on first use
+    or by the startup warm-up in ``schemas._warmup``, whichever comes first.
+    """
 
-class MessageSchema(Schema):
+    model_config = ConfigDict(defer_build=True)
+
+
+class MessageSchema(DeferredSchema):
     message: str = Field(..., description="Response message")
+
+
+class FastSchema(DeferredSchema):
+    """Base for response schemas assembled from trusted ORM rows.
+
+    Instances are immutable once built and validators are only compiled the
+    first time a schema is actually used. Field descriptions are not declared
+    with ``Field(...)``; they live in the defining module's ``FIELD_DOCS``
+    mapping (schema name -> field name -> description) and are only merged
+    into the JSON schema when OpenAPI docs are generated.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """Build an instance without running validation.
+
+        Values must already match the declared field types (e.g. ``Decimal``
+        coerced to ``float``). Anything coming from a request body must go
+        through the regular constructor instead.
+        """
+        return cls.model_construct(**data)
+
+    @classmethod
+    def encode(cls, instance: Self) -> bytes:
+        """Dump one instance to JSON with the class's own serializer."""
+        return cls.__pydantic_serializer__.to_json(instance)
+
+    @classmethod
+    def encode_list(cls, instances: Iterable[Self]) -> bytes:
+        """Dump a list of instances to JSON in a single pydantic-core call."""
+        return cls._list_adapter().dump_json(list(instances), warnings=False)
+
+    @classmethod
+    @functools.cache
+    def _list_adapter(cls) -> TypeAdapter:
+        # One adapter per schema, created on first use so it honours
+        # defer_build like the schema itself.
+        return TypeAdapter(list[cls], config=ConfigDict(defer_build=True))
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema, handler):
+        json_schema = handler(core_schema)
+        field_docs = getattr(sys.modules[cls.__module__], "FIELD_DOCS", {}).get(
+            cls.__name__, {}
+        )
+        if field_docs:
+            properties = handler.resolve_ref_schema(json_schema).get("properties", {})
+            for name, description in field_docs.items():
+                if name in properties:
+                    properties[name].setdefault("description", description)
+        return json_schema
+
+
+class SeenMixin(FastSchema):
+    """``first_seen``/``last_seen`` pair shared by node and edge rows."""
+
+    first_seen: datetime
+    last_seen: datetime
+
+
+class TimestampedMixin(FastSchema):
+    """``timestamp`` shared by history snapshots and packet rows."""
+
+    timestamp: datetime
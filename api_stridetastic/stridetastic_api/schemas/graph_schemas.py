@@ -1,31 +1,27 @@
-from datetime import datetime
-from typing import List, Optional
+from .common_schemas import SeenMixin
 
-from ninja import Field, Schema  # type: ignore[import]
 
+class EdgeSchema(SeenMixin):
+    source_node_id: int
+    target_node_id: int
+    last_packet_id: int | None = None
+    last_rx_rssi: int | None = None
+    last_rx_snr: float | None = None
+    last_hops: int | None = None
+    interfaces_names: tuple[str, ...] = ()
 
-class EdgeSchema(Schema):
-    source_node_id: int = Field(..., description="ID of the source node.")
-    target_node_id: int = Field(..., description="ID of the target node.")
-    first_seen: datetime = Field(
-        ..., description="Timestamp when the edge was first seen."
-    )
-    last_seen: datetime = Field(
-        ..., description="Timestamp when the edge was last seen."
-    )
-    last_packet_id: Optional[int] = Field(
-        None, description="ID of the last packet associated with this edge."
-    )
-    last_rx_rssi: Optional[int] = Field(
-        None, description="Last received RSSI for the edge."
-    )
-    last_rx_snr: Optional[float] = Field(
-        None, description="Last received SNR for the edge."
-    )
-    last_hops: Optional[int] = Field(
-        None, description="Last number of hops for the edge."
-    )
-    interfaces_names: List[str] = Field(
-        default_factory=list,
-        description="List of interface names through which this edge is observed.",
-    )
+
+# OpenAPI descriptions for the response schemas above (see FastSchema).
+FIELD_DOCS: dict[str, dict[str, str]] = {
+    "EdgeSchema": {
+        "source_node_id": "ID of the source node.",
+        "target_node_id": "ID of the target node.",
+        "first_seen": "Timestamp when the edge was first seen.",
+        "last_seen": "Timestamp when the edge was last seen.",
+        "last_packet_id": "ID of the last packet associated with this edge.",
+        "last_rx_rssi": "Last received RSSI for the edge.",
+        "last_rx_snr": "Last received SNR for the edge.",
+        "last_hops": "Last number of hops for the edge.",
+        "interfaces_names": "List of interface names through which this edge is observed.",
+    },
+}
@@ -1,7 +1,9 @@
-from ninja import Field, Schema
+from ninja import Field
 
+from .common_schemas import DeferredSchema
 
-class InterfaceSchema(Schema):
+
+class InterfaceSchema(DeferredSchema):
     id: int = Field(..., description="Database primary key of the interface.")
     name: str = Field(..., description="Unique name for this interface instance.")
     interface_type: str = Field(
@@ -1,39 +1,36 @@
 from datetime import datetime
-from typing import List, Optional
 
-from ninja import Field, Schema
+from ninja import Field
 
+from .common_schemas import DeferredSchema
+from .link_schemas import LinkNodeSchema
 
-class KeepaliveNodeSummarySchema(Schema):
-    id: int
-    node_id: str
-    node_num: int
-    short_name: Optional[str] = None
-    long_name: Optional[str] = None
+# Selected keepalive nodes use the same summary shape as link endpoints.
+KeepaliveNodeSummarySchema = LinkNodeSchema
 
 
-class KeepaliveInterfaceSchema(Schema):
+class KeepaliveInterfaceSchema(DeferredSchema):
     id: int = Field(..., description="Interface primary key")
-    name: Optional[str] = Field(None, description="Human-readable interface name")
-    interface_type: Optional[str] = Field(
+    name: str | None = Field(None, description="Human-readable interface name")
+    interface_type: str | None = Field(
         None, description="Interface type (MQTT/SERIAL/TCP)"
     )
-    status: Optional[str] = Field(None, description="Runtime status of the interface")
+    status: str | None = Field(None, description="Runtime status of the interface")
 
 
-class KeepaliveConfigSchema(Schema):
+class KeepaliveConfigSchema(DeferredSchema):
     enabled: bool = Field(..., description="Whether keepalive monitoring is enabled")
     payload_type: str = Field(
         "reachability", description="Packet type: reachability or traceroute"
     )
-    from_node: Optional[str] = Field(None, description="Source node ID")
-    gateway_node: Optional[str] = Field(None, description="Optional gateway node")
-    channel_name: Optional[str] = Field(None, description="Channel name")
-    channel_key: Optional[str] = Field(None, description="Channel AES key")
+    from_node: str | None = Field(None, description="Source node ID")
+    gateway_node: str | None = Field(None, description="Optional gateway node")
+    channel_name: str | None = Field(None, description="Channel name")
+    channel_key: str | None = Field(None, description="Channel AES key")
     hop_limit: int = Field(3, description="Hop limit")
     hop_start: int = Field(3, description="Hop start")
-    interface_id: Optional[int] = Field(None, description="Preferred MQTT interface ID")
-    interface: Optional[KeepaliveInterfaceSchema] = Field(
+    interface_id: int | None = Field(None, description="Preferred MQTT interface ID")
+    interface: KeepaliveInterfaceSchema | None = Field(
         None, description="Interface metadata when configured"
     )
     offline_after_seconds: int = Field(
@@ -43,55 +40,50 @@ class KeepaliveConfigSchema(Schema):
         60, description="How often the keepalive check runs"
     )
     scope: str = Field("all", description="Node scope: all, selected, or virtual_only")
-    selected_node_ids: List[int] = Field(
-        default_factory=list, description="Node IDs selected for keepalive monitoring"
+    selected_node_ids: tuple[int, ...] = Field(
+        (), description="Node IDs selected for keepalive monitoring"
     )
-    selected_nodes: List[KeepaliveNodeSummarySchema] = Field(
-        default_factory=list, description="Selected node details"
+    selected_nodes: tuple[LinkNodeSchema, ...] = Field(
+        (), description="Selected node details"
     )
 
 
-class KeepaliveConfigUpdateSchema(Schema):
-    enabled: Optional[bool] = Field(
+class KeepaliveConfigUpdateSchema(DeferredSchema):
+    enabled: bool | None = Field(
         None, description="Enable or disable keepalive monitoring"
     )
-    payload_type: Optional[str] = Field(
+    payload_type: str | None = Field(
         None, description="Packet type: reachability or traceroute"
     )
-    from_node: Optional[str] = Field(None, description="Source node ID")
-    gateway_node: Optional[str] = Field(None, description="Optional gateway node")
-    channel_name: Optional[str] = Field(None, description="Channel name")
-    channel_key: Optional[str] = Field(None, description="Channel AES key")
-    hop_limit: Optional[int] = Field(None, description="Hop limit")
-    hop_start: Optional[int] = Field(None, description="Hop start")
-    interface_id: Optional[int] = Field(None, description="Preferred MQTT interface ID")
-    offline_after_seconds: Optional[int] = Field(
+    from_node: str | None = Field(None, description="Source node ID")
+    gateway_node: str | None = Field(None, description="Optional gateway node")
+    channel_name: str | None = Field(None, description="Channel name")
+    channel_key: str | None = Field(None, description="Channel AES key")
+    hop_limit: int | None = Field(None, description="Hop limit")
+    hop_start: int | None = Field(None, description="Hop start")
+    interface_id: int | None = Field(None, description="Preferred MQTT interface ID")
+    offline_after_seconds: int | None = Field(
         None, description="Seconds of inactivity before a node is considered offline"
     )
-    check_interval_seconds: Optional[int] = Field(
+    check_interval_seconds: int | None = Field(
         None, description="How often the keepalive check runs"
     )
-    scope: Optional[str] = Field(
+    scope: str | None = Field(
         None, description="Node scope: all, selected, or virtual_only"
     )
-    selected_node_ids: Optional[List[int]] = Field(
+    selected_node_ids: list[int] | None = Field(
         None, description="Node IDs selected for keepalive monitoring"
     )
 
 
-class KeepaliveStatusSchema(Schema):
+class KeepaliveStatusSchema(DeferredSchema):
     enabled: bool
     config: KeepaliveConfigSchema
-    last_run_at: Optional[datetime]
-    last_error_message: Optional[str]
+    last_run_at: datetime | None = None
+    last_error_message: str | None = None
 
 
-class KeepaliveTransitionSchema(Schema):
-    id: int
-    node_id: str
-    node_num: int
-    short_name: Optional[str]
-    long_name: Optional[str]
+class KeepaliveTransitionSchema(LinkNodeSchema):
     last_seen: datetime
     offline_at: datetime
     reason: str
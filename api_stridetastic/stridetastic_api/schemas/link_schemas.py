@@ -1,95 +1,88 @@
 from datetime import datetime
-from typing import List, Optional
 
-from ninja import Field, Schema  # type: ignore[import]
+from .common_schemas import FastSchema, TimestampedMixin
+from .payload_schemas import PacketPayloadSchema
 
-from .port_schemas import PacketPayloadSchema
 
+class LinkNodeSchema(FastSchema):
+    id: int
+    node_id: str
+    node_num: int
+    short_name: str | None = None
+    long_name: str | None = None
 
-class LinkNodeSchema(Schema):
-    id: int = Field(..., description="Database identifier for the node.")
-    node_id: str = Field(..., description="Mesh node identifier (e.g., !abcd1234).")
-    node_num: int = Field(..., description="Numeric node identifier.")
-    short_name: Optional[str] = Field(
-        None, description="Short name advertised by the node."
-    )
-    long_name: Optional[str] = Field(
-        None, description="Long name advertised by the node."
-    )
 
+class LinkChannelSchema(FastSchema):
+    channel_id: str
+    channel_num: int | None = None
 
-class LinkChannelSchema(Schema):
-    channel_id: str = Field(
-        ..., description="Channel identifier associated with the link."
-    )
-    channel_num: Optional[int] = Field(
-        None, description="Numeric channel number when known."
-    )
 
+class NodeLinkSchema(FastSchema):
+    id: int
+    node_a: LinkNodeSchema
+    node_b: LinkNodeSchema
+    node_a_to_node_b_packets: int
+    node_b_to_node_a_packets: int
+    total_packets: int
+    is_bidirectional: bool
+    first_seen: datetime
+    last_activity: datetime
+    last_packet_id: int | None = None
+    last_packet_port: str | None = None
+    last_packet_port_display: str | None = None
+    last_packet_channel: LinkChannelSchema | None = None
+    channels: tuple[LinkChannelSchema, ...] = ()
 
-class NodeLinkSchema(Schema):
-    id: int = Field(..., description="Identifier for the logical link.")
-    node_a: LinkNodeSchema = Field(..., description="Canonical first node in the link.")
-    node_b: LinkNodeSchema = Field(
-        ..., description="Canonical second node in the link."
-    )
-    node_a_to_node_b_packets: int = Field(
-        ..., description="Packets observed from node_a to node_b."
-    )
-    node_b_to_node_a_packets: int = Field(
-        ..., description="Packets observed from node_b to node_a."
-    )
-    total_packets: int = Field(
-        ..., description="Total packets observed across both directions."
-    )
-    is_bidirectional: bool = Field(
-        ..., description="True when traffic has been observed in both directions."
-    )
-    first_seen: datetime = Field(
-        ..., description="Timestamp when the link was first detected."
-    )
-    last_activity: datetime = Field(
-        ..., description="Timestamp for the most recent packet observed on this link."
-    )
-    last_packet_id: Optional[int] = Field(
-        None, description="Identifier of the most recent packet when available."
-    )
-    last_packet_port: Optional[str] = Field(
-        None, description="Port identifier of the most recent packet when known."
-    )
-    last_packet_port_display: Optional[str] = Field(
-        None,
-        description="Human-friendly label for the most recent packet's port.",
-    )
-    last_packet_channel: Optional[LinkChannelSchema] = Field(
-        None,
-        description="Channel associated with the most recent packet, when available.",
-    )
-    channels: List[LinkChannelSchema] = Field(
-        default_factory=list,
-        description="Channels that have carried traffic between these nodes.",
-    )
 
+class NodeLinkPacketSchema(TimestampedMixin):
+    packet_id: int | None = None
+    direction: str
+    from_node: LinkNodeSchema
+    to_node: LinkNodeSchema
+    port: str | None = None
+    port_display: str | None = None
+    channel: LinkChannelSchema | None = None
+    payload: PacketPayloadSchema | None = None
 
-class NodeLinkPacketSchema(Schema):
-    packet_id: Optional[int] = Field(
-        None, description="Identifier of the packet when available."
-    )
-    timestamp: datetime = Field(
-        ..., description="Timestamp when the packet was observed."
-    )
-    direction: str = Field(
-        ..., description="Direction of travel relative to the canonical link."
-    )
-    from_node: LinkNodeSchema = Field(..., description="Sender node details.")
-    to_node: LinkNodeSchema = Field(..., description="Receiver node details.")
-    port: Optional[str] = Field(
-        None, description="Canonical port identifier for the packet."
-    )
-    port_display: Optional[str] = Field(None, description="Human-friendly port label.")
-    channel: Optional[LinkChannelSchema] = Field(
-        None, description="Channel that carried the packet when known."
-    )
-    payload: Optional[PacketPayloadSchema] = Field(
-        None, description="Decoded payload contents when available."
-    )
+
+# OpenAPI descriptions for the response schemas above (see FastSchema).
+FIELD_DOCS: dict[str, dict[str, str]] = {
+    "LinkNodeSchema": {
+        "id": "Database identifier for the node.",
+        "node_id": "Mesh node identifier (e.g., !abcd1234).",
+        "node_num": "Numeric node identifier.",
+        "short_name": "Short name advertised by the node.",
+        "long_name": "Long name advertised by the node.",
+    },
+    "LinkChannelSchema": {
+        "channel_id": "Channel identifier associated with the link.",
+        "channel_num": "Numeric channel number when known.",
+    },
+    "NodeLinkSchema": {
+        "id": "Identifier for the logical link.",
+        "node_a": "Canonical first node in the link.",
+        "node_b": "Canonical second node in the link.",
+        "node_a_to_node_b_packets": "Packets observed from node_a to node_b.",
+        "node_b_to_node_a_packets": "Packets observed from node_b to node_a.",
+        "total_packets": "Total packets observed across both directions.",
+        "is_bidirectional": "True when traffic has been observed in both directions.",
+        "first_seen": "Timestamp when the link was first detected.",
+        "last_activity": "Timestamp for the most recent packet observed on this link.",
+        "last_packet_id": "Identifier of the most recent packet when available.",
+        "last_packet_port": "Port identifier of the most recent packet when known.",
+        "last_packet_port_display": "Human-friendly label for the most recent packet's port.",
+        "last_packet_channel": "Channel associated with the most recent packet, when available.",
+        "channels": "Channels that have carried traffic between these nodes.",
+    },
+    "NodeLinkPacketSchema": {
+        "packet_id": "Identifier of the packet when available.",
+        "timestamp": "Timestamp when the packet was observed.",
+        "direction": "Direction of travel relative to the canonical link.",
+        "from_node": "Sender node details.",
+        "to_node": "Receiver node details.",
+        "port": "Canonical port identifier for the packet.",
+        "port_display": "Human-friendly port label.",
+        "channel": "Channel that carried the packet when known.",
+        "payload": "Decoded payload contents when available.",
+    },
+}
@@ -1,63 +1,58 @@
-from datetime import datetime
-from typing import List, Optional
-
-from ninja import Field, Schema
-
-
-class OverviewMetricSnapshotSchema(Schema):
-    timestamp: datetime = Field(
-        ..., description="Timestamp when the snapshot was recorded."
-    )
-    total_nodes: int = Field(
-        ..., description="Total nodes known to the system at capture time."
-    )
-    active_nodes: int = Field(
-        ..., description="Nodes seen within the active activity window."
-    )
-    reachable_nodes: int = Field(
-        ..., description="Nodes that responded to the latest reactive probe cycle."
-    )
-    active_connections: int = Field(
-        ..., description="Active edges observed at capture time."
-    )
-    channels: int = Field(..., description="Active channels observed at capture time.")
-    avg_battery: Optional[float] = Field(
-        None, description="Average battery level across reporting nodes."
-    )
-    avg_rssi: Optional[float] = Field(
-        None, description="Average RSSI value across active edges."
-    )
-    avg_snr: Optional[float] = Field(
-        None, description="Average SNR value across active edges."
-    )
-
-
-class OverviewMetricsSchema(Schema):
-    total_nodes: int = Field(..., description="Current total node count.")
-    active_nodes: int = Field(
-        ..., description="Nodes observed within the configured active window."
-    )
-    reachable_nodes: int = Field(
-        ..., description="Nodes that responded to the most recent reactive probe cycle."
-    )
-    active_connections: int = Field(..., description="Current active edge count.")
-    channels: int = Field(..., description="Current active channel count.")
-    avg_battery: Optional[float] = Field(
-        None, description="Average battery level across nodes reporting telemetry."
-    )
-    avg_rssi: Optional[float] = Field(
-        None, description="Average RSSI across active edges."
-    )
-    avg_snr: Optional[float] = Field(
-        None, description="Average SNR across active edges."
-    )
-
-
-class OverviewMetricsResponseSchema(Schema):
-    current: OverviewMetricsSchema = Field(
-        ..., description="Current snapshot of overview metrics."
-    )
-    history: List[OverviewMetricSnapshotSchema] = Field(
-        default_factory=list,
-        description="Historical snapshot series ordered chronologically.",
-    )
+from .common_schemas import FastSchema, TimestampedMixin
+
+
+class OverviewMetricSnapshotSchema(TimestampedMixin):
+    total_nodes: int
+    active_nodes: int
+    reachable_nodes: int
+    active_connections: int
+    channels: int
+    avg_battery: float | None = None
+    avg_rssi: float | None = None
+    avg_snr: float | None = None
+
+
+class OverviewMetricsSchema(FastSchema):
+    total_nodes: int
+    active_nodes: int
+    reachable_nodes: int
+    active_connections: int
+    channels: int
+    avg_battery: float | None = None
+    avg_rssi: float | None = None
+    avg_snr: float | None = None
+
+
+class OverviewMetricsResponseSchema(FastSchema):
+    current: OverviewMetricsSchema
+    history: tuple[OverviewMetricSnapshotSchema, ...] = ()
+
+
+# OpenAPI descriptions for the response schemas above (see FastSchema).
+FIELD_DOCS: dict[str, dict[str, str]] = {
+    "OverviewMetricSnapshotSchema": {
+        "timestamp": "Timestamp when the snapshot was recorded.",
+        "total_nodes": "Total nodes known to the system at capture time.",
+        "active_nodes": "Nodes seen within the active activity window.",
+        "reachable_nodes": "Nodes that responded to the latest reactive probe cycle.",
+        "active_connections": "Active edges observed at capture time.",
+        "channels": "Active channels observed at capture time.",
+        "avg_battery": "Average battery level across reporting nodes.",
+        "avg_rssi": "Average RSSI value across active edges.",
+        "avg_snr": "Average SNR value across active edges.",
+    },
+    "OverviewMetricsSchema": {
+        "total_nodes": "Current total node count.",
+        "active_nodes": "Nodes observed within the configured active window.",
+        "reachable_nodes": "Nodes that responded to the most recent reactive probe cycle.",
+        "active_connections": "Current active edge count.",
+        "channels": "Current active channel count.",
+        "avg_battery": "Average battery level across nodes reporting telemetry.",
+        "avg_rssi": "Average RSSI across active edges.",
+        "avg_snr": "Average SNR across active edges.",
+    },
+    "OverviewMetricsResponseSchema": {
+        "current": "Current snapshot of overview metrics.",
+        "history": "Historical snapshot series ordered chronologically.",
+    },
+}
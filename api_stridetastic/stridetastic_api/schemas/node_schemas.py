@@ -1,119 +1,96 @@
 from datetime import datetime
-from typing import List, Optional
 
-from ninja import Field, Schema
-
-
-class NodeSchema(Schema):
-    id: int = Field(..., description="Database primary key of the node.")
-    node_num: int = Field(..., description="Unique identifier for the node.")
-    node_id: str = Field(..., description="Unique ID for the node.")
-    mac_address: str = Field(..., description="MAC address of the node.")
-
-    short_name: Optional[str] = Field(
-        ..., description="Short name of the node.", max_length=4
-    )
-    long_name: Optional[str] = Field(
-        ..., description="Long name of the node.", max_length=32
-    )
-    hw_model: Optional[str] = Field(
-        ..., description="Hardware model of the node.", max_length=32
-    )
-    is_licensed: bool = Field(..., description="Indicates if the node is licensed.")
-    role: Optional[str] = Field(
-        ..., description="Role of the node in the network.", max_length=32
-    )
-    public_key: Optional[str] = Field(
-        ..., description="Public key of the node for encryption.", max_length=64
-    )
-    is_low_entropy_public_key: bool = Field(
-        ..., description="Indicates if the public key matches a known low-entropy hash."
-    )
-    has_private_key: bool = Field(
-        ..., description="Indicates if the backend holds a private key for this node."
-    )
-    private_key_fingerprint: Optional[str] = Field(
-        None,
-        description="Fingerprint of the stored private key, if available.",
-        max_length=128,
-    )
-    is_unmessagable: Optional[bool] = Field(
-        ..., description="Indicates if the node is unmessagable."
-    )
-    is_virtual: bool = Field(
-        ..., description="Indicates if the node is managed as a virtual node."
-    )
-
-    latitude: Optional[float] = Field(
-        ..., description="Latitude of the node's position."
-    )
-    longitude: Optional[float] = Field(
-        ..., description="Longitude of the node's position."
-    )
-    altitude: Optional[float] = Field(
-        ..., description="Altitude of the node's position in meters."
-    )
-    position_accuracy: Optional[float] = Field(
-        ..., description="Accuracy of the position data."
-    )
-    location_source: Optional[str] = Field(
-        None, description="Source reported for the most recent position fix."
-    )
-
-    battery_level: Optional[int] = Field(
-        ..., description="Battery level of the device in percentage."
-    )
-    voltage: Optional[float] = Field(..., description="Voltage of the device in volts.")
-    channel_utilization: Optional[float] = Field(
-        ..., description="Channel utilization of the device in percentage."
-    )
-    air_util_tx: Optional[float] = Field(
-        ..., description="Air utilization for transmission of the device in percentage."
-    )
-    uptime_seconds: Optional[int] = Field(
-        ..., description="Uptime of the device in seconds."
-    )
-
-    temperature: Optional[float] = Field(
-        ..., description="Temperature in degrees Celsius."
-    )
-    relative_humidity: Optional[float] = Field(
-        ..., description="Relative humidity in percentage."
-    )
-    barometric_pressure: Optional[float] = Field(
-        ..., description="Barometric pressure in hPa."
-    )
-    gas_resistance: Optional[float] = Field(..., description="Gas resistance in ohms.")
-    iaq: Optional[float] = Field(..., description="Indoor Air Quality (IAQ) index.")
-    interfaces: Optional[List[str]] = Field(
-        None, description="Interfaces where this node has been listened to."
-    )
-    private_key_updated_at: Optional[datetime] = Field(
-        None, description="Timestamp when the private key was last updated, if known."
-    )
-    latency_reachable: Optional[bool] = Field(
-        None, description="Whether the node responded to the most recent latency probe."
-    )
-    latency_ms: Optional[int] = Field(
-        None,
-        description="Latency in milliseconds recorded for the most recent probe response.",
-    )
-
-    first_seen: datetime = Field(
-        ..., description="Timestamp when the node was first seen."
-    )
-    last_seen: datetime = Field(
-        ..., description="Timestamp when the node was last seen."
-    )
-
-
-class NodeKeyHealthSchema(Schema):
+from ninja import Field
+
+from ._types import (
+    KeyFingerprint,
+    LongName,
+    MacAddress,
+    NodeIdText,
+    NodeLabel,
+    PublicKey,
+    ShortName,
+)
+from .common_schemas import DeferredSchema, FastSchema, SeenMixin, TimestampedMixin
+
+
+class NodeSchema(SeenMixin):
+    id: int
+    node_num: int
+    node_id: str
+    mac_address: str
+
+    short_name: ShortName | None = None
+    long_name: LongName | None = None
+    hw_model: NodeLabel | None = None
+    is_licensed: bool
+    role: NodeLabel | None = None
+    public_key: PublicKey | None = None
+    is_low_entropy_public_key: bool
+    has_private_key: bool
+    private_key_fingerprint: KeyFingerprint | None = None
+    is_unmessagable: bool | None = None
+    is_virtual: bool
+
+    latitude: float | None = None
+    longitude: float | None = None
+    altitude: float | None = None
+    position_accuracy: float | None = None
+    location_source: str | None = None
+
+    battery_level: int | None = None
+    voltage: float | None = None
+    channel_utilization: float | None = None
+    air_util_tx: float | None = None
+    uptime_seconds: int | None = None
+
+    temperature: float | None = None
+    relative_humidity: float | None = None
+    barometric_pressure: float | None = None
+    gas_resistance: float | None = None
+    iaq: float | None = None
+    interfaces: list[str] | None = None
+    private_key_updated_at: datetime | None = None
+    latency_reachable: bool | None = None
+    latency_ms: int | None = None
+
+
+class NodeTelemetrySchema(FastSchema):
+    battery_level: int | None = None
+    voltage: float | None = None
+    channel_utilization: float | None = None
+    air_util_tx: float | None = None
+    uptime_seconds: int | None = None
+    temperature: float | None = None
+    relative_humidity: float | None = None
+    barometric_pressure: float | None = None
+    gas_resistance: float | None = None
+    iaq: float | None = None
+
+
+class NodeListItemSchema(FastSchema):
+    id: int
+    node_num: int
+    node_id: str
+    short_name: str | None = None
+    long_name: str | None = None
+    hw_model: str | None = None
+    role: str | None = None
+    is_virtual: bool
+    latitude: float | None = None
+    longitude: float | None = None
+    altitude: float | None = None
+    last_seen: datetime
+    telemetry: NodeTelemetrySchema | None = None
+
+
+class NodeKeyHealthSchema(DeferredSchema):
     node_id: str = Field(..., description="Unique identifier for the node.")
     node_num: int = Field(..., description="Numeric identifier for the node.")
-    short_name: Optional[str] = Field(None, description="Short name, if set.")
-    long_name: Optional[str] = Field(None, description="Long name, if set.")
+    short_name: str | None = Field(None, description="Short name, if set.")
+    long_name: str | None = Field(None, description="Long name, if set.")
     mac_address: str = Field(..., description="MAC address for traceability.")
-    public_key: Optional[str] = Field(
+    public_key: str | None = Field(
         None, description="Current stored public key, if any."
     )
     is_virtual: bool = Field(..., description="Whether the node is virtual.")
@@ -125,76 +102,73 @@ class NodeKeyHealthSchema(Schema):
         ge=0,
         description="How many nodes share the same non-empty public key (including this one).",
     )
-    duplicate_node_ids: List[str] = Field(
-        default_factory=list, description="Other node IDs that share the same key."
+    duplicate_node_ids: tuple[str, ...] = Field(
+        (), description="Other node IDs that share the same key."
     )
     first_seen: datetime = Field(..., description="When the node was first observed.")
     last_seen: datetime = Field(..., description="Most recent time the node was seen.")
 
 
-class NodeStatisticsSchema(Schema):
+class NodeStatisticsSchema(DeferredSchema):
     pass
 
 
-class VirtualNodeCreateSchema(Schema):
-    short_name: Optional[str] = Field(
+class VirtualNodeCreateSchema(DeferredSchema):
+    short_name: ShortName | None = Field(
         default=None,
         description="Short name for the virtual node (max 4 characters).",
-        max_length=4,
     )
-    long_name: Optional[str] = Field(
+    long_name: LongName | None = Field(
         default=None,
         description="Long name for the virtual node (max 32 characters).",
-        max_length=32,
     )
-    hw_model: Optional[str] = Field(
+    hw_model: NodeLabel | None = Field(
         default=None,
         description="Hardware model label for the virtual node.",
-        max_length=32,
     )
-    role: Optional[str] = Field(
-        default=None, description="Role assigned to the virtual node.", max_length=32
+    role: NodeLabel | None = Field(
+        default=None, description="Role assigned to the virtual node."
     )
-    is_licensed: Optional[bool] = Field(
+    is_licensed: bool | None = Field(
         default=None, description="Whether the virtual node is marked as licensed."
     )
-    is_unmessagable: Optional[bool] = Field(
+    is_unmessagable: bool | None = Field(
         default=None, description="Whether the virtual node is marked as unmessagable."
     )
-    node_num: Optional[int] = Field(
+    node_num: int | None = Field(
         default=None, description="Explicit node number to assign."
     )
-    node_id: Optional[str] = Field(
-        default=None, description="Explicit node ID to assign.", max_length=10
+    node_id: NodeIdText | None = Field(
+        default=None, description="Explicit node ID to assign."
     )
-    mac_address: Optional[str] = Field(
-        default=None, description="Explicit MAC address to assign.", max_length=17
+    mac_address: MacAddress | None = Field(
+        default=None, description="Explicit MAC address to assign."
     )
 
 
 class VirtualNodeUpdateSchema(VirtualNodeCreateSchema):
-    regenerate_keys: Optional[bool] = Field(
+    regenerate_keys: bool | None = Field(
         default=False,
         description="When true, generate a new private/public key pair for the virtual node.",
     )
 
 
-class VirtualNodeSecretsSchema(Schema):
+class VirtualNodeSecretsSchema(DeferredSchema):
     node: NodeSchema = Field(..., description="Serialized node details.")
-    public_key: Optional[str] = Field(
+    public_key: str | None = Field(
         None, description="Base64 encoded public key when a new key pair is generated."
     )
-    private_key: Optional[str] = Field(
+    private_key: str | None = Field(
         None, description="Base64 encoded private key when a new key pair is generated."
     )
 
 
-class VirtualNodeKeyPairSchema(Schema):
+class VirtualNodeKeyPairSchema(DeferredSchema):
     public_key: str = Field(..., description="Generated base64 encoded public key.")
     private_key: str = Field(..., description="Generated base64 encoded private key.")
 
 
-class VirtualNodePrefillSchema(Schema):
+class VirtualNodePrefillSchema(DeferredSchema):
     short_name: str = Field(
         ..., description="Suggested short name for the new virtual node."
     )
@@ -206,19 +180,19 @@ class VirtualNodePrefillSchema(Schema):
     )
 
 
-class VirtualNodeEnumOptionSchema(Schema):
+class VirtualNodeEnumOptionSchema(DeferredSchema):
     value: str = Field(
         ..., description="Enum value as defined in the Meshtastic protobuf."
     )
     label: str = Field(..., description="Human readable label for the enum value.")
 
 
-class VirtualNodeOptionsSchema(Schema):
-    roles: List[VirtualNodeEnumOptionSchema] = Field(
+class VirtualNodeOptionsSchema(DeferredSchema):
+    roles: list[VirtualNodeEnumOptionSchema] = Field(
         ...,
         description="Available role options derived from the Meshtastic protobuf definitions.",
     )
-    hardware_models: List[VirtualNodeEnumOptionSchema] = Field(
+    hardware_models: list[VirtualNodeEnumOptionSchema] = Field(
         ...,
         description="Available hardware model options derived from the Meshtastic protobuf definitions.",
     )
@@ -231,68 +205,131 @@ class VirtualNodeOptionsSchema(Schema):
     )
 
 
-class NodePositionHistorySchema(Schema):
-    timestamp: datetime = Field(
-        ..., description="Timestamp when this position was recorded."
-    )
-    latitude: float = Field(..., description="Latitude at the recorded timestamp.")
-    longitude: float = Field(..., description="Longitude at the recorded timestamp.")
-    altitude: Optional[float] = Field(
-        None, description="Altitude in meters, if available."
-    )
-    accuracy: Optional[float] = Field(
-        None, description="Reported position accuracy, if available."
-    )
-    sequence_number: Optional[int] = Field(
-        None, description="Reported sequence number for the position payload."
-    )
-    packet_id: Optional[int] = Field(
-        None, description="Packet identifier associated with this position update."
-    )
-    location_source: Optional[str] = Field(
-        None, description="Source reported for the position fix."
-    )
-
-
-class NodeTelemetryHistorySchema(Schema):
-    timestamp: datetime = Field(
-        ..., description="Timestamp when this telemetry snapshot was recorded."
-    )
-    battery_level: Optional[int] = Field(None, description="Battery level percentage.")
-    voltage: Optional[float] = Field(None, description="Battery voltage in volts.")
-    channel_utilization: Optional[float] = Field(
-        None, description="Channel utilisation percentage."
-    )
-    air_util_tx: Optional[float] = Field(
-        None, description="Air utilisation for transmission percentage."
-    )
-    uptime_seconds: Optional[int] = Field(None, description="Device uptime in seconds.")
-    temperature: Optional[float] = Field(
-        None, description="Temperature in degrees Celsius."
-    )
-    relative_humidity: Optional[float] = Field(
-        None, description="Relative humidity percentage."
-    )
-    barometric_pressure: Optional[float] = Field(
-        None, description="Barometric pressure in hPa."
-    )
-    gas_resistance: Optional[float] = Field(None, description="Gas resistance in ohms.")
-    iaq: Optional[float] = Field(None, description="Indoor Air Quality index.")
-
-
-class NodeLatencyHistorySchema(Schema):
-    timestamp: datetime = Field(
-        ..., description="Timestamp when this latency probe completed."
-    )
-    probe_message_id: Optional[int] = Field(
-        None, description="Mesh packet identifier used when dispatching the probe."
-    )
-    reachable: Optional[bool] = Field(
-        None, description="Whether the node responded to the probe."
-    )
-    latency_ms: Optional[int] = Field(
-        None, description="Round-trip latency in milliseconds when available."
-    )
-    responded_at: Optional[datetime] = Field(
-        None, description="Timestamp when a response was recorded, if any."
-    )
+class NodePositionHistorySchema(TimestampedMixin):
+    latitude: float
+    longitude: float
+    altitude: float | None = None
+    accuracy: float | None = None
+    sequence_number: int | None = None
+    packet_id: int | None = None
+    location_source: str | None = None
+
+
+class NodeTelemetryHistorySchema(TimestampedMixin):
+    battery_level: int | None = None
+    voltage: float | None = None
+    channel_utilization: float | None = None
+    air_util_tx: float | None = None
+    uptime_seconds: int | None = None
+    temperature: float | None = None
+    relative_humidity: float | None = None
+    barometric_pressure: float | None = None
+    gas_resistance: float | None = None
+    iaq: float | None = None
+
+
+class NodeLatencyHistorySchema(TimestampedMixin):
+    probe_message_id: int | None = None
+    reachable: bool | None = None
+    latency_ms: int | None = None
+    responded_at: datetime | None = None
+
+
+# OpenAPI descriptions for the response schemas above (see FastSchema).
+FIELD_DOCS: dict[str, dict[str, str]] = {
+    "NodeSchema": {
+        "id": "Database primary key of the node.",
+        "node_num": "Unique identifier for the node.",
+        "node_id": "Unique ID for the node.",
+        "mac_address": "MAC address of the node.",
+        "short_name": "Short name of the node.",
+        "long_name": "Long name of the node.",
+        "hw_model": "Hardware model of the node.",
+        "is_licensed": "Indicates if the node is licensed.",
+        "role": "Role of the node in the network.",
+        "public_key": "Public key of the node for encryption.",
+        "is_low_entropy_public_key": "Indicates if the public key matches a known low-entropy hash.",
+        "has_private_key": "Indicates if the backend holds a private key for this node.",
+        "private_key_fingerprint": "Fingerprint of the stored private key, if available.",
+        "is_unmessagable": "Indicates if the node is unmessagable.",
+        "is_virtual": "Indicates if the node is managed as a virtual node.",
+        "latitude": "Latitude of the node's position.",
+        "longitude": "Longitude of the node's position.",
+        "altitude": "Altitude of the node's position in meters.",
+        "position_accuracy": "Accuracy of the position data.",
+        "location_source": "Source reported for the most recent position fix.",
+        "battery_level": "Battery level of the device in percentage.",
+        "voltage": "Voltage of the device in volts.",
+        "channel_utilization": "Channel utilization of the device in percentage.",
+        "air_util_tx": "Air utilization for transmission of the device in percentage.",
+        "uptime_seconds": "Uptime of the device in seconds.",
+        "temperature": "Temperature in degrees Celsius.",
+        "relative_humidity": "Relative humidity in percentage.",
+        "barometric_pressure": "Barometric pressure in hPa.",
+        "gas_resistance": "Gas resistance in ohms.",
+        "iaq": "Indoor Air Quality (IAQ) index.",
+        "interfaces": "Interfaces where this node has been listened to.",
+        "private_key_updated_at": "Timestamp when the private key was last updated, if known.",
+        "latency_reachable": "Whether the node responded to the most recent latency probe.",
+        "latency_ms": "Latency in milliseconds recorded for the most recent probe response.",
+        "first_seen": "Timestamp when the node was first seen.",
+        "last_seen": "Timestamp when the node was last seen.",
+    },
+    "NodeTelemetrySchema": {
+        "battery_level": "Battery level of the device in percentage.",
+        "voltage": "Voltage of the device in volts.",
+        "channel_utilization": "Channel utilization of the device in percentage.",
+        "air_util_tx": "Air utilization for transmission of the device in percentage.",
+        "uptime_seconds": "Uptime of the device in seconds.",
+        "temperature": "Temperature in degrees Celsius.",
+        "relative_humidity": "Relative humidity in percentage.",
+        "barometric_pressure": "Barometric pressure in hPa.",
+        "gas_resistance": "Gas resistance in ohms.",
+        "iaq": "Indoor Air Quality (IAQ) index.",
+    },
+    "NodeListItemSchema": {
+        "id": "Database primary key of the node.",
+        "node_num": "Unique identifier for the node.",
+        "node_id": "Unique ID for the node.",
+        "short_name": "Short name of the node.",
+        "long_name": "Long name of the node.",
+        "hw_model": "Hardware model of the node.",
+        "role": "Role of the node in the network.",
+        "is_virtual": "Indicates if the node is managed as a virtual node.",
+        "latitude": "Latitude of the node's position.",
+        "longitude": "Longitude of the node's position.",
+        "altitude": "Altitude of the node's position in meters.",
+        "last_seen": "Timestamp when the node was last seen.",
+        "telemetry": "Latest device and environment telemetry, when requested.",
+    },
+    "NodePositionHistorySchema": {
+        "timestamp": "Timestamp when this position was recorded.",
+        "latitude": "Latitude at the recorded timestamp.",
+        "longitude": "Longitude at the recorded timestamp.",
+        "altitude": "Altitude in meters, if available.",
+        "accuracy": "Reported position accuracy, if available.",
+        "sequence_number": "Reported sequence number for the position payload.",
+        "packet_id": "Packet identifier associated with this position update.",
+        "location_source": "Source reported for the position fix.",
+    },
+    "NodeTelemetryHistorySchema": {
+        "timestamp": "Timestamp when this telemetry snapshot was recorded.",
+        "battery_level": "Battery level percentage.",
+        "voltage": "Battery voltage in volts.",
+        "channel_utilization": "Channel utilisation percentage.",
+        "air_util_tx": "Air utilisation for transmission percentage.",
+        "uptime_seconds": "Device uptime in seconds.",
+        "temperature": "Temperature in degrees Celsius.",
+        "relative_humidity": "Relative humidity percentage.",
+        "barometric_pressure": "Barometric pressure in hPa.",
+        "gas_resistance": "Gas resistance in ohms.",
+        "iaq": "Indoor Air Quality index.",
+    },
+    "NodeLatencyHistorySchema": {
+        "timestamp": "Timestamp when this latency probe completed.",
+        "probe_message_id": "Mesh packet identifier used when dispatching the probe.",
+        "reachable": "Whether the node responded to the probe.",
+        "latency_ms": "Round-trip latency in milliseconds when available.",
+        "responded_at": "Timestamp when a response was recorded, if any.",
+    },
+}
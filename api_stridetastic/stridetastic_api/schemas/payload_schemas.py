@@ -0,0 +1,189 @@
+from typing import Annotated, Any, Literal, Union
+
+from pydantic import Discriminator, Tag, model_serializer
+
+from .common_schemas import FastSchema
+
+
+class PayloadFieldsSchema(FastSchema):
+    """Packet-level metadata carried by every decoded payload.
+
+    Only attributes that were actually observed are emitted, so ``fields``
+    keeps the sparse key-value shape clients already render.
+    """
+
+    source: int | None = None
+    dest: int | None = None
+    request_id: int | None = None
+    reply_id: int | None = None
+    want_response: bool | None = None
+    got_response: bool | None = None
+
+    @model_serializer(mode="wrap")
+    def _drop_missing(self, handler):
+        return {key: value for key, value in handler(self).items() if value is not None}
+
+
+class TelemetryFieldsSchema(PayloadFieldsSchema):
+    battery_level: int | None = None
+    voltage: float | None = None
+    channel_utilization: float | None = None
+    air_util_tx: float | None = None
+    uptime_seconds: int | None = None
+    temperature: float | None = None
+    relative_humidity: float | None = None
+    barometric_pressure: float | None = None
+    gas_resistance: float | None = None
+    iaq: float | None = None
+
+
+class PositionFieldsSchema(PayloadFieldsSchema):
+    latitude: float | None = None
+    longitude: float | None = None
+    altitude: int | None = None
+    accuracy: int | None = None
+    seq_number: int | None = None
+    location_source: str | None = None
+
+
+class NodeInfoFieldsSchema(PayloadFieldsSchema):
+    short_name: str | None = None
+    long_name: str | None = None
+    hw_model: str | None = None
+    role: str | None = None
+    public_key: str | None = None
+    is_licensed: bool | None = None
+    is_unmessagable: bool | None = None
+
+
+class NeighborInfoFieldsSchema(PayloadFieldsSchema):
+    reporting_node: dict[str, Any] | None = None
+    last_sent_by: dict[str, Any] | None = None
+    reporting_node_id_text: str | None = None
+    node_broadcast_interval_secs: int | None = None
+    neighbors: list[dict[str, Any]] | None = None
+    neighbors_count: int | None = None
+
+
+class RouteDiscoveryFieldsSchema(PayloadFieldsSchema):
+    route_towards: dict[str, Any] | None = None
+    route_back: dict[str, Any] | None = None
+    snr_towards: list[float] | None = None
+    snr_back: list[float] | None = None
+
+
+class RoutingFieldsSchema(PayloadFieldsSchema):
+    error_reason: str | None = None
+
+
+class TextMessageFieldsSchema(PayloadFieldsSchema):
+    text: str | None = None
+
+
+class RawFieldsSchema(PayloadFieldsSchema):
+    raw_payload: str | None = None
+
+
+class TelemetryPayloadSchema(FastSchema):
+    payload_type: Literal["telemetry"] = "telemetry"
+    fields: TelemetryFieldsSchema
+
+
+class PositionPayloadSchema(FastSchema):
+    payload_type: Literal["position"] = "position"
+    fields: PositionFieldsSchema
+
+
+class NodeInfoPayloadSchema(FastSchema):
+    payload_type: Literal["node_info"] = "node_info"
+    fields: NodeInfoFieldsSchema
+
+
+class NeighborInfoPayloadSchema(FastSchema):
+    payload_type: Literal["neighbor_info"] = "neighbor_info"
+    fields: NeighborInfoFieldsSchema
+
+
+class RouteDiscoveryPayloadSchema(FastSchema):
+    payload_type: Literal["route_discovery"] = "route_discovery"
+    fields: RouteDiscoveryFieldsSchema
+
+
+class RoutingPayloadSchema(FastSchema):
+    payload_type: Literal["routing"] = "routing"
+    fields: RoutingFieldsSchema
+
+
+class TextMessagePayloadSchema(FastSchema):
+    payload_type: Literal["text_message"] = "text_message"
+    fields: TextMessageFieldsSchema
+
+
+class RawPayloadSchema(FastSchema):
+    payload_type: Literal["raw"] = "raw"
+    fields: RawFieldsSchema
+
+
+class MetadataPayloadSchema(FastSchema):
+    payload_type: Literal["metadata"] = "metadata"
+    fields: PayloadFieldsSchema
+
+
+class OpaquePayloadSchema(FastSchema):
+    """Fallback for payload types without a dedicated struct.
+
+    ``fields`` is passed through as-is rather than validated key by key.
+    """
+
+    payload_type: str
+    fields: Any = None
+
+
+PAYLOAD_REGISTRY: dict[str, type[FastSchema]] = {
+    "telemetry": TelemetryPayloadSchema,
+    "position": PositionPayloadSchema,
+    "node_info": NodeInfoPayloadSchema,
+    "neighbor_info": NeighborInfoPayloadSchema,
+    "route_discovery": RouteDiscoveryPayloadSchema,
+    "routing": RoutingPayloadSchema,
+    "text_message": TextMessagePayloadSchema,
+    "raw": RawPayloadSchema,
+    "metadata": MetadataPayloadSchema,
+}
+
+
+def _payload_tag(value: Any) -> str:
+    if isinstance(value, dict):
+        payload_type = value.get("payload_type")
+    else:
+        payload_type = getattr(value, "payload_type", None)
+    return payload_type if payload_type in PAYLOAD_REGISTRY else "opaque"
+
+
+PacketPayloadSchema = Annotated[
+    Union[
+        Annotated[TelemetryPayloadSchema, Tag("telemetry")],
+        Annotated[PositionPayloadSchema, Tag("position")],
+        Annotated[NodeInfoPayloadSchema, Tag("node_info")],
+        Annotated[NeighborInfoPayloadSchema, Tag("neighbor_info")],
+        Annotated[RouteDiscoveryPayloadSchema, Tag("route_discovery")],
+        Annotated[RoutingPayloadSchema, Tag("routing")],
+        Annotated[TextMessagePayloadSchema, Tag("text_message")],
+        Annotated[RawPayloadSchema, Tag("raw")],
+        Annotated[MetadataPayloadSchema, Tag("metadata")],
+        Annotated[OpaquePayloadSchema, Tag("opaque")],
+    ],
+    Discriminator(_payload_tag),
+]
+
+
+_PAYLOAD_DOCS = {
+    "payload_type": "Type identifier for the payload contents.",
+    "fields": "Payload attributes as key-value pairs.",
+}
+
+# OpenAPI descriptions for the response schemas above (see FastSchema).
+FIELD_DOCS: dict[str, dict[str, str]] = {
+    **{schema.__name__: _PAYLOAD_DOCS for schema in PAYLOAD_REGISTRY.values()},
+    "OpaquePayloadSchema": _PAYLOAD_DOCS,
+}
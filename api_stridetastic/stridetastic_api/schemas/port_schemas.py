@@ -1,92 +1,94 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
-
-from ninja import Field, Schema  # type: ignore[import]
-
-
-class PortActivitySchema(Schema):
-    port: str = Field(..., description="Meshtastic port identifier.")
-    display_name: str = Field(..., description="Human-friendly port name.")
-    total_packets: int = Field(
-        ..., description="Total number of packets observed for this port."
-    )
-    last_seen: Optional[datetime] = Field(
-        None, description="Timestamp of the most recent packet for this port."
-    )
-
-
-class NodePortActivitySchema(Schema):
-    port: str = Field(..., description="Meshtastic port identifier.")
-    display_name: str = Field(..., description="Human-friendly port name.")
-    sent_count: int = Field(
-        ..., description="Number of packets sent by the node on this port."
-    )
-    received_count: int = Field(
-        ..., description="Number of packets received by the node on this port."
-    )
-    last_sent: Optional[datetime] = Field(
-        None, description="Most recent transmission timestamp on this port."
-    )
-    last_received: Optional[datetime] = Field(
-        None, description="Most recent receive timestamp on this port."
-    )
-
-
-class PortNodeActivitySchema(Schema):
-    node_id: str = Field(..., description="Identifier of the node using this port.")
-    node_num: Optional[int] = Field(
-        None, description="Mesh node number when available."
-    )
-    short_name: Optional[str] = Field(
-        None, description="Short name advertised by the node."
-    )
-    long_name: Optional[str] = Field(
-        None, description="Long name advertised by the node."
-    )
-    sent_count: int = Field(
-        ..., description="Packets sent by this node on the selected port."
-    )
-    received_count: int = Field(
-        ..., description="Packets received by this node on the selected port."
-    )
-    total_packets: int = Field(
-        ..., description="Combined sent and received packets on this port."
-    )
-    last_sent: Optional[datetime] = Field(
-        None, description="Most recent packet sent by this node on the port."
-    )
-    last_received: Optional[datetime] = Field(
-        None, description="Most recent packet received by this node on the port."
-    )
-    last_activity: Optional[datetime] = Field(
-        None, description="Latest activity timestamp considering both directions."
-    )
-
-
-class PacketPayloadSchema(Schema):
-    payload_type: str = Field(
-        ..., description="Type identifier for the payload contents."
-    )
-    fields: Dict[str, Any] = Field(
-        default_factory=dict, description="Payload attributes as key-value pairs."
-    )
-
-
-class NodePortPacketSchema(Schema):
-    packet_id: Optional[int] = Field(
-        None, description="Identifier of the packet when available."
-    )
-    timestamp: datetime = Field(
-        ..., description="Timestamp when the packet was observed."
-    )
-    direction: str = Field(
-        ..., description="Whether the node sent or received the packet."
-    )
-    port: str = Field(..., description="Canonical Meshtastic port identifier.")
-    display_name: str = Field(..., description="Human-friendly port name.")
-    portnum: Optional[int] = Field(None, description="Numeric port value, if known.")
-    from_node_id: Optional[str] = Field(None, description="Sender node identifier.")
-    to_node_id: Optional[str] = Field(None, description="Receiver node identifier.")
-    payload: Optional[PacketPayloadSchema] = Field(
-        None, description="Decoded payload contents when available."
-    )
+
+from pydantic import computed_field
+
+from ..utils.ports import port_display_name
+from .common_schemas import FastSchema, TimestampedMixin
+from .payload_schemas import PacketPayloadSchema
+
+
+class PortLabelMixin(FastSchema):
+    """Derives ``display_name`` from the row's ``port`` key on serialization."""
+
+    port: str
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def display_name(self) -> str:
+        return port_display_name(self.port)
+
+
+class PortActivitySchema(PortLabelMixin):
+    total_packets: int
+    last_seen: datetime | None = None
+
+
+class NodePortActivitySchema(PortLabelMixin):
+    sent_count: int
+    received_count: int
+    last_sent: datetime | None = None
+    last_received: datetime | None = None
+
+
+class PortNodeActivitySchema(FastSchema):
+    node_id: str
+    node_num: int | None = None
+    short_name: str | None = None
+    long_name: str | None = None
+    sent_count: int
+    received_count: int
+    total_packets: int
+    last_sent: datetime | None = None
+    last_received: datetime | None = None
+    last_activity: datetime | None = None
+
+
+class NodePortPacketSchema(TimestampedMixin, PortLabelMixin):
+    packet_id: int | None = None
+    direction: str
+    portnum: int | None = None
+    from_node_id: str | None = None
+    to_node_id: str | None = None
+    payload: PacketPayloadSchema | None = None
+
+
+# OpenAPI descriptions for the response schemas above (see FastSchema).
+FIELD_DOCS: dict[str, dict[str, str]] = {
+    "PortActivitySchema": {
+        "port": "Meshtastic port identifier.",
+        "display_name": "Human-friendly port name.",
+        "total_packets": "Total number of packets observed for this port.",
+        "last_seen": "Timestamp of the most recent packet for this port.",
+    },
+    "NodePortActivitySchema": {
+        "port": "Meshtastic port identifier.",
+        "display_name": "Human-friendly port name.",
+        "sent_count": "Number of packets sent by the node on this port.",
+        "received_count": "Number of packets received by the node on this port.",
+        "last_sent": "Most recent transmission timestamp on this port.",
+        "last_received": "Most recent receive timestamp on this port.",
+    },
+    "PortNodeActivitySchema": {
+        "node_id": "Identifier of the node using this port.",
+        "node_num": "Mesh node number when available.",
+        "short_name": "Short name advertised by the node.",
+        "long_name": "Long name advertised by the node.",
+        "sent_count": "Packets sent by this node on the selected port.",
+        "received_count": "Packets received by this node on the selected port.",
+        "total_packets": "Combined sent and received packets on this port.",
+        "last_sent": "Most recent packet sent by this node on the port.",
+        "last_received": "Most recent packet received by this node on the port.",
+        "last_activity": "Latest activity timestamp considering both directions.",
+    },
+    "NodePortPacketSchema": {
+        "packet_id": "Identifier of the packet when available.",
+        "timestamp": "Timestamp when the packet was observed.",
+        "direction": "Whether the node sent or received the packet.",
+        "port": "Canonical Meshtastic port identifier.",
+        "display_name": "Human-friendly port name.",
+        "portnum": "Numeric port value, if known.",
+        "from_node_id": "Sender node identifier.",
+        "to_node_id": "Receiver node identifier.",
+        "payload": "Decoded payload contents when available.",
+    },
+}
@@ -1,17 +1,19 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any
 
-from ninja import Field, Schema
+from ninja import Field
 
+from .common_schemas import DeferredSchema
 
-class PublishGenericSchema(Schema):
+
+class PublishGenericSchema(DeferredSchema):
     from_node: str = Field(..., description="The node sending the published message")
     to_node: str = Field(..., description="The node receiving the published message")
     channel_name: str = Field(
         ..., description="The channel through which the message is sent"
     )
-    gateway_node: Optional[str] = Field(
+    gateway_node: str | None = Field(
         None, description="Optional gateway node for routing the message"
     )
     channel_key: str = Field(
@@ -26,7 +28,7 @@ class PublishGenericSchema(Schema):
     pki_encrypted: bool = Field(
         False, description="Whether the message is PKI encrypted"
     )
-    interface_id: Optional[int] = Field(
+    interface_id: int | None = Field(
         None,
         description="Interface ID (MQTT instance) to use for publishing. If omitted, default publisher is used.",
     )
@@ -52,7 +54,7 @@ class PublishPositionSchema(PublishGenericSchema):
         0.0, description="Altitude of the published position, default is 0.0"
     )
     # Whether the Data protobuf should request a response from the recipient
-    want_response: Optional[bool] = Field(
+    want_response: bool | None = Field(
         False,
         description="Whether the Data protobuf should request a response (only used for request-style position packets)",
     )
@@ -69,11 +71,11 @@ class PublishTelemetrySchema(PublishGenericSchema):
     telemetry_type: str = Field(
         ..., description="Telemetry category: 'device' or 'environment'"
     )
-    telemetry_options: Dict[str, Any] = Field(
+    telemetry_options: dict[str, Any] = Field(
         default_factory=dict,
         description="Numeric telemetry fields to include in the payload",
     )
-    want_response: Optional[bool] = Field(
+    want_response: bool | None = Field(
         False,
         description="Whether the Data protobuf should request a response (only used for request-style telemetry packets)",
     )
@@ -85,24 +87,24 @@ class PublishReachabilitySchema(PublishGenericSchema):
     )
 
 
-class ReactiveInterfaceSchema(Schema):
+class ReactiveInterfaceSchema(DeferredSchema):
     id: int = Field(..., description="Interface primary key")
-    name: Optional[str] = Field(None, description="Human-readable interface name")
-    interface_type: Optional[str] = Field(
+    name: str | None = Field(None, description="Human-readable interface name")
+    interface_type: str | None = Field(
         None, description="Interface type (MQTT/SERIAL/TCP)"
     )
-    status: Optional[str] = Field(None, description="Runtime status of the interface")
+    status: str | None = Field(None, description="Runtime status of the interface")
 
 
-class PublisherReactiveConfigSchema(Schema):
+class PublisherReactiveConfigSchema(DeferredSchema):
     enabled: bool = Field(..., description="Whether reactive publishing is enabled")
-    from_node: Optional[str] = Field(
+    from_node: str | None = Field(
         None, description="Node ID to publish traceroute packets from"
     )
-    gateway_node: Optional[str] = Field(
+    gateway_node: str | None = Field(
         None, description="Gateway node ID to use when publishing"
     )
-    channel_key: Optional[str] = Field(
+    channel_key: str | None = Field(
         None, description="AES key for the publishing channel"
     )
     hop_limit: int = Field(
@@ -120,68 +122,68 @@ class PublisherReactiveConfigSchema(Schema):
     trigger_ports: list[str] = Field(
         default_factory=list, description="Port names that trigger traceroute injection"
     )
-    listen_interface_ids: List[int] = Field(
+    listen_interface_ids: list[int] = Field(
         default_factory=list,
         description="Interface IDs to listen on for reactive publishing. Empty means all interfaces.",
     )
-    listen_interfaces: List[ReactiveInterfaceSchema] = Field(
+    listen_interfaces: list[ReactiveInterfaceSchema] = Field(
         default_factory=list,
         description="Metadata for the configured listener interfaces.",
     )
 
 
-class PublisherReactiveConfigUpdateSchema(Schema):
-    enabled: Optional[bool] = Field(
+class PublisherReactiveConfigUpdateSchema(DeferredSchema):
+    enabled: bool | None = Field(
         None, description="Enable or disable reactive publishing"
     )
-    from_node: Optional[str] = Field(
+    from_node: str | None = Field(
         None, description="Node ID to publish traceroute packets from"
     )
-    gateway_node: Optional[str] = Field(
+    gateway_node: str | None = Field(
         None, description="Gateway node ID to use when publishing"
     )
-    channel_key: Optional[str] = Field(
+    channel_key: str | None = Field(
         None, description="AES key for the publishing channel"
     )
-    hop_limit: Optional[int] = Field(
+    hop_limit: int | None = Field(
         None, description="Maximum hop limit for published traceroute packets"
     )
-    hop_start: Optional[int] = Field(
+    hop_start: int | None = Field(
         None, description="Hop start value for published traceroute packets"
     )
-    want_ack: Optional[bool] = Field(
+    want_ack: bool | None = Field(
         None, description="Whether published traceroute packets should request ACK"
     )
-    max_tries: Optional[int] = Field(
+    max_tries: int | None = Field(
         None, description="Maximum attempts per node within the rolling window"
     )
-    trigger_ports: Optional[list[str]] = Field(
+    trigger_ports: list[str] | None = Field(
         None, description="Port names that should trigger traceroute injection"
     )
-    listen_interface_ids: Optional[List[int]] = Field(
+    listen_interface_ids: list[int] | None = Field(
         None,
         description="Interface IDs to listen on for reactive publishing. Use an empty list to listen on all interfaces.",
     )
 
 
-class PublisherReactiveAttemptSchema(Schema):
+class PublisherReactiveAttemptSchema(DeferredSchema):
     count: int = Field(
         ..., description="Number of publish attempts in the current window"
     )
-    first_attempt: Optional[datetime] = Field(
+    first_attempt: datetime | None = Field(
         None, description="Timestamp of the first attempt in the current window"
     )
-    last_attempt: Optional[datetime] = Field(
+    last_attempt: datetime | None = Field(
         None, description="Timestamp of the last attempt in the current window"
     )
 
 
-class PublisherReactiveStatusSchema(Schema):
+class PublisherReactiveStatusSchema(DeferredSchema):
     enabled: bool = Field(
         ..., description="Runtime enablement state of reactive publishing"
     )
     config: PublisherReactiveConfigSchema
-    attempts: Dict[str, PublisherReactiveAttemptSchema] = Field(default_factory=dict)
+    attempts: dict[str, PublisherReactiveAttemptSchema] = Field(default_factory=dict)
     attempt_window_seconds: int = Field(
         ..., description="Rolling window (seconds) used for attempt tracking"
     )
@@ -195,11 +197,9 @@ class PeriodicPayloadType(str, Enum):
     TELEMETRY = "telemetry"
 
 
-class PublisherPeriodicJobCreateSchema(Schema):
+class PublisherPeriodicJobCreateSchema(DeferredSchema):
     name: str = Field(..., description="Friendly name for the periodic job")
-    description: Optional[str] = Field(
-        None, description="Optional description of the job"
-    )
+    description: str | None = Field(None, description="Optional description of the job")
     enabled: bool = Field(True, description="Whether the job should be active")
     payload_type: PeriodicPayloadType = Field(
         ..., description="Type of payload to inject"
@@ -207,8 +207,8 @@ class PublisherPeriodicJobCreateSchema(Schema):
     from_node: str = Field(..., description="Publishing source node")
     to_node: str = Field(..., description="Publishing target node")
     channel_name: str = Field(..., description="Channel to publish on")
-    gateway_node: Optional[str] = Field(None, description="Optional gateway node")
-    channel_key: Optional[str] = Field(
+    gateway_node: str | None = Field(None, description="Optional gateway node")
+    channel_key: str | None = Field(
         None, description="Channel AES key, leave blank for default"
     )
     hop_limit: int = Field(3, description="Hop limit for the payload")
@@ -219,53 +219,53 @@ class PublisherPeriodicJobCreateSchema(Schema):
         description="Whether to PKI-encrypt the periodic message (text, position, or telemetry)",
     )
     period_seconds: int = Field(300, description="Execution period in seconds")
-    interface_id: Optional[int] = Field(None, description="Preferred MQTT interface id")
-    payload_options: Dict[str, Any] = Field(
+    interface_id: int | None = Field(None, description="Preferred MQTT interface id")
+    payload_options: dict[str, Any] = Field(
         default_factory=dict, description="Payload specific options"
     )
 
 
-class PublisherPeriodicJobUpdateSchema(Schema):
-    name: Optional[str] = Field(None)
-    description: Optional[str] = Field(None)
-    enabled: Optional[bool] = Field(None)
-    payload_type: Optional[PeriodicPayloadType] = Field(None)
-    from_node: Optional[str] = Field(None)
-    to_node: Optional[str] = Field(None)
-    channel_name: Optional[str] = Field(None)
-    gateway_node: Optional[str] = Field(None)
-    channel_key: Optional[str] = Field(None)
-    hop_limit: Optional[int] = Field(None)
-    hop_start: Optional[int] = Field(None)
-    want_ack: Optional[bool] = Field(None)
-    pki_encrypted: Optional[bool] = Field(None)
-    period_seconds: Optional[int] = Field(None)
-    interface_id: Optional[int] = Field(None)
-    payload_options: Optional[Dict[str, Any]] = Field(None)
+class PublisherPeriodicJobUpdateSchema(DeferredSchema):
+    name: str | None = Field(None)
+    description: str | None = Field(None)
+    enabled: bool | None = Field(None)
+    payload_type: PeriodicPayloadType | None = Field(None)
+    from_node: str | None = Field(None)
+    to_node: str | None = Field(None)
+    channel_name: str | None = Field(None)
+    gateway_node: str | None = Field(None)
+    channel_key: str | None = Field(None)
+    hop_limit: int | None = Field(None)
+    hop_start: int | None = Field(None)
+    want_ack: bool | None = Field(None)
+    pki_encrypted: bool | None = Field(None)
+    period_seconds: int | None = Field(None)
+    interface_id: int | None = Field(None)
+    payload_options: dict[str, Any] | None = Field(None)
 
 
-class PublisherPeriodicJobSchema(Schema):
+class PublisherPeriodicJobSchema(DeferredSchema):
     id: int
     name: str
-    description: Optional[str]
+    description: str | None = None
     enabled: bool
     payload_type: PeriodicPayloadType
     from_node: str
     to_node: str
     channel_name: str
-    gateway_node: Optional[str]
-    channel_key: Optional[str]
+    gateway_node: str | None = None
+    channel_key: str | None = None
     hop_limit: int
     hop_start: int
     want_ack: bool
     pki_encrypted: bool
     period_seconds: int
-    interface_id: Optional[int]
-    interface: Optional[ReactiveInterfaceSchema]
-    payload_options: Dict[str, Any]
-    next_run_at: Optional[datetime]
-    last_run_at: Optional[datetime]
+    interface_id: int | None = None
+    interface: ReactiveInterfaceSchema | None = None
+    payload_options: dict[str, Any]
+    next_run_at: datetime | None = None
+    last_run_at: datetime | None = None
     last_status: str
-    last_error_message: Optional[str]
+    last_error_message: str | None = None
     created_at: datetime
     updated_at: datetime
@@ -1,19 +1,37 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
+import time
 import zlib
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from threading import Lock
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 from uuid import UUID
 
 from celery.exceptions import TimeoutError as CeleryTimeoutError
 from django.conf import settings
-from django.db import transaction
-from django.db.models import F, Q
+from django.db import connection, transaction
+from django.db.models import F, Func, JSONField, Q, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 from django.utils.text import slugify
+from google.protobuf.internal import api_implementation
+from google.protobuf.message import DecodeError, Message
 from meshtastic.protobuf import admin_pb2  # type: ignore[attr-defined]
 from meshtastic.protobuf import (
     atak_pb2,
@@ -37,14 +55,30 @@ from ..models.interface_models import Interface
 from ..utils.pcap_writer import PcapNgWriter
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..models.node_models import Node
     from .pki_service import PKIService
 
 
 logger = logging.getLogger(__name__)
 DEFAULT_CAPTURE_MAX_BYTES = 1_073_741_824  # 1 GiB
-
+# PCAP blocks are buffered per writer and hit the disk in chunks of this size
+# or on the periodic flush, instead of one write+flush per block.
+CAPTURE_WRITE_BUFFER_BYTES = 128 * 1024
+# Packets waiting for a session's writer thread; further packets are dropped.
+CAPTURE_QUEUE_SIZE = 1024
+# Records a writer thread takes off its queue per wakeup and counts as one.
+CAPTURE_WRITE_BATCH = 64
+# Channel PSKs and node private keys are edited from the web process, so
+# the copies cached for decrypting captures simply expire.
+DECRYPT_KEY_CACHE_SECONDS = 30.0
+# Their keys come from the captured traffic, so each cache keeps only the
+# most recently used entries.
+MAX_DECRYPT_KEY_CACHE_ENTRIES = 1024
+
+# Candidate message types per port, most likely first. NODEINFO_APP carries a
+# User on the wire (see the packet handler), so it is tried before NodeInfo.
 _PORT_PROTO_HINTS: Dict[int, Tuple[type, ...]] = {
-    portnums_pb2.NODEINFO_APP: (mesh_pb2.NodeInfo, mesh_pb2.User),
+    portnums_pb2.NODEINFO_APP: (mesh_pb2.User, mesh_pb2.NodeInfo),
     portnums_pb2.POSITION_APP: (mesh_pb2.Position,),
     portnums_pb2.ROUTING_APP: (mesh_pb2.Routing,),
     portnums_pb2.ADMIN_APP: (admin_pb2.AdminMessage,),
@@ -74,6 +108,93 @@ _PORT_PROTO_HINTS: Dict[int, Tuple[type, ...]] = {
     portnums_pb2.CAYENNE_APP: (module_config_pb2.ModuleConfig,),
 }
 
+# Candidate types resolved once with their descriptor names. Each port is
+# decoded with its first type; the rest are tried only on DecodeError.
+_PORT_PROTO_HINTS_RESOLVED: Dict[int, Tuple[Tuple[type, str], ...]] = {
+    portnum: tuple((cls, cls.DESCRIPTOR.full_name) for cls in classes)
+    for portnum, classes in _PORT_PROTO_HINTS.items()
+}
+
+_TEXT_MESSAGE_APP = int(portnums_pb2.TEXT_MESSAGE_APP)
+_TEXT_MESSAGE_COMPRESSED_APP = int(portnums_pb2.TEXT_MESSAGE_COMPRESSED_APP)
+_COMPRESSED_TYPE = mesh_pb2.Compressed.DESCRIPTOR.full_name
+# zlib stream headers (32K window, every compression level). Compressed text
+# is usually Unishox2, so probing first avoids raising zlib.error per packet.
+_ZLIB_HEADERS = frozenset({b"\x78\x01", b"\x78\x5e", b"\x78\x9c", b"\x78\xda"})
+
+_PORT_LABELS: Dict[int, str] = {
+    value.number: f"meshtastic.port.{value.name}"
+    for value in portnums_pb2.PortNum.DESCRIPTOR.values
+}
+
+
+# Columns needed to reopen a RUNNING session's writer.
+_ACTIVATION_FIELDS = (
+    "id",
+    "interface_id",
+    "source_type",
+    "status",
+    "filename",
+    "file_path",
+)
+
+
+def _cached_decrypt_key(
+    cache: "OrderedDict[Hashable, Tuple[Any, float]]", key: Hashable, now: float
+) -> Tuple[bool, Any]:
+    """Return ``(hit, value)`` for an unexpired entry, marking it recently used."""
+    cached = cache.get(key)
+    if cached is None or now >= cached[1]:
+        return False, None
+    cache.move_to_end(key)
+    return True, cached[0]
+
+
+def _remember_decrypt_key(
+    cache: "OrderedDict[Hashable, Tuple[Any, float]]",
+    key: Hashable,
+    value: Any,
+    now: float,
+) -> None:
+    cache[key] = (value, now + DECRYPT_KEY_CACHE_SECONDS)
+    cache.move_to_end(key)
+    while len(cache) > MAX_DECRYPT_KEY_CACHE_ENTRIES:
+        cache.popitem(last=False)
+
+
+_scratch = threading.local()
+
+
+def _scratch_message(cls: type) -> Message:
+    """Return this thread's reusable ``cls`` instance.
+
+    ``ParseFromString`` replaces whatever the previous packet left behind, so
+    callers only need to serialize or copy out what they keep before the next
+    packet is parsed on the same thread.
+    """
+    messages = getattr(_scratch, "messages", None)
+    if messages is None:
+        messages = _scratch.messages = {}
+    message = messages.get(cls)
+    if message is None:
+        message = messages[cls] = cls()
+    return message
+
+
+def _as_bytes(value: bytes | bytearray | memoryview) -> bytes:
+    """Return protobuf ``bytes`` fields as-is; only views need a copy."""
+    if isinstance(value, bytes):
+        return value
+    return bytes(value)
+
+
+class _CaptureRecord(NamedTuple):
+    mesh_payload: bytes
+    data_payload: Optional[bytes]
+    extra_payloads: List[Tuple[str, bytes]]
+    timestamp: datetime
+    total_bytes: int
+
 
 @dataclass
 class _ActiveCapture:
@@ -81,6 +202,22 @@ class _ActiveCapture:
     writer: PcapNgWriter
     interface_id: Optional[int]
     source_type: str
+    queue: "queue.Queue[Optional[_CaptureRecord]]" = field(
+        default_factory=lambda: queue.Queue(maxsize=CAPTURE_QUEUE_SIZE)
+    )
+    worker: Optional[threading.Thread] = None
+    dropped: int = 0
+
+
+@dataclass
+class _PendingStats:
+    """Counter deltas for one session not yet written to its row."""
+
+    packets: int = 0
+    byte_count: int = 0
+    last_packet_at: Optional[datetime] = None
+    file_size: int = 0
+    opened_at: float = field(default_factory=time.monotonic)
 
 
 class CaptureService:
@@ -103,8 +240,15 @@ class CaptureService:
             resolved_base_dir = Path(base_dir)
         self.base_dir = resolved_base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
-        self._active: Dict[UUID, _ActiveCapture] = {}
-        self._lock = Lock()
+        # Active captures, copied and replaced wholesale on every change so
+        # per-packet readers never take a lock; only writers serialize.
+        self._active_snapshot: Dict[UUID, _ActiveCapture] = {}
+        # (source_type, interface_id) -> captures bound to exactly that pair;
+        # interface_id None holds the captures listening on every interface.
+        self._route_index: Dict[
+            Tuple[str, Optional[int]], Tuple[_ActiveCapture, ...]
+        ] = {}
+        self._snapshot_lock = Lock()
         self._enable_writer = enable_writer
         self._task_timeout_seconds = getattr(settings, "CAPTURE_TASK_TIMEOUT", 15)
         self._pki_service = pki_service
@@ -130,6 +274,86 @@ class CaptureService:
             limit_value if limit_value and limit_value > 0 else None
         )
 
+        # Per-packet counters are accumulated here and written with one
+        # UPDATE per session every N packets or T milliseconds.
+        self._pending: Dict[UUID, _PendingStats] = {}
+        self._pending_lock = Lock()
+        self._flush_packets = max(
+            1, int(getattr(settings, "CAPTURE_STATS_FLUSH_PACKETS", 64))
+        )
+        self._flush_interval = (
+            max(1, int(getattr(settings, "CAPTURE_STATS_FLUSH_MS", 250))) / 1000
+        )
+        self._flusher: Optional[threading.Thread] = None
+
+        # (source_type, interface_id) -> monotonic deadline until which ingest
+        # skips the RUNNING-session lookup that last found nothing to activate.
+        self._activation_misses: Dict[Tuple[str, Optional[int]], float] = {}
+        # channel_id -> (psk or None, monotonic expiry) for decrypting captures.
+        self._psk_cache: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        # node_num -> (Node with its private key or None, monotonic expiry).
+        self._pki_node_cache: "OrderedDict[int, Tuple[Optional[Node], float]]" = (
+            OrderedDict()
+        )
+        self._activation_miss_ttl = (
+            max(0, int(getattr(settings, "CAPTURE_ACTIVATION_MISS_TTL_MS", 2000)))
+            / 1000
+        )
+
+        if api_implementation.Type() == "python":
+            logger.warning(
+                "Protobuf is using the pure-Python implementation; capture "
+                "ingest will be several times slower. Install protobuf>=4.21 "
+                "and unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python."
+            )
+
+    # ------------------------------------------------------------------
+    # Active capture registry
+    # ------------------------------------------------------------------
+    def _publish_snapshot(self, snapshot: Dict[UUID, _ActiveCapture]) -> None:
+        # Called with _snapshot_lock held.
+        routes: Dict[Tuple[str, Optional[int]], List[_ActiveCapture]] = {}
+        for active in snapshot.values():
+            routes.setdefault((active.source_type, active.interface_id), []).append(
+                active
+            )
+        self._route_index = {key: tuple(value) for key, value in routes.items()}
+        self._active_snapshot = snapshot
+
+    def _route_targets(
+        self, source_type: str, interface_id: Optional[int]
+    ) -> Tuple[_ActiveCapture, ...]:
+        routes = self._route_index
+        targets = routes.get((source_type, None), ())
+        if interface_id is not None:
+            targets += routes.get((source_type, interface_id), ())
+        return targets
+
+    def _add_active(self, active: _ActiveCapture) -> None:
+        with self._snapshot_lock:
+            snapshot = dict(self._active_snapshot)
+            snapshot[active.session_id] = active
+            self._publish_snapshot(snapshot)
+        self._activation_misses.clear()
+
+    def _pop_active(self, session_id: UUID) -> Optional[_ActiveCapture]:
+        with self._snapshot_lock:
+            if session_id not in self._active_snapshot:
+                return None
+            snapshot = dict(self._active_snapshot)
+            active = snapshot.pop(session_id)
+            self._publish_snapshot(snapshot)
+        return active
+
+    def _has_active(self, session_id: UUID) -> bool:
+        return session_id in self._active_snapshot
+
+    def _drain_active(self) -> List[_ActiveCapture]:
+        with self._snapshot_lock:
+            captures = list(self._active_snapshot.values())
+            self._publish_snapshot({})
+        return captures
+
     # ------------------------------------------------------------------
     # Cross-process coordination helpers
     # ------------------------------------------------------------------
@@ -162,8 +386,9 @@ class CaptureService:
 
     def _ensure_writer_for_session(self, session: CaptureSession) -> None:
         target_path = self.get_full_path(session)
-        interface_id = getattr(session, "interface_id", None)
-        self._register_active_session(session, target_path, interface_id=interface_id)
+        self._register_active_session(
+            session, target_path, interface_id=session.interface_id
+        )
 
     def _register_active_session(
         self,
@@ -173,7 +398,7 @@ class CaptureService:
         interface_id: Optional[int],
     ) -> None:
         try:
-            writer = PcapNgWriter(target_path)
+            writer = PcapNgWriter(target_path, buffer_size=CAPTURE_WRITE_BUFFER_BYTES)
         except Exception as exc:  # pragma: no cover - defensive
             logging.exception("Failed to initialize PCAP writer: %s", exc)
             session.mark_error(str(exc))
@@ -185,20 +410,25 @@ class CaptureService:
             interface_id=interface_id,
             source_type=session.source_type,
         )
-        with self._lock:
-            self._active[session.id] = active
+        active.worker = threading.Thread(
+            target=self._writer_loop,
+            args=(active,),
+            name=f"capture-writer-{session.id}",
+            daemon=True,
+        )
+        active.worker.start()
+        self._add_active(active)
         logging.info("Activated capture %s (%s)", session.id, session.filename)
 
     def activate_existing_session(self, session_id: UUID) -> bool:
-        with self._lock:
-            if session_id in self._active:
-                return True
+        if self._has_active(session_id):
+            return True
 
         session = (
             CaptureSession.objects.filter(
                 id=session_id, status=CaptureSession.Status.RUNNING
             )
-            .select_related("interface")
+            .only(*_ACTIVATION_FIELDS)
             .first()
         )
         if session is None:
@@ -219,22 +449,30 @@ class CaptureService:
         if not self._enable_writer:
             return False
 
+        key = (source_type, interface_id)
+        if time.monotonic() < self._activation_misses.get(key, 0.0):
+            return False
+
         filters = Q(status=CaptureSession.Status.RUNNING, source_type=source_type)
         if interface_id is None:
             filters &= Q(interface__isnull=True)
         else:
             filters &= Q(interface__isnull=True) | Q(interface_id=interface_id)
 
-        sessions = CaptureSession.objects.filter(filters)
+        session_ids = CaptureSession.objects.filter(filters).values_list(
+            "id", flat=True
+        )
         activated_any = False
-        for session in sessions:
+        for session_id in session_ids:
             try:
-                if self.activate_existing_session(session.id):
+                if self.activate_existing_session(session_id):
                     activated_any = True
             except Exception as exc:  # pragma: no cover - defensive
                 logging.exception(
-                    "Failed to activate session %s during ingest: %s", session.id, exc
+                    "Failed to activate session %s during ingest: %s", session_id, exc
                 )
+        if not activated_any and self._activation_miss_ttl:
+            self._activation_misses[key] = time.monotonic() + self._activation_miss_ttl
         return activated_any
 
     # ------------------------------------------------------------------
@@ -318,8 +556,9 @@ class CaptureService:
             logging.info("Stopped capture %s (delegated)", session.id)
             return session
 
-        with self._lock:
-            active = self._active.pop(session_id, None)
+        active = self._pop_active(session_id)
+        self._stop_worker(active)
+        self.flush_stats(session_id)
 
         session = CaptureSession.objects.filter(id=session_id).first()
         if session is None:
@@ -356,8 +595,9 @@ class CaptureService:
             logging.info("Cancelled capture %s (delegated)", session.id)
             return session
 
-        with self._lock:
-            active = self._active.pop(session_id, None)
+        active = self._pop_active(session_id)
+        self._stop_worker(active)
+        self.flush_stats(session_id)
         session = CaptureSession.objects.filter(id=session_id).first()
         if session is None:
             if active:
@@ -384,9 +624,11 @@ class CaptureService:
             logging.info("Stopped all captures (delegated)")
             return
 
-        with self._lock:
-            active_sessions = list(self._active.values())
-            self._active.clear()
+        active_sessions = self._drain_active()
+        for active in active_sessions:
+            self._stop_worker(active)
+        self.flush_stats()
+        ended_at = timezone.now()
         for active in active_sessions:
             try:
                 active.writer.close()
@@ -394,7 +636,7 @@ class CaptureService:
                     id=active.session_id, status=CaptureSession.Status.RUNNING
                 ).update(
                     status=CaptureSession.Status.CANCELLED,
-                    ended_at=timezone.now(),
+                    ended_at=ended_at,
                 )
             except Exception as exc:  # pragma: no cover - defensive
                 logging.exception(
@@ -411,8 +653,9 @@ class CaptureService:
                 logging.info("Deleted capture %s (delegated)", session_id)
             return bool(deleted)
 
-        with self._lock:
-            active = self._active.pop(session_id, None)
+        active = self._pop_active(session_id)
+        self._stop_worker(active)
+        self._discard_stats(session_id)
 
         session = CaptureSession.objects.filter(id=session_id).first()
         if session is None:
@@ -429,9 +672,10 @@ class CaptureService:
             logging.info("Deleted %s captures (delegated)", deleted)
             return int(deleted or 0)
 
-        with self._lock:
-            active_map = {active.session_id: active for active in self._active.values()}
-            self._active.clear()
+        active_map = {active.session_id: active for active in self._drain_active()}
+        for active in active_map.values():
+            self._stop_worker(active)
+        self._discard_stats()
 
         sessions = list(CaptureSession.objects.all())
         deleted_count = 0
@@ -450,12 +694,10 @@ class CaptureService:
         return CaptureSession.objects.all().order_by("-started_at")
 
     def is_active(self, session_id: UUID) -> bool:
-        with self._lock:
-            return session_id in self._active
+        return self._has_active(session_id)
 
     def to_dict(self, session: CaptureSession) -> dict:
-        with self._lock:
-            is_active = session.id in self._active
+        is_active = self._has_active(session.id)
         interface = session.interface
         return {
             "id": session.id,
@@ -486,114 +728,249 @@ class CaptureService:
         interface_id: Optional[int] = None,
         timestamp=None,
     ) -> None:
-        def _select_targets() -> list[_ActiveCapture]:
-            return [
-                active
-                for active in self._active.values()
-                if active.source_type == source_type
-                and (active.interface_id is None or active.interface_id == interface_id)
-            ]
-
-        with self._lock:
-            targets = _select_targets()
+        targets = self._route_targets(source_type, interface_id)
 
         if not targets and self._activate_sessions_for_ingest(
             source_type, interface_id
         ):
-            with self._lock:
-                targets = _select_targets()
+            targets = self._route_targets(source_type, interface_id)
 
         if not targets:
             return
 
-        now = timezone.now()
-        ts = timestamp or now
-
-        try:
-            envelope = mqtt_pb2.ServiceEnvelope()
-            envelope.ParseFromString(raw_payload)
-        except Exception as exc:
-            logging.exception("Failed to parse ServiceEnvelope for capture: %s", exc)
+        decoded = self._decode_envelope(raw_payload)
+        if decoded is None:
             return
+        mesh_payload, data_payload, extra_payloads = decoded
+        ts = timestamp or timezone.now()
 
-        mesh_packet = envelope.packet
-        channel_id = getattr(envelope, "channel_id", None)
-        mesh_size = (
-            mesh_packet.ByteSize() if getattr(mesh_packet, "ByteSize", None) else 0
+        total_bytes = (
+            len(mesh_payload)
+            + (len(data_payload) if data_payload else 0)
+            + sum(len(p[1]) for p in extra_payloads)
         )
-        if mesh_size == 0:
-            logging.debug(
-                "ServiceEnvelope contained empty MeshPacket; skipping capture write"
-            )
-            return
 
-        mesh_payload = mesh_packet.SerializeToString()
-        data_payload: Optional[bytes] = None
-        extra_payloads: list[Tuple[str, bytes]] = []
+        record = _CaptureRecord(
+            mesh_payload, data_payload, extra_payloads, ts, total_bytes
+        )
+        for active in targets:
+            try:
+                active.queue.put_nowait(record)
+            except queue.Full:
+                active.dropped += 1
+                if active.dropped == 1 or active.dropped % 1000 == 0:
+                    logging.warning(
+                        "Capture %s writer is behind; dropped %d packets so far",
+                        active.session_id,
+                        active.dropped,
+                    )
 
+    # ------------------------------------------------------------------
+    # Writer threads
+    # ------------------------------------------------------------------
+    def _writer_loop(self, active: _ActiveCapture) -> None:
+        pending = active.queue
+        try:
+            while True:
+                batch = [pending.get()]
+                try:
+                    while batch[-1] is not None and len(batch) < CAPTURE_WRITE_BATCH:
+                        try:
+                            batch.append(pending.get_nowait())
+                        except queue.Empty:
+                            break
+                    stop = batch[-1] is None
+                    records = batch[:-1] if stop else batch
+                    if records and not self._write_records(active, records):
+                        return
+                    if stop:
+                        return
+                finally:
+                    for _ in batch:
+                        pending.task_done()
+        finally:
+            # Release anything queued after the session closed so
+            # wait_for_writes() never blocks on a finished writer.
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+                pending.task_done()
+            connection.close()
+
+    def _write_records(
+        self, active: _ActiveCapture, records: List[_CaptureRecord]
+    ) -> bool:
+        """Write queued packets; return False once the session has been closed."""
+        writer = active.writer
+        byte_count = 0
         try:
-            has_decoded = mesh_packet.HasField("decoded")  # type: ignore[attr-defined]
-        except (AttributeError, ValueError):
-            has_decoded = False
+            for record in records:
+                writer.write_packet_group(
+                    record.mesh_payload,
+                    record.data_payload,
+                    record.extra_payloads,
+                    record.timestamp,
+                )
+                byte_count += record.total_bytes
+        except Exception as exc:  # pragma: no cover - defensive
+            logging.exception("Capture %s write failed: %s", active.session_id, exc)
+            self._handle_capture_error(active.session_id, str(exc))
+            return False
 
-        data_message: Optional[mesh_pb2.Data] = None
+        bytes_written = writer.bytes_written
+        self._record_write(
+            active.session_id,
+            len(records),
+            byte_count,
+            records[-1].timestamp,
+            bytes_written,
+        )
 
-        if has_decoded:
-            data_message = mesh_packet.decoded
-        else:
-            data_message = self._decrypt_encrypted_payload(
-                mesh_packet, channel_id=channel_id
-            )
+        if self._max_bytes is not None and bytes_written >= self._max_bytes:
+            self._handle_size_limit(active)
+            return False
+        return True
 
-        if data_message is not None:
-            serialized_data, nested_payloads = self._extract_payloads_from_data(
-                data_message
+    def _stop_worker(self, active: Optional[_ActiveCapture]) -> None:
+        """Let the writer thread drain its queue and exit."""
+        if active is None or active.worker is None:
+            return
+        if active.worker is threading.current_thread() or not active.worker.is_alive():
+            return
+        try:
+            active.queue.put(None, timeout=self._task_timeout_seconds)
+        except queue.Full:  # pragma: no cover - defensive
+            logging.error(
+                "Capture %s writer did not drain its queue", active.session_id
+            )
+            return
+        active.worker.join(timeout=self._task_timeout_seconds)
+        if active.dropped:
+            logging.warning(
+                "Capture %s dropped %d packets while its writer was behind",
+                active.session_id,
+                active.dropped,
             )
-            if serialized_data:
-                data_payload = serialized_data
-            if nested_payloads:
-                extra_payloads.extend(nested_payloads)
-
-        total_bytes = (
-            len(mesh_payload)
-            + (len(data_payload) if data_payload else 0)
-            + sum(len(p[1]) for p in extra_payloads)
-        )
 
-        limit_exceeded: list[_ActiveCapture] = []
+    def wait_for_writes(self) -> None:
+        """Block until every active writer thread has handled its queued packets."""
+        for active in self._active_snapshot.values():
+            if active.worker is not None and active.worker.is_alive():
+                active.queue.join()
 
-        for active in targets:
-            try:
-                active.writer.write_mesh_packet(mesh_payload, ts)
-                if data_payload:
-                    active.writer.write_data_packet(data_payload, ts)
-                for message_type, payload in extra_payloads:
-                    active.writer.write_packet(
-                        message_type=message_type, payload=payload, timestamp=ts
+    # ------------------------------------------------------------------
+    # Session counters
+    # ------------------------------------------------------------------
+    def _record_write(
+        self,
+        session_id: UUID,
+        packets: int,
+        byte_count: int,
+        ts: datetime,
+        file_size: int,
+    ) -> None:
+        with self._pending_lock:
+            stats = self._pending.get(session_id)
+            if stats is None:
+                stats = self._pending[session_id] = _PendingStats()
+            stats.packets += packets
+            stats.byte_count += byte_count
+            stats.last_packet_at = ts
+            stats.file_size = file_size
+            due = stats.packets >= self._flush_packets
+            self._ensure_flusher()
+
+        if due:
+            self.flush_stats(session_id)
+
+    def _ensure_flusher(self) -> None:
+        # Called with _pending_lock held.
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="capture-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(self._flush_interval)
+            cutoff = time.monotonic() - self._flush_interval
+            with self._pending_lock:
+                due = [
+                    session_id
+                    for session_id, stats in self._pending.items()
+                    if stats.opened_at <= cutoff
+                ]
+            for session_id in due:
+                try:
+                    self.flush_stats(session_id)
+                except Exception as exc:  # pragma: no cover - defensive
+                    logging.exception(
+                        "Failed to flush capture counters for %s: %s", session_id, exc
                     )
-            except Exception as exc:  # pragma: no cover - defensive
-                logging.exception("Capture %s write failed: %s", active.session_id, exc)
-                self._handle_capture_error(active.session_id, str(exc))
-                continue
-
-            bytes_written = active.writer.bytes_written
-            CaptureSession.objects.filter(id=active.session_id).update(
-                packet_count=F("packet_count") + 1,
-                byte_count=F("byte_count") + total_bytes,
-                last_packet_at=ts,
-                file_size=bytes_written,
-            )
+            for active in self._active_snapshot.values():
+                try:
+                    active.writer.flush()
+                except Exception as exc:  # pragma: no cover - defensive
+                    logging.exception(
+                        "Failed to flush capture writer %s: %s", active.session_id, exc
+                    )
+
+    def flush_stats(self, session_id: Optional[UUID] = None) -> None:
+        """Write accumulated packet counters for one or all sessions."""
+        with self._pending_lock:
+            if session_id is None:
+                batch, self._pending = self._pending, {}
+            else:
+                stats = self._pending.pop(session_id, None)
+                batch = {session_id: stats} if stats is not None else {}
 
-            if self._max_bytes is not None and bytes_written >= self._max_bytes:
-                limit_exceeded.append(active)
+        # The flusher thread and the writer's per-batch flush can race, so the
+        # absolute columns only ever move forward.
+        unwritten = dict(batch)
+        try:
+            for pending_id, stats in batch.items():
+                last_packet_at = Value(stats.last_packet_at)
+                CaptureSession.objects.filter(id=pending_id).update(
+                    packet_count=F("packet_count") + stats.packets,
+                    byte_count=F("byte_count") + stats.byte_count,
+                    last_packet_at=Greatest(
+                        Coalesce(F("last_packet_at"), last_packet_at), last_packet_at
+                    ),
+                    file_size=Greatest(F("file_size"), Value(stats.file_size)),
+                )
+                del unwritten[pending_id]
+        except Exception:
+            self._restore_stats(unwritten)
+            raise
 
-        if limit_exceeded:
-            seen: set[UUID] = set()
-            for active in limit_exceeded:
-                if active.session_id in seen:
+    def _restore_stats(self, batch: Dict[UUID, _PendingStats]) -> None:
+        """Merge counters from a failed flush back in so the next one retries them."""
+        with self._pending_lock:
+            for session_id, stats in batch.items():
+                current = self._pending.get(session_id)
+                if current is None:
+                    self._pending[session_id] = stats
                     continue
-                seen.add(active.session_id)
-                self._handle_size_limit(active)
+                current.packets += stats.packets
+                current.byte_count += stats.byte_count
+                current.file_size = max(current.file_size, stats.file_size)
+                current.opened_at = min(current.opened_at, stats.opened_at)
+                if stats.last_packet_at is not None and (
+                    current.last_packet_at is None
+                    or stats.last_packet_at > current.last_packet_at
+                ):
+                    current.last_packet_at = stats.last_packet_at
+
+    def _discard_stats(self, session_id: Optional[UUID] = None) -> None:
+        with self._pending_lock:
+            if session_id is None:
+                self._pending.clear()
+            else:
+                self._pending.pop(session_id, None)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -615,22 +992,13 @@ class CaptureService:
                 to_node_num = getattr(mesh_packet, "to", None)
                 target_node = None
                 if to_node_num is not None:
-                    from ..models.node_models import (  # Local import to avoid circular at module load
-                        Node,
-                    )
-
-                    target_node = Node.objects.filter(node_num=int(to_node_num)).first()
+                    target_node = self._pki_target_node(int(to_node_num))
 
                 if target_node is not None:
                     result = self._pki_service.decrypt_packet(mesh_packet, target_node)
                     if result.success and result.plaintext:
-                        data_message = mesh_pb2.Data()
+                        data_message = _scratch_message(mesh_pb2.Data)
                         data_message.ParseFromString(result.plaintext)
-                        if (
-                            getattr(data_message, "ByteSize", None)
-                            and data_message.ByteSize() == 0
-                        ):
-                            return None
                         return data_message
                     if result.reason:
                         logger.debug(
@@ -643,51 +1011,100 @@ class CaptureService:
             except Exception as exc:  # pragma: no cover - defensive
                 logger.exception("PKI decrypt failed during capture ingest: %s", exc)
 
-        key: Optional[str] = None
-        if channel_id:
-            channel = Channel.objects.filter(channel_id=channel_id).first()
-            if channel and channel.psk:
-                key = channel.psk
-
+        key = self._channel_psk(channel_id) if channel_id else None
         if key is None:
             key = "AQ=="
 
-        payload = decrypt_packet(mesh_packet, key)
-        if (
-            payload is not None
-            and getattr(payload, "ByteSize", None)
-            and payload.ByteSize() == 0
-        ):
-            return None
-        return payload
+        # CTR decryption keeps the ciphertext length, so a non-empty
+        # ``encrypted`` field never yields an empty Data message here.
+        return decrypt_packet(mesh_packet, key)
 
-    def _extract_payloads_from_data(
-        self,
-        data_message: mesh_pb2.Data,
-    ) -> Tuple[Optional[bytes], list[Tuple[str, bytes]]]:
-        serialized_data: Optional[bytes] = None
-        nested_payloads: list[Tuple[str, bytes]] = []
+    def _channel_psk(self, channel_id: str) -> Optional[str]:
+        now = time.monotonic()
+        hit, cached = _cached_decrypt_key(self._psk_cache, channel_id, now)
+        if hit:
+            return cached
 
-        serialize_method = getattr(data_message, "SerializeToString", None)
-        if callable(serialize_method):
-            try:
-                serialized_candidate = data_message.SerializeToString()
-                if serialized_candidate:
-                    serialized_data = serialized_candidate
-            except Exception as exc:  # pragma: no cover - defensive
-                logging.exception(
-                    "Failed to serialize Data payload for capture: %s", exc
-                )
+        psk = (
+            Channel.objects.filter(channel_id=channel_id)
+            .values_list("psk", flat=True)
+            .first()
+        )
+        psk = psk or None
+        _remember_decrypt_key(self._psk_cache, channel_id, psk, now)
+        return psk
+
+    def _pki_target_node(self, node_num: int) -> Optional["Node"]:
+        now = time.monotonic()
+        hit, cached = _cached_decrypt_key(self._pki_node_cache, node_num, now)
+        if hit:
+            return cached
+
+        from ..models.node_models import (  # Local import to avoid circular at module load
+            Node,
+        )
+
+        # PKIService only reads the private key of the target node.
+        node = (
+            Node.objects.filter(node_num=node_num)
+            .only("id", "node_num", "private_key")
+            .first()
+        )
+        _remember_decrypt_key(self._pki_node_cache, node_num, node, now)
+        return node
+
+    def _decode_envelope(
+        self, raw_payload: bytes
+    ) -> Optional[Tuple[bytes, Optional[bytes], List[Tuple[str, bytes]]]]:
+        """Split a ServiceEnvelope into the byte blobs written to captures.
+
+        Returns ``(mesh_payload, data_payload, extra_payloads)``, or None when
+        there is nothing to write.
+        """
+        try:
+            envelope = _scratch_message(mqtt_pb2.ServiceEnvelope)
+            envelope.ParseFromString(raw_payload)
+        except Exception as exc:
+            logging.exception("Failed to parse ServiceEnvelope for capture: %s", exc)
+            return None
 
-        payload_bytes = getattr(data_message, "payload", None)
-        portnum = getattr(data_message, "portnum", None)
+        mesh_packet = envelope.packet
+        # Serialize once: an empty encoding doubles as the emptiness check.
+        mesh_payload = mesh_packet.SerializeToString()
+        if not mesh_payload:
+            logging.debug(
+                "ServiceEnvelope contained empty MeshPacket; skipping capture write"
+            )
+            return None
 
-        if payload_bytes and portnum is not None:
-            nested_payloads.extend(
-                self._decode_port_payloads(int(portnum), bytes(payload_bytes))
+        if mesh_packet.HasField("decoded"):
+            data_message: Optional[mesh_pb2.Data] = mesh_packet.decoded
+        else:
+            data_message = self._decrypt_encrypted_payload(
+                mesh_packet, channel_id=envelope.channel_id
             )
+        if data_message is None:
+            return mesh_payload, None, []
 
-        return serialized_data, nested_payloads
+        data_payload, extra_payloads = self._extract_payloads_from_data(data_message)
+        return mesh_payload, data_payload, extra_payloads
+
+    def _extract_payloads_from_data(
+        self,
+        data_message: mesh_pb2.Data,
+    ) -> Tuple[Optional[bytes], List[Tuple[str, bytes]]]:
+        try:
+            serialized_data = data_message.SerializeToString() or None
+        except Exception as exc:  # pragma: no cover - defensive
+            logging.exception("Failed to serialize Data payload for capture: %s", exc)
+            serialized_data = None
+
+        payload_bytes = data_message.payload
+        if not payload_bytes:
+            return serialized_data, []
+        return serialized_data, self._decode_port_payloads(
+            data_message.portnum, _as_bytes(payload_bytes)
+        )
 
     def _decode_port_payloads(
         self, portnum: int, payload: bytes
@@ -696,25 +1113,21 @@ class CaptureService:
         if not payload:
             return outputs
 
-        if portnum == portnums_pb2.TEXT_MESSAGE_APP:
+        if portnum == _TEXT_MESSAGE_APP:
             outputs.append(("meshtastic.TextMessage", payload))
             return outputs
 
-        if portnum == portnums_pb2.TEXT_MESSAGE_COMPRESSED_APP:
+        if portnum == _TEXT_MESSAGE_COMPRESSED_APP:
             try:
                 compressed = mesh_pb2.Compressed()
                 compressed.ParseFromString(payload)
-                outputs.append(
-                    (
-                        mesh_pb2.Compressed.DESCRIPTOR.full_name,
-                        compressed.SerializeToString(),
-                    )
-                )
-                inner_payload = bytes(compressed.data)
-                try:
-                    inner_payload = zlib.decompress(inner_payload)
-                except zlib.error:
-                    pass
+                outputs.append((_COMPRESSED_TYPE, compressed.SerializeToString()))
+                inner_payload = _as_bytes(compressed.data)
+                if inner_payload[:2] in _ZLIB_HEADERS:
+                    try:
+                        inner_payload = zlib.decompress(inner_payload)
+                    except zlib.error:
+                        pass
                 inner_port = int(getattr(compressed, "portnum", 0) or 0)
                 if inner_port:
                     outputs.extend(
@@ -729,33 +1142,32 @@ class CaptureService:
                 outputs.append((self._port_label(portnum), payload))
             return outputs
 
-        proto_classes = _PORT_PROTO_HINTS.get(portnum, ())
-        for proto_cls in proto_classes:
-            try:
-                nested_proto = proto_cls()
-                nested_proto.ParseFromString(payload)
-                byte_size = (
-                    nested_proto.ByteSize()
-                    if hasattr(nested_proto, "ByteSize")
-                    else len(payload)
-                )
-                if byte_size == 0:
+        candidates = _PORT_PROTO_HINTS_RESOLVED.get(portnum)
+        if candidates:
+            for proto_cls, full_name in candidates:
+                try:
+                    nested_proto = _scratch_message(proto_cls)
+                    nested_proto.ParseFromString(payload)
+                    serialized = nested_proto.SerializeToString()
+                except DecodeError as exc:
+                    logging.debug(
+                        "Failed to decode payload for portnum %s as %s: %s",
+                        portnum,
+                        full_name,
+                        exc,
+                    )
                     continue
-                outputs.append(
-                    (
-                        nested_proto.DESCRIPTOR.full_name,
-                        nested_proto.SerializeToString(),
+                except Exception as exc:  # pragma: no cover - defensive
+                    logging.debug(
+                        "Failed to decode payload for portnum %s as %s: %s",
+                        portnum,
+                        full_name,
+                        exc,
                     )
-                )
+                    break
+                if serialized:
+                    outputs.append((full_name, serialized))
                 break
-            except Exception as exc:  # pragma: no cover - defensive
-                logging.debug(
-                    "Failed to decode payload for portnum %s using %s: %s",
-                    portnum,
-                    getattr(proto_cls, "__name__", str(proto_cls)),
-                    exc,
-                )
-                continue
 
         if not outputs:
             outputs.append((self._port_label(portnum), payload))
@@ -764,11 +1176,10 @@ class CaptureService:
 
     @staticmethod
     def _port_label(portnum: int) -> str:
-        try:
-            name = portnums_pb2.PortNum.Name(portnum)  # type: ignore[arg-type]
-        except ValueError:
-            name = f"UNKNOWN_{portnum}"
-        return f"meshtastic.port.{name}"
+        label = _PORT_LABELS.get(portnum)
+        if label is None:
+            return f"meshtastic.port.UNKNOWN_{portnum}"
+        return label
 
     def _handle_size_limit(self, active: _ActiveCapture) -> None:
         if self._max_bytes is None:
@@ -780,8 +1191,9 @@ class CaptureService:
             self._max_bytes,
         )
 
-        with self._lock:
-            current = self._active.pop(active.session_id, None)
+        current = self._pop_active(active.session_id)
+        self._stop_worker(current)
+        self.flush_stats(active.session_id)
 
         if current is None:
             current = active
@@ -818,23 +1230,38 @@ class CaptureService:
         )
 
     def _handle_capture_error(self, session_id: UUID, message: str) -> None:
-        with self._lock:
-            active = self._active.pop(session_id, None)
+        active = self._pop_active(session_id)
+        self._stop_worker(active)
+        self.flush_stats(session_id)
         if active:
             try:
                 active.writer.close()
             except Exception:  # pragma: no cover - defensive
                 pass
-        CaptureSession.objects.filter(id=session_id).update(
-            status=CaptureSession.Status.ERROR,
-            ended_at=timezone.now(),
-        )
-        session = CaptureSession.objects.filter(id=session_id).first()
-        if session:
-            notes = session.notes or {}
-            notes["error"] = message
-            session.notes = notes  # type: ignore[assignment]
-            session.save(update_fields=["notes"])
+        sessions = CaptureSession.objects.filter(id=session_id)
+        ended_at = timezone.now()
+        if connection.vendor == "postgresql":
+            # One UPDATE that also merges the message into ``notes`` server-side.
+            sessions.update(
+                status=CaptureSession.Status.ERROR,
+                ended_at=ended_at,
+                notes=Func(
+                    Coalesce(F("notes"), Value({}, output_field=JSONField())),
+                    Value("{error}"),
+                    Value(message, output_field=JSONField()),
+                    function="jsonb_set",
+                    output_field=JSONField(),
+                ),
+            )
+        else:
+            with transaction.atomic():
+                notes = sessions.select_for_update().values_list("notes", flat=True)
+                for current in notes:
+                    sessions.update(
+                        status=CaptureSession.Status.ERROR,
+                        ended_at=ended_at,
+                        notes={**(current or {}), "error": message},
+                    )
         logging.error("Capture %s moved to ERROR: %s", session_id, message)
 
     def get_full_path(self, session: CaptureSession) -> Path:
@@ -862,11 +1289,10 @@ class CaptureService:
         self._close_active_writer(active)
 
         path = self.get_full_path(session)
-        if path.exists():
-            try:
-                path.unlink()
-            except Exception as exc:  # pragma: no cover - defensive
-                logging.exception("Failed to delete capture file %s: %s", path, exc)
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as exc:  # pragma: no cover - defensive
+            logging.exception("Failed to delete capture file %s: %s", path, exc)
 
         session_id = session.id
         session.delete()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
 
+from django.conf import settings
 from django.db import transaction
 from django.db.models import QuerySet
 from django.utils import timezone
@@ -11,6 +14,107 @@ from ..models import KeepaliveConfig, Node, NodePresenceHistory
 
 logger = logging.getLogger(__name__)
 
+# Longest time a remembered schedule may skip the config lookup. Config edits
+# come from the web process, so this also bounds how late they are noticed.
+SCHEDULE_CACHE_SECONDS = 5.0
+
+# Presence events written per bulk insert (and rows streamed per round trip)
+# while sweeping nodes that just went offline. Starts at
+# KEEPALIVE_HISTORY_BATCH_SIZE, then doubles after fast full batches and halves
+# after slow ones, within the bounds below.
+MIN_HISTORY_BATCH_SIZE = 100
+MAX_HISTORY_BATCH_SIZE = 10000
+FAST_HISTORY_INSERT_SECONDS = 0.05
+SLOW_HISTORY_INSERT_SECONDS = 0.5
+
+# While sweeps find nothing, the check interval is stretched by this factor
+# per idle run, up to the cap; the first transition resets it. Nodes are never
+# missed, since each sweep covers everything since the previous run.
+IDLE_BACKOFF_FACTOR = 1.5
+MAX_IDLE_MULTIPLIER = 8.0
+
+_PROBE_PAYLOAD_TYPES = frozenset(
+    {
+        KeepaliveConfig.PayloadTypes.REACHABILITY,
+        KeepaliveConfig.PayloadTypes.TRACEROUTE,
+    }
+)
+_VIRTUAL_ONLY = KeepaliveConfig.Scope.VIRTUAL_ONLY
+_SELECTED = KeepaliveConfig.Scope.SELECTED
+
+
+class _Schedule(NamedTuple):
+    enabled: bool
+    next_due: Optional[datetime]
+    expires_at: float
+
+
+# One keepalive task runs per tick with a fresh service, so the schedule seen
+# by the last run is kept per process.
+_schedule: Optional[_Schedule] = None
+_idle_multiplier = 1.0
+_history_batch_size: Optional[int] = None
+
+
+def clear_schedule_cache() -> None:
+    global _schedule, _idle_multiplier
+    _schedule = None
+    _idle_multiplier = 1.0
+
+
+def _get_history_batch_size() -> int:
+    global _history_batch_size
+    if _history_batch_size is None:
+        configured = int(getattr(settings, "KEEPALIVE_HISTORY_BATCH_SIZE", 2000))
+        _history_batch_size = min(
+            max(configured, MIN_HISTORY_BATCH_SIZE), MAX_HISTORY_BATCH_SIZE
+        )
+    return _history_batch_size
+
+
+def _write_history(events: list[NodePresenceHistory]) -> None:
+    global _history_batch_size
+    batch_size = _get_history_batch_size()
+    started = time.perf_counter()
+    NodePresenceHistory.objects.bulk_create(events)
+    elapsed = time.perf_counter() - started
+    # A short tail batch says little about how a full one would fare.
+    if len(events) < batch_size:
+        return
+    if elapsed < FAST_HISTORY_INSERT_SECONDS:
+        _history_batch_size = min(batch_size * 2, MAX_HISTORY_BATCH_SIZE)
+    elif elapsed > SLOW_HISTORY_INSERT_SECONDS:
+        _history_batch_size = max(batch_size // 2, MIN_HISTORY_BATCH_SIZE)
+
+
+def _record_sweep(transitions: int) -> None:
+    global _idle_multiplier
+    if transitions:
+        _idle_multiplier = 1.0
+    else:
+        _idle_multiplier = min(
+            _idle_multiplier * IDLE_BACKOFF_FACTOR, MAX_IDLE_MULTIPLIER
+        )
+
+
+def _remember_schedule(
+    enabled: bool, next_due: Optional[datetime], check_interval: Optional[int] = None
+) -> None:
+    global _schedule
+    ttl = SCHEDULE_CACHE_SECONDS
+    if check_interval is not None:
+        ttl = min(float(check_interval), ttl)
+    _schedule = _Schedule(enabled, next_due, time.monotonic() + ttl)
+
+
+def _skip_from_cache(now: datetime) -> bool:
+    schedule = _schedule
+    if schedule is None or time.monotonic() >= schedule.expires_at:
+        return False
+    if not schedule.enabled:
+        return True
+    return schedule.next_due is not None and now < schedule.next_due
+
 
 class KeepaliveService:
     """Service that detects nodes transitioning from online to offline."""
@@ -24,31 +128,38 @@ class KeepaliveService:
 
     def _scoped_nodes(self, config: KeepaliveConfig) -> QuerySet[Node]:
         qs = Node.objects.all()
-        if config.scope == KeepaliveConfig.Scope.VIRTUAL_ONLY:
+        if config.scope == _VIRTUAL_ONLY:
             return qs.filter(is_virtual=True)
-        if config.scope == KeepaliveConfig.Scope.SELECTED:
-            selected_ids = list(config.selected_nodes.values_list("id", flat=True))
-            if not selected_ids:
-                return qs.none()
-            return qs.filter(id__in=selected_ids)
+        if config.scope == _SELECTED:
+            # One JOIN through the M2M table instead of an IN subquery.
+            return config.selected_nodes.all()
         return qs
 
     def run_check(self) -> int:
         """Evaluate nodes that just transitioned to offline. Returns count."""
         now = timezone.now()
+        if _skip_from_cache(now):
+            return 0
 
         with transaction.atomic():
-            config = KeepaliveConfig.objects.select_for_update().filter(pk=1).first()
+            # A concurrent worker holding the row is already running this
+            # check; skip instead of queueing behind it.
+            config = (
+                KeepaliveConfig.objects.select_for_update(skip_locked=True)
+                .filter(pk=1)
+                .first()
+            )
             if not config:
+                if KeepaliveConfig.objects.filter(pk=1).exists():
+                    return 0
                 config = KeepaliveConfig.get_solo()
 
             if not config.enabled:
+                clear_schedule_cache()
+                _remember_schedule(False, None)
                 return 0
 
-            if config.payload_type not in (
-                KeepaliveConfig.PayloadTypes.REACHABILITY,
-                KeepaliveConfig.PayloadTypes.TRACEROUTE,
-            ):
+            if config.payload_type not in _PROBE_PAYLOAD_TYPES:
                 config.last_run_at = now
                 config.last_error_message = "Invalid keepalive payload type"
                 config.save(update_fields=["last_run_at", "last_error_message"])  # type: ignore[arg-type]
@@ -72,8 +183,14 @@ class KeepaliveService:
             )
 
             if config.last_run_at is not None:
+                effective_interval = check_interval * _idle_multiplier
                 elapsed = (now - config.last_run_at).total_seconds()
-                if elapsed < check_interval:
+                if elapsed < effective_interval:
+                    _remember_schedule(
+                        True,
+                        config.last_run_at + timedelta(seconds=effective_interval),
+                        check_interval,
+                    )
                     return 0
 
             last_run_at = config.last_run_at or (
@@ -88,90 +205,95 @@ class KeepaliveService:
                 config.save(update_fields=["last_run_at", "last_error_message"])  # type: ignore[arg-type]
                 return 0
 
-            node_qs = self._scoped_nodes(config)
-            transitioned = list(
-                node_qs.filter(
-                    last_seen__lte=current_cutoff, last_seen__gt=previous_cutoff
-                )
+            # Stream (pk, Meshtastic node_id, last_seen) rows so a mass offline
+            # burst never holds more than one chunk of events in memory.
+            rows = (
+                self._scoped_nodes(config)
+                .filter(last_seen__lte=current_cutoff, last_seen__gt=previous_cutoff)
+                .values_list("id", "node_id", "last_seen")
+                .iterator(chunk_size=_get_history_batch_size())
             )
-
-            events = [
-                NodePresenceHistory(
-                    node=node,
-                    last_seen=node.last_seen,
-                    offline_at=current_cutoff,
-                    reason="offline_threshold",
+            transitioned: list[str] = []
+            events: list[NodePresenceHistory] = []
+            for node_pk, node_id, last_seen in rows:
+                transitioned.append(node_id)
+                events.append(
+                    NodePresenceHistory(
+                        node_id=node_pk,
+                        last_seen=last_seen,
+                        offline_at=current_cutoff,
+                        reason="offline_threshold",
+                    )
                 )
-                for node in transitioned
-            ]
-
+                if len(events) >= _get_history_batch_size():
+                    _write_history(events)
+                    events = []
             if events:
-                NodePresenceHistory.objects.bulk_create(events, batch_size=500)
-
-            if transitioned:
-                try:
-                    from ..services.service_manager import ServiceManager
-
-                    service_manager = ServiceManager.get_instance()
-                    publisher_service = service_manager.initialize_publisher_service()
-
-                    publisher = None
-                    base_topic = None
-                    if config.interface:
-                        publisher, base_topic, err = (
-                            service_manager.resolve_publish_context(config.interface.id)
-                        )
-                        if err:
-                            config.last_run_at = now
-                            config.last_error_message = err
-                            config.save(update_fields=["last_run_at", "last_error_message"])  # type: ignore[arg-type]
-                            return 0
-
-                    for node in transitioned:
-                        if (
-                            config.payload_type
-                            == KeepaliveConfig.PayloadTypes.TRACEROUTE
-                        ):
-                            publisher_service.publish_traceroute(
-                                from_node=config.from_node,
-                                to_node=node.node_id,
-                                channel_name=config.channel_name,
-                                channel_aes_key=config.channel_key,
-                                hop_limit=config.hop_limit,
-                                hop_start=config.hop_start,
-                                want_ack=True,
-                                gateway_node=config.gateway_node or None,
-                                publisher=publisher,
-                                base_topic=base_topic,
-                                record_pending=True,
-                                priority="ACK",
-                            )
-                        else:
-                            publisher_service.publish_reachability_probe(
-                                from_node=config.from_node,
-                                to_node=node.node_id,
-                                channel_name=config.channel_name,
-                                channel_aes_key=config.channel_key,
-                                hop_limit=config.hop_limit,
-                                hop_start=config.hop_start,
-                                gateway_node=config.gateway_node or None,
-                                publisher=publisher,
-                                base_topic=base_topic,
-                                priority="ACK",
-                            )
-                except Exception as exc:
-                    logger.exception("Keepalive publishing failed")
-                    config.last_run_at = now
-                    config.last_error_message = str(exc)
-                    config.save(update_fields=["last_run_at", "last_error_message"])  # type: ignore[arg-type]
-                    return len(transitioned)
+                _write_history(events)
 
+            # Claim this run before releasing the config row lock; probes go
+            # out after commit so MQTT I/O never holds the lock.
             config.last_run_at = now
             config.last_error_message = ""
             config.save(update_fields=["last_run_at", "last_error_message"])  # type: ignore[arg-type]
-
-        if transitioned:
-            logger.info(
-                "Keepalive recorded %d offline transition(s)", len(transitioned)
+            _record_sweep(len(transitioned))
+            _remember_schedule(
+                True,
+                now + timedelta(seconds=check_interval * _idle_multiplier),
+                check_interval,
             )
+
+        if not transitioned:
+            return 0
+
+        logger.info("Keepalive recorded %d offline transition(s)", len(transitioned))
+        try:
+            error = self._publish_probes(config, transitioned)
+        except Exception as exc:
+            logger.exception("Keepalive publishing failed")
+            self._record_error(config, str(exc))
+            return len(transitioned)
+        if error:
+            self._record_error(config, error)
+            return 0
         return len(transitioned)
+
+    def _publish_probes(self, config: KeepaliveConfig, to_nodes: list[str]) -> str:
+        """Send the configured probe to every node; return an error message, if any."""
+        from ..services.service_manager import ServiceManager
+
+        service_manager = ServiceManager.get_instance()
+        publisher_service = service_manager.initialize_publisher_service()
+
+        publisher = None
+        base_topic = None
+        if config.interface_id:
+            publisher, base_topic, err = service_manager.resolve_publish_context(
+                config.interface_id
+            )
+            if err:
+                return err
+
+        publish_kwargs = {
+            "from_node": config.from_node,
+            "to_nodes": to_nodes,
+            "channel_name": config.channel_name,
+            "channel_aes_key": config.channel_key,
+            "hop_limit": config.hop_limit,
+            "hop_start": config.hop_start,
+            "gateway_node": config.gateway_node or None,
+            "publisher": publisher,
+            "base_topic": base_topic,
+            "priority": "ACK",
+        }
+        if config.payload_type == KeepaliveConfig.PayloadTypes.TRACEROUTE:
+            publisher_service.publish_traceroute_bulk(
+                want_ack=True, record_pending=True, **publish_kwargs
+            )
+        else:
+            publisher_service.publish_reachability_probe_bulk(**publish_kwargs)
+        return ""
+
+    @staticmethod
+    def _record_error(config: KeepaliveConfig, message: str) -> None:
+        KeepaliveConfig.objects.filter(pk=config.pk).update(last_error_message=message)
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import logging
+import operator
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 from django.utils import timezone
 
@@ -21,6 +25,29 @@ from ..models import Node
 
 logger = logging.getLogger(__name__)
 
+# MeshPacket fields read by decrypt_packet, fetched in one call.
+_packet_metadata = operator.attrgetter("from", "id", "to", "public_key")
+
+# Sender public keys by node number, shared by every PKIService in the
+# process. Node signals drop entries on save/delete; the TTLs bound staleness
+# for keys changed elsewhere. Misses expire sooner so new keys show up fast.
+MAX_CACHED_PUBLIC_KEYS = 4096
+PUBLIC_KEY_TTL_SECONDS = 300.0
+MISSING_PUBLIC_KEY_TTL_SECONDS = 30.0
+
+_public_keys: "OrderedDict[int, Tuple[Optional[bytes], float]]" = OrderedDict()
+_public_keys_lock = threading.Lock()
+
+
+def forget_public_key(node_num: int) -> None:
+    with _public_keys_lock:
+        _public_keys.pop(node_num, None)
+
+
+def clear_public_key_cache() -> None:
+    with _public_keys_lock:
+        _public_keys.clear()
+
 
 @dataclass
 class PKIDecryptionResult:
@@ -59,12 +86,7 @@ class PKIService:
     def decrypt_packet(self, packet, target_node: Node) -> PKIDecryptionResult:
         """Attempt to decrypt a PKI encrypted packet."""
 
-        if not self.can_decrypt_for_node(target_node):
-            return PKIDecryptionResult(
-                success=False,
-                reason="Private key not available for target node",
-            )
-
+        # Same test as can_decrypt_for_node, reading the key only once.
         private_key_material = target_node.private_key
         if not private_key_material:
             return PKIDecryptionResult(
@@ -77,22 +99,37 @@ class PKIService:
                 success=False, reason="Packet missing encrypted payload"
             )
 
-        encrypted_payload = bytes(encrypted_section)
-        if len(encrypted_payload) <= 12:
+        # Check the length before copying; short payloads are common in
+        # malformed traffic and never decrypt.
+        if len(encrypted_section) <= 12:
             return PKIDecryptionResult(
                 success=False, reason="Encrypted payload too short for PKI decryption"
             )
 
-        from_node_num = getattr(packet, "from", None)
-        packet_id = getattr(packet, "id", None)
+        try:
+            from_node_num, packet_id, to_node_num, raw_public_key = _packet_metadata(
+                packet
+            )
+        except AttributeError:
+            # Not a MeshPacket; fall back to lenient per-field lookups.
+            from_node_num = getattr(packet, "from", None)
+            packet_id = getattr(packet, "id", None)
+            to_node_num = getattr(packet, "to", 0)
+            raw_public_key = getattr(packet, "public_key", b"")
         if from_node_num is None or packet_id is None:
             return PKIDecryptionResult(
                 success=False, reason="Packet metadata incomplete for PKI decryption"
             )
 
+        # Protobuf bytes fields already hand out immutable bytes.
+        encrypted_payload = (
+            encrypted_section
+            if isinstance(encrypted_section, bytes)
+            else bytes(encrypted_section)
+        )
+
         remote_public_key_bytes: Optional[bytes] = None
         try:
-            raw_public_key = getattr(packet, "public_key", b"")
             if raw_public_key:
                 remote_public_key_bytes = load_public_key_bytes(raw_public_key)
             else:
@@ -113,7 +150,7 @@ class PKIService:
         inputs = PKIDecryptionInputs(
             encrypted_payload=encrypted_payload,
             from_node_num=int(from_node_num),
-            to_node_num=int(getattr(packet, "to", 0) or 0),
+            to_node_num=int(to_node_num or 0),
             packet_id=int(packet_id),
             public_key=remote_public_key_bytes,
         )
@@ -146,6 +183,27 @@ class PKIService:
         return PKIDecryptionResult(success=True, plaintext=plaintext)
 
     def _resolve_remote_public_key(self, from_node_num: int) -> Optional[bytes]:
+        now = time.monotonic()
+        with _public_keys_lock:
+            cached = _public_keys.get(from_node_num)
+            if cached is not None and now < cached[1]:
+                _public_keys.move_to_end(from_node_num)
+                return cached[0]
+
+        public_key = self._load_remote_public_key(from_node_num)
+        ttl = (
+            PUBLIC_KEY_TTL_SECONDS
+            if public_key is not None
+            else MISSING_PUBLIC_KEY_TTL_SECONDS
+        )
+        with _public_keys_lock:
+            _public_keys[from_node_num] = (public_key, now + ttl)
+            _public_keys.move_to_end(from_node_num)
+            while len(_public_keys) > MAX_CACHED_PUBLIC_KEYS:
+                _public_keys.popitem(last=False)
+        return public_key
+
+    def _load_remote_public_key(self, from_node_num: int) -> Optional[bytes]:
         remote_node = (
             Node.objects.filter(node_num=from_node_num).only("public_key").first()
         )
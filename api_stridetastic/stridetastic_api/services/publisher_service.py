@@ -1,10 +1,24 @@
 import logging
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from threading import RLock
-from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol, Sequence, Tuple, Union
+from threading import Lock, RLock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from django.conf import settings  # type: ignore[import]
+from django.db import transaction  # type: ignore[import]
 from django.utils import timezone  # type: ignore[import]
 from meshtastic.protobuf import portnums_pb2
 
@@ -31,6 +45,24 @@ if TYPE_CHECKING:  # pragma: no cover - type checking only
     from ..models.publisher_models import PublisherPeriodicJob
 
 
+# Each publish blocks until the broker acknowledges it, so bulk probes fan
+# out over a small shared pool instead of waiting out every round trip in turn.
+PUBLISH_MAX_WORKERS = 8
+
+_publish_pool: Optional[ThreadPoolExecutor] = None
+_publish_pool_lock = Lock()
+
+
+def _get_publish_pool() -> ThreadPoolExecutor:
+    global _publish_pool
+    with _publish_pool_lock:
+        if _publish_pool is None:
+            _publish_pool = ThreadPoolExecutor(
+                max_workers=PUBLISH_MAX_WORKERS, thread_name_prefix="publish"
+            )
+        return _publish_pool
+
+
 class PublishableInterface(Protocol):
     """Protocol defining the interface needed for publishing messages"""
 
@@ -53,6 +85,7 @@ class PublisherService:
         pki_service: Optional[PKIService] = None,
     ):
         self.__global_message_id = random.getrandbits(32)
+        self._message_id_lock = Lock()
         self._publisher = publisher
         self._reactive_lock = RLock()
         self._reactive_enabled = False
@@ -76,8 +109,59 @@ class PublisherService:
         self._pki_service = pki_service
 
     def _get_global_message_id(self):
-        self.__global_message_id += 1
-        return self.__global_message_id
+        with self._message_id_lock:
+            self.__global_message_id += 1
+            return self.__global_message_id
+
+    def _send_to_each(
+        self,
+        send: Callable[..., bool],
+        probes: Sequence[Tuple[str, int]],
+        **kwargs: Any,
+    ) -> List[Tuple[str, int]]:
+        """Call `send` for every (node, message id) pair, concurrently; return the pairs sent."""
+
+        def send_one(probe: Tuple[str, int]) -> bool:
+            to_node, message_id = probe
+            return send(to_node=to_node, message_id=message_id, **kwargs)
+
+        if len(probes) > 1:
+            published = list(_get_publish_pool().map(send_one, probes))
+        else:
+            published = [send_one(probe) for probe in probes]
+        return [probe for probe, sent in zip(probes, published) if sent]
+
+    def _publish_probes(
+        self,
+        send: Callable[..., bool],
+        to_nodes: Sequence[str],
+        *,
+        record_pending: bool,
+        **kwargs: Any,
+    ) -> List[Tuple[str, int]]:
+        """Publish one probe per node; return the (node, message id) pairs sent.
+
+        Pending rows are written before anything goes out: a reply that lands
+        while the batch is still publishing must find its row, or it is stored
+        as a separate sample and the pending one never resolves.
+        """
+        probes = [(to_node, self._get_global_message_id()) for to_node in to_nodes]
+        previous = self._record_pending_probes(probes) if record_pending else {}
+        try:
+            sent = self._send_to_each(send, probes, **kwargs)
+        except Exception:
+            # Which probes went out is unknown; drop them all.
+            if record_pending:
+                self._discard_pending_probes(probes, previous, keep_nodes=set())
+            raise
+        if record_pending and len(sent) < len(probes):
+            sent_ids = {message_id for _, message_id in sent}
+            self._discard_pending_probes(
+                [probe for probe in probes if probe[1] not in sent_ids],
+                previous,
+                keep_nodes={to_node for to_node, _ in sent},
+            )
+        return sent
 
     def _get_publish_topic(
         self,
@@ -423,7 +507,7 @@ class PublisherService:
 
         first_attempt = data.get("first")
         if isinstance(first_attempt, str):  # defensive, shouldn't happen
-            first_attempt = timezone.now()
+            first_attempt = now
 
         if first_attempt is None or now - first_attempt >= self._attempt_window:
             data["count"] = 1
@@ -704,9 +788,80 @@ class PublisherService:
         priority: Optional[object] = None,
     ) -> Tuple[bool, Optional[int]]:
         """Publish a traceroute packet from `from_node` to `to_node` and optionally record a pending probe."""
+        sent = self._publish_probes(
+            self._send_traceroute,
+            [to_node],
+            record_pending=record_pending,
+            from_node=from_node,
+            channel_name=channel_name,
+            channel_aes_key=channel_aes_key,
+            hop_limit=hop_limit,
+            hop_start=hop_start,
+            want_ack=want_ack,
+            gateway_node=gateway_node,
+            publisher=publisher,
+            base_topic=base_topic,
+            priority=priority,
+        )
+        if not sent:
+            return False, None
+        return True, sent[0][1]
+
+    def publish_traceroute_bulk(
+        self,
+        from_node: str,
+        to_nodes: Sequence[str],
+        channel_name: str,
+        channel_aes_key: str,
+        hop_limit: int = 3,
+        hop_start: int = 3,
+        want_ack: bool = False,
+        gateway_node: Optional[str] = None,
+        publisher: Optional[PublishableInterface] = None,
+        base_topic: Optional[str] = None,
+        record_pending: bool = True,
+        priority: Optional[object] = None,
+    ) -> int:
+        """Publish a traceroute to each of `to_nodes`, recording pending probes in one batch.
+
+        Returns the number of packets published.
+        """
+        sent = self._publish_probes(
+            self._send_traceroute,
+            to_nodes,
+            record_pending=record_pending,
+            from_node=from_node,
+            channel_name=channel_name,
+            channel_aes_key=channel_aes_key,
+            hop_limit=hop_limit,
+            hop_start=hop_start,
+            want_ack=want_ack,
+            gateway_node=gateway_node,
+            publisher=publisher,
+            base_topic=base_topic,
+            priority=priority,
+        )
+        return len(sent)
+
+    def _send_traceroute(
+        self,
+        *,
+        message_id: int,
+        from_node: str,
+        to_node: str,
+        channel_name: str,
+        channel_aes_key: str,
+        hop_limit: int,
+        hop_start: int,
+        want_ack: bool,
+        gateway_node: Optional[str],
+        publisher: Optional[PublishableInterface],
+        base_topic: Optional[str],
+        priority: Optional[object],
+    ) -> bool:
+        """Publish one traceroute request under `message_id`; return whether it went out."""
         logging.info(f"[Publisher] Publishing traceroute from {from_node} to {to_node}")
         data_pb = craft_traceroute()
-        message_id = self._get_global_message_id()
         mesh_protobuf = craft_mesh_packet(
             from_id=from_node,
             to_id=to_node,
@@ -724,28 +879,13 @@ class PublisherService:
             channel_name=channel_name,
             gateway_id=gateway_node,
         )
-        published = self.publish(
+        return self.publish(
             payload=payload,
             gateway_node_id=gateway_node,
             channel_name=channel_name,
             publisher=publisher,
             base_topic=base_topic,
         )
-        if published:
-            if record_pending:
-                target = Node.objects.filter(node_id=to_node).first()
-                if target:
-                    target.latency_reachable = False
-                    target.latency_ms = None
-                    target.save(update_fields=["latency_reachable", "latency_ms"])
-                    NodeLatencyHistory.objects.create(
-                        node=target,
-                        reachable=False,
-                        latency_ms=None,
-                        probe_message_id=message_id,
-                    )
-            return True, message_id
-        return False, None
 
     def publish_reachability_probe(
         self,
@@ -761,9 +901,73 @@ class PublisherService:
         priority: Optional[object] = None,
     ) -> bool:
         """Inject a routing packet that requests an ACK to measure reachability and latency."""
+        sent = self._publish_probes(
+            self._send_reachability_probe,
+            [to_node],
+            record_pending=True,
+            from_node=from_node,
+            channel_name=channel_name,
+            channel_aes_key=channel_aes_key,
+            hop_limit=hop_limit,
+            hop_start=hop_start,
+            gateway_node=gateway_node,
+            publisher=publisher,
+            base_topic=base_topic,
+            priority=priority,
+        )
+        return bool(sent)
+
+    def publish_reachability_probe_bulk(
+        self,
+        from_node: str,
+        to_nodes: Sequence[str],
+        channel_name: str,
+        channel_aes_key: str,
+        hop_limit: int = 3,
+        hop_start: int = 3,
+        gateway_node: Optional[str] = None,
+        publisher: Optional[PublishableInterface] = None,
+        base_topic: Optional[str] = None,
+        priority: Optional[object] = None,
+    ) -> int:
+        """Probe each of `to_nodes` for reachability, recording pending probes in one batch.
+
+        Returns the number of packets published.
+        """
+        sent = self._publish_probes(
+            self._send_reachability_probe,
+            to_nodes,
+            record_pending=True,
+            from_node=from_node,
+            channel_name=channel_name,
+            channel_aes_key=channel_aes_key,
+            hop_limit=hop_limit,
+            hop_start=hop_start,
+            gateway_node=gateway_node,
+            publisher=publisher,
+            base_topic=base_topic,
+            priority=priority,
+        )
+        return len(sent)
+
+    def _send_reachability_probe(
+        self,
+        *,
+        message_id: int,
+        from_node: str,
+        to_node: str,
+        channel_name: str,
+        channel_aes_key: str,
+        hop_limit: int,
+        hop_start: int,
+        gateway_node: Optional[str],
+        publisher: Optional[PublishableInterface],
+        base_topic: Optional[str],
+        priority: Optional[object],
+    ) -> bool:
+        """Publish one reachability probe under `message_id`; return whether it went out."""
         logging.info(f"[Publisher] Reachability probe from {from_node} to {to_node}")
         data_pb = craft_reachability_probe()
-        message_id = self._get_global_message_id()
         mesh_protobuf = craft_mesh_packet(
             from_id=from_node,
             to_id=to_node,
@@ -781,26 +985,81 @@ class PublisherService:
             channel_name=channel_name,
             gateway_id=gateway_node,
         )
-        published = self.publish(
+        return self.publish(
             payload=payload,
             gateway_node_id=gateway_node,
             channel_name=channel_name,
             publisher=publisher,
             base_topic=base_topic,
         )
-        if published:
-            target = Node.objects.filter(node_id=to_node).first()
-            if target:
-                target.latency_reachable = False
-                target.latency_ms = None
-                target.save(update_fields=["latency_reachable", "latency_ms"])
-                NodeLatencyHistory.objects.create(
-                    node=target,
-                    reachable=False,
-                    latency_ms=None,
-                    probe_message_id=message_id,
+
+    def _record_pending_probes(
+        self, probes: Sequence[Tuple[str, int]]
+    ) -> Dict[str, Tuple[int, Optional[bool], Optional[int]]]:
+        """Mark probed nodes unreachable and log a pending latency sample for each probe.
+
+        The matching ACK or traceroute reply later fills in the latency.
+        Returns each known node's (pk, latency_reachable, latency_ms) as they
+        were before, so probes that fail to publish can be rolled back.
+        """
+        if not probes:
+            return {}
+        previous = {
+            node_id: (pk, reachable, latency_ms)
+            for node_id, pk, reachable, latency_ms in Node.objects.filter(
+                node_id__in={to_node for to_node, _ in probes}
+            ).values_list("node_id", "pk", "latency_reachable", "latency_ms")
+        }
+        if not previous:
+            return {}
+        node_pks = {node_id: state[0] for node_id, state in previous.items()}
+        with transaction.atomic():
+            Node.objects.filter(pk__in=node_pks.values()).update(
+                latency_reachable=False, latency_ms=None
+            )
+            NodeLatencyHistory.objects.bulk_create(
+                [
+                    NodeLatencyHistory(
+                        node_id=node_pks[to_node],
+                        reachable=False,
+                        latency_ms=None,
+                        probe_message_id=message_id,
+                    )
+                    for to_node, message_id in probes
+                    if to_node in node_pks
+                ],
+                batch_size=500,
+            )
+        return previous
+
+    def _discard_pending_probes(
+        self,
+        probes: Sequence[Tuple[str, int]],
+        previous: Dict[str, Tuple[int, Optional[bool], Optional[int]]],
+        *,
+        keep_nodes: Set[str],
+    ) -> None:
+        """Undo `_record_pending_probes` for probes that never went out.
+
+        Nodes in `keep_nodes` had another probe published and stay pending.
+        """
+        known = [
+            (to_node, message_id)
+            for to_node, message_id in probes
+            if to_node in previous
+        ]
+        if not known:
+            return
+        with transaction.atomic():
+            NodeLatencyHistory.objects.filter(
+                node_id__in={previous[to_node][0] for to_node, _ in known},
+                probe_message_id__in=[message_id for _, message_id in known],
+            ).delete()
+            for to_node in {to_node for to_node, _ in known} - keep_nodes:
+                pk, reachable, latency_ms = previous[to_node]
+                Node.objects.filter(pk=pk).update(
+                    latency_reachable=reachable, latency_ms=latency_ms
                 )
-        return published
 
     def publish_telemetry(
         self,
@@ -1025,14 +1284,9 @@ class PublisherService:
 
             channel_obj = None
             try:
-                channel_qs = packet_obj.channels.all() if packet_obj else None
-                if channel_qs is not None:
-                    if selected_interface is not None:
-                        channel_obj = channel_qs.filter(
-                            interfaces=selected_interface
-                        ).first()
-                    if channel_obj is None:
-                        channel_obj = channel_qs.first()
+                channel_obj = (
+                    getattr(packet_obj, "channel", None) if packet_obj else None
+                )
             except Exception as exc:  # pragma: no cover - defensive logging
                 logging.debug(
                     f"[Publisher] Failed to resolve channel for reactive traceroute: {exc}"
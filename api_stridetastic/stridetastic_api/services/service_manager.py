@@ -9,6 +9,7 @@ from django.utils import timezone
 from ..interfaces.mqtt_interface import MqttInterface
 from ..interfaces.serial_interface import SerialInterface
 from ..interfaces.tcp_interface import TcpInterface
+from ..mesh.node_cache import warm_node_cache
 from ..models.interface_models import Interface
 from .capture_service import CaptureService
 from .pki_service import PKIService
@@ -342,6 +343,7 @@ class ServiceManager:
     # ---- Initialization entrypoint ----
     def bootstrap(self):
         if self._allow_interface_runtime:
+            logging.info("Node cache warmed with %d node(s)", warm_node_cache())
             self.load_enabled_interfaces()
             self.start_all()
             # Log current known interface state; connections establish on demand per process.
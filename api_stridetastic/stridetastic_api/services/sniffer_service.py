@@ -14,13 +14,28 @@ class SnifferService:
     ):
         self.mqtt_interface = mqtt_interface
         self.serial_config = serial_config
+        self._started = False
 
     def start(self):
+        """Start the configured sniffers; repeated calls are no-ops until stop()."""
+        if self._started:
+            return
         if self.mqtt_interface:
             if not self.mqtt_interface.is_connected():
                 self.mqtt_interface.connect()
-            loop_thread = getattr(self.mqtt_interface.client, "loop_thread", None)
+            # paho keeps its network loop thread on the private ``_thread``;
+            # it reconnects on its own once running.
+            try:
+                loop_thread = self.mqtt_interface.client._thread
+            except AttributeError:
+                loop_thread = None
             if loop_thread is None or not loop_thread.is_alive():
                 self.mqtt_interface.start()
         if self.serial_config:
             run_serial_interface.delay(**self.serial_config)
+        self._started = True
+
+    def stop(self):
+        if self.mqtt_interface:
+            self.mqtt_interface.disconnect()
+        self._started = False
@@ -1,27 +1,44 @@
 from __future__ import annotations
 
-import base64
+import binascii
+import functools
 import hashlib
 import secrets
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from cryptography.hazmat.primitives.asymmetric import x25519
-from cryptography.hazmat.primitives.serialization import (
-    Encoding,
-    NoEncryption,
-    PrivateFormat,
-    PublicFormat,
-)
 from django.db import IntegrityError, transaction
-from django.db.models import Max
+from django.db.models import Exists, Max, OuterRef, Q
 from google.protobuf.descriptor import EnumValueDescriptor
 from meshtastic.protobuf import config_pb2, mesh_pb2
 
 from ..mesh.utils import id_to_num, num_to_mac
 from ..models import Node
 
+_ROLE_ENUM = config_pb2.Config.DeviceConfig.Role  # type: ignore[attr-defined]
+_HARDWARE_MODEL_ENUM = mesh_pb2.HardwareModel  # type: ignore[attr-defined]
+
+# Deleting every valid digit leaves only the offending characters behind.
+_DROP_HEX_LOWER = str.maketrans("", "", "0123456789abcdef")
+_DROP_HEX_UPPER = str.maketrans("", "", "0123456789ABCDEF")
+
+# Node numbers that fit the six MAC octets; larger ones keep num_to_mac's
+# (truncating) behaviour.
+_MAX_MAC_NUM = (1 << 48) - 1
+
+
+def _encode_key(raw: bytes) -> str:
+    """Base64-encode raw key material as stored on ``Node``."""
+    # Same output as base64.b64encode, minus its wrapper and intermediate copy.
+    return binascii.b2a_base64(raw, newline=False).decode("ascii")
+
+
+def _fingerprint(key_material: str) -> str:
+    """SHA-256 of the stored (base64) private key, as shown to operators."""
+    return hashlib.sha256(key_material.encode("ascii")).hexdigest()
+
 
 class VirtualNodeError(Exception):
     """Raised when virtual node lifecycle operations cannot be completed."""
@@ -31,6 +48,7 @@ class VirtualNodeError(Exception):
 class VirtualNodeSecrets:
     public_key: str
     private_key: str
+    fingerprint: Optional[str] = None
 
 
 @dataclass(frozen=True)
@@ -43,12 +61,8 @@ class VirtualNodeIdentity:
 class VirtualNodeService:
     VIRTUAL_NODE_NUM_START = 1_000_000_000
 
-    DEFAULT_ROLE = config_pb2.Config.DeviceConfig.Role.Name(  # type: ignore[attr-defined]
-        config_pb2.Config.DeviceConfig.Role.CLIENT  # type: ignore[attr-defined]
-    )
-    DEFAULT_HARDWARE_MODEL = mesh_pb2.HardwareModel.Name(  # type: ignore[attr-defined]
-        mesh_pb2.HardwareModel.UNSET  # type: ignore[attr-defined]
-    )
+    DEFAULT_ROLE = _ROLE_ENUM.Name(_ROLE_ENUM.CLIENT)
+    DEFAULT_HARDWARE_MODEL = _HARDWARE_MODEL_ENUM.Name(_HARDWARE_MODEL_ENUM.UNSET)
 
     _ALLOWED_FIELDS: Tuple[str, ...] = (
         "short_name",
@@ -69,18 +83,21 @@ class VirtualNodeService:
     )
 
     _MAX_KEY_GENERATION_ATTEMPTS = 32
+    # Candidate node numbers checked per query while looking for a free identity.
+    _IDENTITY_WINDOW = 32
 
     @classmethod
     def create_virtual_node(
         cls, data: Dict[str, object]
     ) -> Tuple[Node, VirtualNodeSecrets]:
-        payload = dict(data)
+        # _sanitize_fields only reads _ALLOWED_FIELDS, which leaves out the
+        # identity keys, so the caller's dict is read without being copied.
         identity = cls._resolve_identity(
-            node_num=payload.pop("node_num", None),
-            node_id=payload.pop("node_id", None),
-            mac_address=payload.pop("mac_address", None),
+            node_num=data.get("node_num"),
+            node_id=data.get("node_id"),
+            mac_address=data.get("mac_address"),
         )
-        fields = cls._sanitize_fields(payload)
+        fields = cls._sanitize_fields(data)
         secrets = cls._generate_key_pair()
 
         try:
@@ -93,11 +110,17 @@ class VirtualNodeService:
                     is_virtual=True,
                     **fields,
                 )
-                cls._store_private_key(node, secrets.private_key)
+                # Freshly generated: uniqueness was checked in _generate_key_pair.
+                cls._store_private_key(
+                    node,
+                    secrets.private_key,
+                    checked=True,
+                    fingerprint=secrets.fingerprint,
+                )
         except IntegrityError as exc:  # pragma: no cover - defensive
             raise VirtualNodeError("Failed to persist virtual node") from exc
 
-        node.refresh_from_db()
+        # Every column is set in Python (no DB defaults), so no reload is needed.
         return node, secrets
 
     @classmethod
@@ -111,11 +134,10 @@ class VirtualNodeService:
         if not node.is_virtual:
             raise VirtualNodeError("Node is not managed as a virtual node")
 
-        payload = dict(data)
         identity_fields: Dict[str, object] = {
-            key: payload.pop(key)
+            key: data[key]
             for key in ("node_id", "node_num", "mac_address")
-            if key in payload
+            if key in data
         }
 
         node_id_change = False
@@ -134,9 +156,13 @@ class VirtualNodeService:
             or "node_num" in identity_fields
             or "mac_address" in identity_fields
         )
-        fields = cls._sanitize_fields(payload)
+        fields = cls._sanitize_fields(data)
 
-        secrets: Optional[VirtualNodeSecrets] = None
+        # Key generation and its uniqueness check run before the transaction
+        # so they never hold row locks.
+        secrets: Optional[VirtualNodeSecrets] = (
+            cls._generate_key_pair(exclude_pk=node.pk) if regenerate_keys else None
+        )
 
         try:
             with transaction.atomic():
@@ -161,27 +187,32 @@ class VirtualNodeService:
                 for field, value in fields.items():
                     setattr(node, field, value)
 
-                if regenerate_keys:
-                    secrets = cls._generate_key_pair(exclude_pk=node.pk)
+                if secrets:
                     node.public_key = secrets.public_key
 
-                update_fields = set(fields.keys())
+                # _ALLOWED_FIELDS never overlaps identity or key columns, so a
+                # plain list cannot hold duplicates.
+                update_fields = [*fields]
                 if identity_update_requested:
-                    update_fields.update({"node_num", "node_id", "mac_address"})
+                    update_fields += ("node_num", "node_id", "mac_address")
                 if secrets:
-                    update_fields.add("public_key")
+                    update_fields.append("public_key")
 
                 if update_fields:
-                    node.save(update_fields=sorted(update_fields))
+                    node.save(update_fields=update_fields)
                 else:
                     node.save()
 
                 if secrets:
-                    cls._store_private_key(node, secrets.private_key)
+                    cls._store_private_key(
+                        node,
+                        secrets.private_key,
+                        checked=True,
+                        fingerprint=secrets.fingerprint,
+                    )
         except IntegrityError as exc:  # pragma: no cover - defensive
             raise VirtualNodeError("Failed to update virtual node") from exc
 
-        node.refresh_from_db()
         return node, secrets
 
     @classmethod
@@ -213,21 +244,19 @@ class VirtualNodeService:
         exclude_pk: Optional[int] = None,
     ) -> VirtualNodeSecrets:
         for _ in range(cls._MAX_KEY_GENERATION_ATTEMPTS):
+            # generate() derives the public half once; the raw accessors just
+            # copy both out without going through the serialization dispatch.
             private_key = x25519.X25519PrivateKey.generate()
-            private_bytes = private_key.private_bytes(
-                Encoding.Raw, PrivateFormat.Raw, NoEncryption()
-            )
-            public_bytes = private_key.public_key().public_bytes(
-                Encoding.Raw, PublicFormat.Raw
-            )
-            private_b64 = base64.b64encode(private_bytes).decode("ascii")
-            public_b64 = base64.b64encode(public_bytes).decode("ascii")
+            private_b64 = _encode_key(private_key.private_bytes_raw())
+            public_b64 = _encode_key(private_key.public_key().public_bytes_raw())
 
             if not cls._key_material_in_use(
                 public_b64, private_b64, exclude_pk=exclude_pk
             ):
                 return VirtualNodeSecrets(
-                    public_key=public_b64, private_key=private_b64
+                    public_key=public_b64,
+                    private_key=private_b64,
+                    fingerprint=_fingerprint(private_b64),
                 )
 
         raise VirtualNodeError("Failed to generate a unique virtual node key pair")
@@ -257,43 +286,61 @@ class VirtualNodeService:
         cls.ensure_key_pair_available(public_key, private_key, exclude_pk=node.pk)
         node.public_key = public_key
         node.save(update_fields=["public_key"])
-        fingerprint = hashlib.sha256(private_key.encode("utf-8")).hexdigest()
-        node.store_private_key(private_key, fingerprint=fingerprint)
+        node.store_private_key(private_key, fingerprint=_fingerprint(private_key))
 
     @classmethod
     def get_virtual_node_options(cls) -> Dict[str, object]:
-        role_values = config_pb2.Config.DeviceConfig.Role.DESCRIPTOR.values  # type: ignore[attr-defined]
-        hardware_values = mesh_pb2.HardwareModel.DESCRIPTOR.values  # type: ignore[attr-defined]
+        role_options, hardware_options = cls._enum_options()
+        return {
+            "roles": list(role_options),
+            "hardware_models": list(hardware_options),
+            "default_role": cls.DEFAULT_ROLE,
+            "default_hardware_model": cls.DEFAULT_HARDWARE_MODEL,
+        }
+
+    @classmethod
+    @functools.cache
+    def _enum_options(
+        cls,
+    ) -> Tuple[Tuple[Dict[str, str], ...], Tuple[Dict[str, str], ...]]:
+        """Serialized role and hardware choices; the protobuf enums never change."""
+        role_values = _ROLE_ENUM.DESCRIPTOR.values
+        hardware_values = _HARDWARE_MODEL_ENUM.DESCRIPTOR.values
 
         def serialize_options(
             values: Tuple[EnumValueDescriptor, ...],
-        ) -> list[dict[str, str]]:
-            return [
+        ) -> Tuple[Dict[str, str], ...]:
+            return tuple(
                 {
                     "value": descriptor.name,
                     "label": cls._format_enum_label(descriptor.name),
                 }
                 for descriptor in values
-            ]
+            )
 
-        return {
-            "roles": serialize_options(role_values),
-            "hardware_models": serialize_options(hardware_values),
-            "default_role": cls.DEFAULT_ROLE,
-            "default_hardware_model": cls.DEFAULT_HARDWARE_MODEL,
-        }
+        return serialize_options(role_values), serialize_options(hardware_values)
 
     @classmethod
-    def _store_private_key(cls, node: Node, key_material: str) -> None:
+    def _store_private_key(
+        cls,
+        node: Node,
+        key_material: str,
+        *,
+        checked: bool = False,
+        fingerprint: Optional[str] = None,
+    ) -> None:
         if not node.public_key:
             raise VirtualNodeError(
                 "Virtual node must have a public key before storing private material"
             )
 
-        public_key = node.public_key
-        cls.ensure_key_pair_available(public_key, key_material, exclude_pk=node.pk)
-        fingerprint = hashlib.sha256(key_material.encode("utf-8")).hexdigest()
-        node.store_private_key(key_material, fingerprint=fingerprint)
+        if not checked:
+            cls.ensure_key_pair_available(
+                node.public_key, key_material, exclude_pk=node.pk
+            )
+        node.store_private_key(
+            key_material, fingerprint=fingerprint or _fingerprint(key_material)
+        )
 
     @classmethod
     def _key_material_in_use(
@@ -303,20 +350,14 @@ class VirtualNodeService:
         *,
         exclude_pk: Optional[int] = None,
     ) -> bool:
-        public_qs = Node.objects.filter(public_key=public_key)
-        if exclude_pk is not None:
-            public_qs = public_qs.exclude(pk=exclude_pk)
-        if public_qs.exists():
-            return True
-
+        # One round trip covers both halves of the pair.
+        clash = Q(public_key=public_key)
         if private_key:
-            private_qs = Node.objects.filter(private_key=private_key)
-            if exclude_pk is not None:
-                private_qs = private_qs.exclude(pk=exclude_pk)
-            if private_qs.exists():
-                return True
-
-        return False
+            clash |= Q(private_key=private_key)
+        qs = Node.objects.filter(clash)
+        if exclude_pk is not None:
+            qs = qs.exclude(pk=exclude_pk)
+        return qs.exists()
 
     @classmethod
     def _resolve_identity(
@@ -365,32 +406,66 @@ class VirtualNodeService:
                 raise VirtualNodeError("Node number is reserved for physical nodes")
             candidate = cls.VIRTUAL_NODE_NUM_START
 
+        # A fixed node number leaves nothing to scan past.
+        window_size = 1 if provided_node_num is not None else cls._IDENTITY_WINDOW
         while True:
-            if cls._node_num_exists(candidate, exclude_pk=exclude_pk):
-                if provided_node_num is not None:
-                    raise VirtualNodeError("Node number is already in use")
-                candidate += 1
-                continue
-
-            target_node_id = provided_node_id or cls._default_node_id(candidate)
-            if cls._node_id_exists(target_node_id, exclude_pk=exclude_pk):
-                if provided_node_id is not None:
-                    raise VirtualNodeError("Node ID is already in use")
-                candidate += 1
-                continue
-
-            target_mac = provided_mac or cls._default_mac(candidate)
-            if cls._mac_exists(target_mac, exclude_pk=exclude_pk):
-                if provided_mac is not None:
-                    raise VirtualNodeError("MAC address is already in use")
-                candidate += 1
-                continue
-
-            return VirtualNodeIdentity(
-                node_num=candidate,
-                node_id=target_node_id,
-                mac_address=target_mac,
+            window = [
+                (
+                    num,
+                    provided_node_id or cls._default_node_id(num),
+                    provided_mac or cls._default_mac(num),
+                )
+                for num in range(candidate, candidate + window_size)
+            ]
+            taken_nums, taken_ids, taken_macs = cls._taken_identities(
+                window, exclude_pk=exclude_pk
             )
+            for num, target_node_id, target_mac in window:
+                if num in taken_nums:
+                    if provided_node_num is not None:
+                        raise VirtualNodeError("Node number is already in use")
+                    continue
+                if target_node_id in taken_ids:
+                    if provided_node_id is not None:
+                        raise VirtualNodeError("Node ID is already in use")
+                    continue
+                if target_mac in taken_macs:
+                    if provided_mac is not None:
+                        raise VirtualNodeError("MAC address is already in use")
+                    continue
+                return VirtualNodeIdentity(
+                    node_num=num,
+                    node_id=target_node_id,
+                    mac_address=target_mac,
+                )
+            candidate += window_size
+
+    @classmethod
+    def _taken_identities(
+        cls,
+        window: List[Tuple[int, str, str]],
+        *,
+        exclude_pk: Optional[int] = None,
+    ) -> Tuple[Set[int], Set[str], Set[str]]:
+        """Return the node numbers, IDs and MACs from `window` already in use."""
+        nums = [num for num, _, _ in window]
+        node_ids = {node_id for _, node_id, _ in window}
+        macs = {mac for _, _, mac in window}
+        queryset = Node.objects.filter(
+            Q(node_num__in=nums) | Q(node_id__in=node_ids) | Q(mac_address__in=macs)
+        )
+        if exclude_pk is not None:
+            queryset = queryset.exclude(pk=exclude_pk)
+        taken_nums: Set[int] = set()
+        taken_ids: Set[str] = set()
+        taken_macs: Set[str] = set()
+        for num, node_id, mac in queryset.values_list(
+            "node_num", "node_id", "mac_address"
+        ):
+            taken_nums.add(num)
+            taken_ids.add(node_id)
+            taken_macs.add(mac)
+        return taken_nums, taken_ids, taken_macs
 
     @classmethod
     def _suggest_identity(cls) -> VirtualNodeIdentity:
@@ -417,16 +492,25 @@ class VirtualNodeService:
             max_value = (
                 Node.objects.aggregate(Max("node_num")).get("node_num__max") or 0
             )
-            start = max(cls.VIRTUAL_NODE_NUM_START, int(max_value) + 1)
+            # Past the highest number in use, so free by construction.
+            return max(cls.VIRTUAL_NODE_NUM_START, int(max_value) + 1)
         candidate = int(start)
-        while cls._node_num_exists(candidate):
-            candidate += 1
-        return candidate
+        if not cls._node_num_exists(candidate):
+            return candidate
+        # The run of taken numbers starting at `candidate` ends at the first
+        # taken number whose successor is free.
+        run_end = (
+            Node.objects.filter(node_num__gte=candidate)
+            .exclude(Exists(Node.objects.filter(node_num=OuterRef("node_num") + 1)))
+            .order_by("node_num")
+            .values_list("node_num", flat=True)
+            .first()
+        )
+        return int(run_end) + 1
 
     @classmethod
     def _default_node_id(cls, node_num: int) -> str:
-        suffix = f"{node_num & 0xFFFFFFFF:08x}"
-        return f"!{suffix}"
+        return "!%08x" % (node_num & 0xFFFFFFFF)
 
     @classmethod
     def _node_num_seed_from_node_id(cls, node_id: str) -> int:
@@ -440,6 +524,8 @@ class VirtualNodeService:
 
     @classmethod
     def _default_mac(cls, node_num: int) -> str:
+        if 0 <= node_num <= _MAX_MAC_NUM:
+            return node_num.to_bytes(6, "big").hex(":").upper()
         return num_to_mac(node_num).upper()
 
     @classmethod
@@ -469,7 +555,7 @@ class VirtualNodeService:
         body = candidate[1:]
         if not body:
             raise VirtualNodeError("Node ID cannot be empty")
-        if any(ch not in "0123456789abcdef" for ch in body):
+        if body.translate(_DROP_HEX_LOWER):
             raise VirtualNodeError(
                 "Node ID must contain only lowercase hexadecimal characters"
             )
@@ -482,11 +568,11 @@ class VirtualNodeService:
         cleaned = value.replace("-", "").replace(":", "").upper()
         if len(cleaned) != 12:
             raise VirtualNodeError("MAC address must contain 12 hexadecimal characters")
-        if any(ch not in "0123456789ABCDEF" for ch in cleaned):
+        if cleaned.translate(_DROP_HEX_UPPER):
             raise VirtualNodeError(
                 "MAC address must contain only hexadecimal characters"
             )
-        return ":".join(cleaned[i : i + 2] for i in range(0, 12, 2))
+        return bytes.fromhex(cleaned).hex(":").upper()
 
     @classmethod
     def _node_num_exists(cls, value: int, exclude_pk: Optional[int] = None) -> bool:
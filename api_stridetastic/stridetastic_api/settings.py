@@ -223,6 +223,18 @@ CELERY_BEAT_SCHEDULE["record_network_overview_snapshot"] = {
     "schedule": 60.0,
 }
 
+# Refresh of the hourly per-node telemetry rollup (node_telemetry_1h table).
+# Each run re-aggregates the hourly buckets covering the lookback window, which
+# must exceed the refresh interval so late telemetry still lands in its bucket.
+TELEMETRY_ROLLUP_REFRESH_INTERVAL_SECS = _env_int(
+    "TELEMETRY_ROLLUP_REFRESH_INTERVAL_SECS", 300
+)
+TELEMETRY_ROLLUP_LOOKBACK_SECS = _env_int("TELEMETRY_ROLLUP_LOOKBACK_SECS", 7200)
+CELERY_BEAT_SCHEDULE["refresh_node_telemetry_rollups"] = {
+    "task": "stridetastic_api.tasks.metrics_tasks.refresh_node_telemetry_rollups",
+    "schedule": TELEMETRY_ROLLUP_REFRESH_INTERVAL_SECS,
+}
+
 # Reachability configuration: nodes are considered reachable if seen within this timeout
 REACTIVE_REACHABILITY_TIMEOUT_SECS = _env_int(
     "REACTIVE_REACHABILITY_TIMEOUT_SECS", 3600
@@ -244,6 +256,8 @@ CELERY_BEAT_SCHEDULE["run_keepalive_check"] = {
     "task": "stridetastic_api.tasks.keepalive_tasks.run_keepalive_check",
     "schedule": KEEPALIVE_CHECK_INTERVAL_SECS,
 }
+# Initial presence-history rows per bulk insert; tuned at runtime from there.
+KEEPALIVE_HISTORY_BATCH_SIZE = _env_int("KEEPALIVE_HISTORY_BATCH_SIZE", 2000)
 
 
 SESSION_ENGINE = "django.contrib.sessions.backends.db"
@@ -289,6 +303,16 @@ CACHES = {
     }
 }
 
+# Per-endpoint TTLs (seconds) for read-mostly API responses cached in Redis.
+# Expired entries are kept for RESPONSE_CACHE_STALE_SECS more so they can be
+# served if the database is unreachable.
+RESPONSE_CACHE_TTLS = {
+    "short": _env_int("RESPONSE_CACHE_SHORT_SECS", 5),
+    "normal": _env_int("RESPONSE_CACHE_NORMAL_SECS", 20),
+    "long": _env_int("RESPONSE_CACHE_LONG_SECS", 60),
+}
+RESPONSE_CACHE_STALE_SECS = _env_int("RESPONSE_CACHE_STALE_SECS", 300)
+
 
 LOGGING = {
     "version": 1,
@@ -365,5 +389,16 @@ DEFAULT_VIRTUAL_NODE_PRIVATE_KEY = (
 ).strip() or None
 
 
+# Protobuf backend: manage.py and the celery app default
+# PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION to "upb", the native backend shipped
+# in protobuf>=4.21 wheels ("cpp" is no longer built). Ingest and capture
+# parse every packet through protobuf; CaptureService logs a warning when the
+# pure-Python fallback is active.
+
 CAPTURE_MAX_FILESIZE = _env_int("CAPTURE_MAX_FILESIZE", 1_073_741_824)
 CAPTURE_TASK_TIMEOUT = _env_int("CAPTURE_TASK_TIMEOUT", 15)
+# Capture packet/byte counters are written every N packets or T ms per session.
+CAPTURE_STATS_FLUSH_PACKETS = _env_int("CAPTURE_STATS_FLUSH_PACKETS", 64)
+CAPTURE_STATS_FLUSH_MS = _env_int("CAPTURE_STATS_FLUSH_MS", 250)
+# How long ingest trusts a "no running session" lookup before querying again.
+CAPTURE_ACTIVATION_MISS_TTL_MS = _env_int("CAPTURE_ACTIVATION_MISS_TTL_MS", 2000)
@@ -0,0 +1,29 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..mesh.node_cache import forget_node, remember_node
+from ..models import Node
+from ..services.pki_service import forget_public_key
+
+
+@receiver(post_save, sender=Node, dispatch_uid="node_cache_remember")
+def remember_saved_node(
+    sender, instance: Node, created: bool = False, **kwargs
+) -> None:
+    remember_node(instance.node_num, instance.pk)
+    update_fields = kwargs.get("update_fields")
+    # Ingest saves last_seen and friends constantly; keep the key cached then.
+    if update_fields is None:
+        key_changed = created or instance.public_key_changed
+    else:
+        key_changed = "public_key" in update_fields
+    if key_changed:
+        forget_public_key(instance.node_num)
+    if "public_key" in instance.__dict__:
+        instance._loaded_public_key = instance.public_key
+
+
+@receiver(post_delete, sender=Node, dispatch_uid="node_cache_forget")
+def forget_deleted_node(sender, instance: Node, **kwargs) -> None:
+    forget_node(instance.pk)
+    forget_public_key(instance.node_num)
@@ -1,20 +1,33 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from celery import shared_task
 
+if TYPE_CHECKING:
+    from ..services.service_manager import ServiceManager
+
 logger = logging.getLogger(__name__)
 
+# The process-wide ServiceManager singleton, bound on the first task run.
+_service_manager: Optional["ServiceManager"] = None
 
-def _get_capture_service():
-    from ..services.service_manager import (  # Local import to avoid circular deps at module load
-        ServiceManager,
-    )
 
-    manager = ServiceManager.get_instance()
+def _get_service_manager() -> "ServiceManager":
+    global _service_manager
+    if _service_manager is None:
+        from ..services.service_manager import (  # Local import to avoid circular deps at module load
+            ServiceManager,
+        )
+
+        _service_manager = ServiceManager.get_instance()
+    return _service_manager
+
+
+def _get_capture_service():
+    manager = _get_service_manager()
     service = manager.get_capture_service()
     if service is None:
         service = manager.initialize_capture_service()
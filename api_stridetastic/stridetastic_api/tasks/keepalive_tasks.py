@@ -20,10 +20,10 @@ def run_keepalive_check() -> int:
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.exception("Keepalive check failed: %s", exc)
         try:
-            config = KeepaliveConfig.get_solo()
-            config.last_run_at = timezone.now()
-            config.last_error_message = str(exc)
-            config.save(update_fields=["last_run_at", "last_error_message"])
+            # Single UPDATE; the singleton row was created by run_check.
+            KeepaliveConfig.objects.filter(pk=1).update(
+                last_run_at=timezone.now(), last_error_message=str(exc)
+            )
         except Exception:
             pass
         return 0
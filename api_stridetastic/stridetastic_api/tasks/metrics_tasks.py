@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import Optional
 
 from celery import shared_task
+from django.db import connection
 from django.db.models import Avg
 from django.utils import timezone
 
@@ -16,6 +17,7 @@ from ..models import (
     Node,
     NodeLatencyHistory,
     NodeLink,
+    NodeTelemetryHourly,
 )
 
 logger = logging.getLogger(__name__)
@@ -131,3 +133,87 @@ def mark_unreachable_nodes() -> int:
     except Exception:  # pragma: no cover - defensive
         logger.exception("mark_unreachable_nodes task failed")
         return 0
+
+
+# Re-aggregates every hourly bucket from %(since)s on and upserts the result.
+# Starting from the payload tables keeps the scan on their time indexes;
+# %(since)s is always an hour boundary, so each bucket is rebuilt whole.
+UPSERT_TELEMETRY_ROLLUPS_SQL = """
+WITH recent AS (
+    SELECT packet_data_id
+    FROM stridetastic_api_devicetelemetrypayload
+    WHERE time >= %(since)s
+    UNION
+    SELECT packet_data_id
+    FROM stridetastic_api_environmenttelemetrypayload
+    WHERE time >= %(since)s
+)
+INSERT INTO {table} AS rollup (
+    node_id, bucket, battery_level, voltage, channel_utilization, air_util_tx,
+    uptime_seconds, temperature, relative_humidity, barometric_pressure,
+    gas_resistance, iaq, sample_count
+)
+SELECT
+    packet.from_node_id,
+    date_trunc('hour', COALESCE(device.time, environment.time)),
+    avg(device.battery_level),
+    avg(device.voltage),
+    avg(device.channel_utilization),
+    avg(device.air_util_tx),
+    max(device.uptime_seconds),
+    avg(environment.temperature),
+    avg(environment.relative_humidity),
+    avg(environment.barometric_pressure),
+    avg(environment.gas_resistance),
+    avg(environment.iaq),
+    count(*)
+FROM recent
+JOIN stridetastic_api_packetdata packet_data ON packet_data.id = recent.packet_data_id
+JOIN stridetastic_api_packet packet ON packet.id = packet_data.packet_id
+LEFT JOIN stridetastic_api_devicetelemetrypayload device
+    ON device.packet_data_id = packet_data.id
+LEFT JOIN stridetastic_api_environmenttelemetrypayload environment
+    ON environment.packet_data_id = packet_data.id
+WHERE packet.from_node_id IS NOT NULL
+    AND COALESCE(device.time, environment.time) >= %(since)s
+GROUP BY 1, 2
+ON CONFLICT (node_id, bucket) DO UPDATE SET
+    battery_level = EXCLUDED.battery_level,
+    voltage = EXCLUDED.voltage,
+    channel_utilization = EXCLUDED.channel_utilization,
+    air_util_tx = EXCLUDED.air_util_tx,
+    uptime_seconds = EXCLUDED.uptime_seconds,
+    temperature = EXCLUDED.temperature,
+    relative_humidity = EXCLUDED.relative_humidity,
+    barometric_pressure = EXCLUDED.barometric_pressure,
+    gas_resistance = EXCLUDED.gas_resistance,
+    iaq = EXCLUDED.iaq,
+    sample_count = EXCLUDED.sample_count
+"""
+
+
+@shared_task(name="stridetastic_api.tasks.metrics_tasks.refresh_node_telemetry_rollups")
+def refresh_node_telemetry_rollups() -> bool:
+    """Upsert the hourly per-node telemetry rollup for recent buckets.
+
+    Only the hours covering ``TELEMETRY_ROLLUP_LOOKBACK_SECS`` are rebuilt, so
+    the cost of a run depends on recent traffic rather than on how much
+    telemetry history is stored. Older buckets were written by earlier runs
+    (or the migration backfill) and are left untouched.
+    """
+    try:
+        from django.conf import settings
+
+        lookback_secs = getattr(settings, "TELEMETRY_ROLLUP_LOOKBACK_SECS", 7200)
+        since = (timezone.now() - timedelta(seconds=int(lookback_secs))).replace(
+            minute=0, second=0, microsecond=0
+        )
+        table = connection.ops.quote_name(NodeTelemetryHourly._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                UPSERT_TELEMETRY_ROLLUPS_SQL.format(table=table), {"since": since}
+            )
+        return True
+    except Exception:  # pragma: no cover - defensive logging in worker
+        logger.exception("Failed to refresh node telemetry rollups")
+        return False
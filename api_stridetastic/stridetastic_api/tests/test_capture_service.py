@@ -0,0 +1,515 @@
+import queue
+import tempfile
+import threading
+import zlib
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from django.db import OperationalError, connection
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.utils import timezone
+from meshtastic.protobuf import mesh_pb2, mqtt_pb2, portnums_pb2
+
+from ..models.capture_models import CaptureSession
+from ..models.channel_models import Channel
+from ..models.interface_models import Interface
+from ..models.node_models import Node
+from ..services import capture_service
+from ..services.capture_service import CaptureService, _scratch_message
+
+
+def _envelope(packet: mesh_pb2.MeshPacket) -> bytes:
+    envelope = mqtt_pb2.ServiceEnvelope()
+    envelope.packet.CopyFrom(packet)
+    envelope.channel_id = "LongFast"
+    envelope.gateway_id = "!00000001"
+    return envelope.SerializeToString()
+
+
+def _text_packet(text: str = "hello mesh") -> mesh_pb2.MeshPacket:
+    packet = mesh_pb2.MeshPacket()
+    setattr(packet, "from", 0x11)
+    packet.to = 0xFFFFFFFF
+    packet.id = 42
+    packet.decoded.portnum = portnums_pb2.TEXT_MESSAGE_APP
+    packet.decoded.payload = text.encode()
+    return packet
+
+
+class CaptureServiceIngestTests(TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.service = CaptureService(base_dir=Path(self._tmp.name))
+        self.session = self.service.start_capture(name="ingest test")
+        self.addCleanup(self.service.stop_all)
+
+    def test_decoded_packet_is_written_and_counted(self) -> None:
+        self.service.handle_ingest(
+            source_type="mqtt", raw_payload=_envelope(_text_packet())
+        )
+
+        self.service.wait_for_writes()
+        self.service.flush_stats()
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.packet_count, 1)
+        self.assertGreater(self.session.byte_count, 0)
+        self.assertGreater(self.session.file_size, 0)
+
+    def test_failed_stats_flush_keeps_counters_for_the_next_one(self) -> None:
+        ts = timezone.now()
+        with patch.object(self.service, "_ensure_flusher"):
+            self.service._record_write(self.session.id, 2, 100, ts, 500)
+            with (
+                patch.object(
+                    CaptureSession.objects,
+                    "filter",
+                    side_effect=OperationalError("blip"),
+                ),
+                self.assertRaises(OperationalError),
+            ):
+                self.service.flush_stats()
+            self.service._record_write(self.session.id, 1, 50, ts, 600)
+
+        self.service.flush_stats()
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.packet_count, 3)
+        self.assertEqual(self.session.byte_count, 150)
+        self.assertEqual(self.session.file_size, 600)
+
+    def test_stale_stats_flush_never_moves_size_or_time_backwards(self) -> None:
+        later = timezone.now()
+        CaptureSession.objects.filter(id=self.session.id).update(
+            file_size=900, last_packet_at=later
+        )
+        with patch.object(self.service, "_ensure_flusher"):
+            self.service._record_write(
+                self.session.id, 1, 10, later - timedelta(seconds=5), 400
+            )
+        self.service.flush_stats()
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.packet_count, 1)
+        self.assertEqual(self.session.file_size, 900)
+        self.assertEqual(self.session.last_packet_at, later)
+
+    def test_empty_mesh_packet_is_skipped(self) -> None:
+        self.service.handle_ingest(
+            source_type="mqtt", raw_payload=_envelope(mesh_pb2.MeshPacket())
+        )
+
+        self.service.wait_for_writes()
+        self.service.flush_stats()
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.packet_count, 0)
+
+    def test_other_source_types_are_ignored(self) -> None:
+        self.service.handle_ingest(
+            source_type="serial", raw_payload=_envelope(_text_packet())
+        )
+
+        self.service.wait_for_writes()
+        self.service.flush_stats()
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.packet_count, 0)
+        self.assertEqual(self.session.status, CaptureSession.Status.RUNNING)
+
+    def test_concurrent_sessions_are_tracked_independently(self) -> None:
+        second = self.service.start_capture(name="second capture")
+
+        self.assertTrue(self.service.is_active(self.session.id))
+        self.assertTrue(self.service.is_active(second.id))
+
+        self.service.stop_capture(second.id)
+
+        self.assertFalse(self.service.is_active(second.id))
+        self.assertTrue(self.service.is_active(self.session.id))
+        self.service.handle_ingest(
+            source_type="mqtt", raw_payload=_envelope(_text_packet())
+        )
+        self.service.wait_for_writes()
+        self.service.flush_stats()
+        self.session.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(self.session.packet_count, 1)
+        self.assertEqual(second.packet_count, 0)
+
+    def test_registry_changes_publish_a_new_snapshot(self) -> None:
+        before = self.service._active_snapshot
+
+        self.service.stop_capture(self.session.id)
+
+        # Readers holding the old snapshot keep a consistent view.
+        self.assertIn(self.session.id, before)
+        self.assertNotIn(self.session.id, self.service._active_snapshot)
+        self.assertFalse(self.service.is_active(self.session.id))
+
+    def test_interface_bound_sessions_only_receive_their_interface(self) -> None:
+        interface = Interface.objects.create(
+            name="capture-mqtt", interface_type=Interface.Types.MQTT
+        )
+        bound = self.service.start_capture(
+            name="bound capture", interface_id=interface.pk
+        )
+
+        self.service.handle_ingest(
+            source_type="mqtt",
+            raw_payload=_envelope(_text_packet()),
+            interface_id=interface.pk + 1,
+        )
+        self.service.handle_ingest(
+            source_type="mqtt",
+            raw_payload=_envelope(_text_packet()),
+            interface_id=interface.pk,
+        )
+
+        self.service.wait_for_writes()
+        self.service.flush_stats()
+        self.session.refresh_from_db()
+        bound.refresh_from_db()
+        self.assertEqual(self.session.packet_count, 2)
+        self.assertEqual(bound.packet_count, 1)
+
+    def test_counters_are_batched_until_flushed(self) -> None:
+        for _ in range(3):
+            self.service.handle_ingest(
+                source_type="mqtt", raw_payload=_envelope(_text_packet())
+            )
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.packet_count, 0)
+
+        stopped = self.service.stop_capture(self.session.id)
+
+        self.assertEqual(stopped.packet_count, 3)
+        self.assertGreater(stopped.byte_count, 0)
+        self.assertIsNotNone(stopped.last_packet_at)
+
+    def test_capture_error_merges_message_into_notes(self) -> None:
+        CaptureSession.objects.filter(pk=self.session.pk).update(
+            notes={"origin": "test"}
+        )
+
+        with self.assertNumQueries(1):
+            self.service._handle_capture_error(self.session.id, "disk full")
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.status, CaptureSession.Status.ERROR)
+        self.assertIsNotNone(self.session.ended_at)
+        self.assertEqual(self.session.notes, {"origin": "test", "error": "disk full"})
+        self.assertFalse(self.service.is_active(self.session.id))
+
+    def test_capture_error_falls_back_to_read_modify_write(self) -> None:
+        CaptureSession.objects.filter(pk=self.session.pk).update(
+            notes={"origin": "test"}
+        )
+
+        with patch.object(connection, "vendor", "sqlite"):
+            self.service._handle_capture_error(self.session.id, "disk full")
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.status, CaptureSession.Status.ERROR)
+        self.assertEqual(self.session.notes, {"origin": "test", "error": "disk full"})
+
+    def test_delete_removes_file_and_tolerates_missing_one(self) -> None:
+        path = self.service.get_full_path(self.session)
+        self.assertTrue(path.exists())
+
+        self.assertTrue(self.service.delete_capture(self.session.id))
+        self.assertFalse(path.exists())
+        self.assertFalse(CaptureSession.objects.filter(pk=self.session.pk).exists())
+
+        orphan = self.service.start_capture(name="orphan")
+        self.service.stop_capture(orphan.id)
+        self.service.get_full_path(orphan).unlink()
+        self.assertTrue(self.service.delete_capture(orphan.id))
+
+    def test_writes_happen_on_the_session_writer_thread(self) -> None:
+        active = self.service._active_snapshot[self.session.id]
+
+        self.assertTrue(active.worker.is_alive())
+
+        self.service.stop_capture(self.session.id)
+
+        self.assertFalse(active.worker.is_alive())
+
+    def test_full_queue_drops_packets_instead_of_blocking(self) -> None:
+        active = self.service._active_snapshot[self.session.id]
+        # Park the writer and leave a one-slot queue that is already full.
+        self.service._stop_worker(active)
+        active.queue = queue.Queue(maxsize=1)
+        active.queue.put_nowait(None)
+
+        self.service.handle_ingest(
+            source_type="mqtt", raw_payload=_envelope(_text_packet())
+        )
+
+        self.assertEqual(active.dropped, 1)
+
+    def test_queued_packets_are_written_as_one_batch(self) -> None:
+        active = self.service._active_snapshot[self.session.id]
+        self.service._stop_worker(active)
+        for _ in range(3):
+            self.service.handle_ingest(
+                source_type="mqtt", raw_payload=_envelope(_text_packet())
+            )
+        active.queue.put_nowait(None)
+
+        with patch.object(
+            self.service, "_record_write", wraps=self.service._record_write
+        ) as record_write:
+            worker = threading.Thread(target=self.service._writer_loop, args=(active,))
+            worker.start()
+            worker.join()
+
+        record_write.assert_called_once()
+        self.assertEqual(record_write.call_args.args[1], 3)
+        self.assertEqual(active.queue.unfinished_tasks, 0)
+
+
+class CaptureServiceActivationTests(TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.service = CaptureService(base_dir=Path(self._tmp.name))
+        self.addCleanup(self.service.stop_all)
+
+    def test_activation_misses_are_cached(self) -> None:
+        raw_payload = _envelope(_text_packet())
+        self.service.handle_ingest(source_type="mqtt", raw_payload=raw_payload)
+
+        with self.assertNumQueries(0):
+            self.service.handle_ingest(source_type="mqtt", raw_payload=raw_payload)
+
+    def test_local_start_clears_cached_misses(self) -> None:
+        raw_payload = _envelope(_text_packet())
+        self.service.handle_ingest(source_type="mqtt", raw_payload=raw_payload)
+
+        session = self.service.start_capture(name="after miss")
+        self.service.handle_ingest(source_type="mqtt", raw_payload=raw_payload)
+        self.service.wait_for_writes()
+        self.service.flush_stats()
+
+        session.refresh_from_db()
+        self.assertEqual(session.packet_count, 1)
+        self.assertEqual(self.service._activation_misses, {})
+
+    def test_activation_loads_only_writer_columns(self) -> None:
+        interface = Interface.objects.create(
+            name="activation-mqtt", interface_type=Interface.Types.MQTT
+        )
+        session = CaptureSession.objects.create(
+            name="started elsewhere",
+            filename="elsewhere.pcapng",
+            file_path=str(Path(self._tmp.name) / "elsewhere.pcapng"),
+            interface=interface,
+        )
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.service.activate_existing_session(session.id))
+
+        active = self.service._active_snapshot[session.id]
+        self.assertEqual(active.interface_id, interface.pk)
+        self.assertEqual(active.source_type, "mqtt")
+
+    @override_settings(CAPTURE_ACTIVATION_MISS_TTL_MS=0)
+    def test_zero_ttl_disables_the_miss_cache(self) -> None:
+        service = CaptureService(base_dir=Path(self._tmp.name))
+        service.handle_ingest(source_type="mqtt", raw_payload=_envelope(_text_packet()))
+
+        self.assertEqual(service._activation_misses, {})
+
+
+class CaptureChannelKeyTests(TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.service = CaptureService(base_dir=Path(self._tmp.name))
+
+    def test_channel_psk_is_cached(self) -> None:
+        Channel.objects.create(channel_id="Secret", psk="c2VjcmV0")
+
+        self.assertEqual(self.service._channel_psk("Secret"), "c2VjcmV0")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.service._channel_psk("Secret"), "c2VjcmV0")
+
+    def test_unknown_channels_are_cached_as_missing(self) -> None:
+        self.assertIsNone(self.service._channel_psk("Nowhere"))
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.service._channel_psk("Nowhere"))
+
+    def test_channel_psk_cache_keeps_only_recent_channels(self) -> None:
+        with patch.object(capture_service, "MAX_DECRYPT_KEY_CACHE_ENTRIES", 2):
+            for channel_id in ("first", "second", "third"):
+                self.service._channel_psk(channel_id)
+
+        self.assertEqual(list(self.service._psk_cache), ["second", "third"])
+
+    def test_pki_target_node_is_cached_with_its_private_key(self) -> None:
+        node = Node.objects.create(
+            node_num=0x22,
+            node_id="!00000022",
+            mac_address="AA:BB:CC:00:00:22",
+            private_key="cHJpdmF0ZQ==",
+        )
+
+        self.assertEqual(self.service._pki_target_node(0x22).pk, node.pk)
+        with self.assertNumQueries(0):
+            cached = self.service._pki_target_node(0x22)
+            self.assertEqual(cached.private_key, "cHJpdmF0ZQ==")
+
+    def test_pki_target_node_cache_keeps_only_recent_nodes(self) -> None:
+        with patch.object(capture_service, "MAX_DECRYPT_KEY_CACHE_ENTRIES", 2):
+            for node_num in (0x31, 0x32, 0x33):
+                self.assertIsNone(self.service._pki_target_node(node_num))
+
+        self.assertEqual(list(self.service._pki_node_cache), [0x32, 0x33])
+
+
+class CaptureServiceWriterThreadTests(TransactionTestCase):
+    """Writer threads use their own connections, so rows must be committed."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    @override_settings(CAPTURE_STATS_FLUSH_PACKETS=2)
+    def test_counters_flush_after_packet_threshold(self) -> None:
+        service = CaptureService(base_dir=Path(self._tmp.name))
+        session = service.start_capture(name="threshold capture")
+        self.addCleanup(service.stop_all)
+
+        for _ in range(2):
+            service.handle_ingest(
+                source_type="mqtt", raw_payload=_envelope(_text_packet())
+            )
+        service.wait_for_writes()
+
+        session.refresh_from_db()
+        self.assertEqual(session.packet_count, 2)
+
+
+class CapturePortDecodingTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.service = CaptureService(base_dir=Path(self._tmp.name))
+
+    def test_node_info_port_decodes_user_payload(self) -> None:
+        user = mesh_pb2.User(id="!aabbccdd", long_name="Node", short_name="N")
+
+        outputs = self.service._decode_port_payloads(
+            portnums_pb2.NODEINFO_APP, user.SerializeToString()
+        )
+
+        self.assertEqual(
+            outputs, [("meshtastic.protobuf.User", user.SerializeToString())]
+        )
+
+    def test_undecodable_payload_keeps_port_label(self) -> None:
+        outputs = self.service._decode_port_payloads(
+            portnums_pb2.POSITION_APP, b"\xff\xff\xff"
+        )
+
+        self.assertEqual(outputs, [("meshtastic.port.POSITION_APP", b"\xff\xff\xff")])
+
+    def test_default_only_payload_keeps_port_label(self) -> None:
+        # An explicitly encoded empty ``User.id`` parses but re-serializes empty.
+        outputs = self.service._decode_port_payloads(
+            portnums_pb2.NODEINFO_APP, b"\x0a\x00"
+        )
+
+        self.assertEqual(outputs, [("meshtastic.port.NODEINFO_APP", b"\x0a\x00")])
+
+    def test_reused_messages_do_not_leak_between_packets(self) -> None:
+        full = mesh_pb2.Position(latitude_i=1, longitude_i=2, altitude=3)
+        partial = mesh_pb2.Position(latitude_i=4)
+
+        self.service._decode_port_payloads(
+            portnums_pb2.POSITION_APP, full.SerializeToString()
+        )
+        outputs = self.service._decode_port_payloads(
+            portnums_pb2.POSITION_APP, partial.SerializeToString()
+        )
+
+        self.assertEqual(
+            outputs, [("meshtastic.protobuf.Position", partial.SerializeToString())]
+        )
+
+    def test_scratch_messages_are_per_thread(self) -> None:
+        mine = _scratch_message(mesh_pb2.Data)
+        other: list = []
+        worker = threading.Thread(
+            target=lambda: other.append(_scratch_message(mesh_pb2.Data))
+        )
+        worker.start()
+        worker.join()
+
+        self.assertIs(_scratch_message(mesh_pb2.Data), mine)
+        self.assertIsNot(other[0], mine)
+
+    def test_decode_envelope_splits_packet_layers(self) -> None:
+        packet = _text_packet("layers")
+
+        mesh_payload, data_payload, extras = self.service._decode_envelope(
+            _envelope(packet)
+        )
+
+        self.assertEqual(mesh_payload, packet.SerializeToString())
+        self.assertEqual(data_payload, packet.decoded.SerializeToString())
+        self.assertEqual(extras, [("meshtastic.TextMessage", b"layers")])
+
+    def test_compressed_text_is_inflated_only_when_zlib(self) -> None:
+        for data, expected in (
+            (zlib.compress(b"hello"), b"hello"),
+            (b"\x55unishox", b"\x55unishox"),
+        ):
+            compressed = mesh_pb2.Compressed(
+                portnum=portnums_pb2.TEXT_MESSAGE_APP, data=data
+            )
+            with self.subTest(data=data):
+                outputs = self.service._decode_port_payloads(
+                    portnums_pb2.TEXT_MESSAGE_COMPRESSED_APP,
+                    compressed.SerializeToString(),
+                )
+
+                self.assertEqual(outputs[1], ("meshtastic.TextMessage", expected))
+
+    def test_text_message_passes_through(self) -> None:
+        outputs = self.service._decode_port_payloads(
+            portnums_pb2.TEXT_MESSAGE_APP, b"hi"
+        )
+
+        self.assertEqual(outputs, [("meshtastic.TextMessage", b"hi")])
+
+    def test_port_labels_cover_known_and_unknown_ports(self) -> None:
+        self.assertEqual(
+            CaptureService._port_label(portnums_pb2.TELEMETRY_APP),
+            "meshtastic.port.TELEMETRY_APP",
+        )
+        self.assertEqual(
+            CaptureService._port_label(4242), "meshtastic.port.UNKNOWN_4242"
+        )
+
+
+class CaptureTaskServiceLookupTests(SimpleTestCase):
+    def test_service_manager_is_resolved_once(self):
+        from ..tasks import capture_tasks
+
+        with (
+            patch.object(capture_tasks, "_service_manager", None),
+            patch(
+                "stridetastic_api.services.service_manager.ServiceManager.get_instance"
+            ) as get_instance,
+        ):
+            get_instance.return_value.get_capture_service.return_value = "capture"
+            self.assertEqual(capture_tasks._get_capture_service(), "capture")
+            self.assertEqual(capture_tasks._get_capture_service(), "capture")
+
+        get_instance.assert_called_once_with()
@@ -0,0 +1,65 @@
+from django.contrib.auth import get_user_model  # type: ignore[import]
+from django.test import TestCase  # type: ignore[import]
+from ninja.testing import TestClient  # type: ignore[import]
+from ninja_jwt.tokens import AccessToken  # type: ignore[import]
+
+from ..api import api
+from ..models import Channel, Node
+from ..models.packet_models import Packet
+
+API_CLIENT = TestClient(api)
+
+
+class ChannelStatisticsAPITests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = API_CLIENT
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(
+            username="channeltester",
+            password="testpass123",
+        )
+        self.token = str(AccessToken.for_user(self.user))
+
+        self.node_a = Node.objects.create(
+            node_num=0x31,
+            node_id="!aaaa0031",
+            mac_address="00:00:00:00:aa:31",
+        )
+        self.node_b = Node.objects.create(
+            node_num=0x32,
+            node_id="!bbbb0032",
+            mac_address="00:00:00:00:bb:32",
+        )
+
+    def _get_statistics(self):
+        return self.client.get(
+            "/channels/statistics",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+
+    def test_returns_statistics_for_channels_with_traffic(self) -> None:
+        busy = Channel.objects.create(channel_id="Busy", channel_num=1)
+        busy.members.add(self.node_a, self.node_b)
+        Channel.objects.create(channel_id="Idle", channel_num=2)
+        for _ in range(3):
+            Packet.objects.create(
+                from_node=self.node_a, to_node=self.node_b, channel=busy
+            )
+
+        response = self._get_statistics()
+
+        self.assertEqual(response.status_code, 200)
+        channels = response.json()["channels"]
+        self.assertEqual(len(channels), 1)
+        self.assertEqual(channels[0]["channel_id"], "Busy")
+        self.assertEqual(channels[0]["total_messages"], 3)
+        self.assertEqual(channels[0]["members_count"], 2)
+
+    def test_returns_404_when_no_channel_has_traffic(self) -> None:
+        Channel.objects.create(channel_id="Idle", channel_num=2)
+
+        response = self._get_statistics()
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["message"], "No channel statistics available")
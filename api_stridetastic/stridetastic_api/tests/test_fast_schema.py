@@ -0,0 +1,69 @@
+import orjson
+from django.test import SimpleTestCase  # type: ignore[import]
+from pydantic import TypeAdapter, ValidationError
+
+from ..schemas import DeferredSchema, EdgeSchema, LinkChannelSchema
+from ..schemas._warmup import iter_schemas, warm_schemas
+
+
+class FastSchemaTests(SimpleTestCase):
+    def test_from_trusted_skips_validation(self) -> None:
+        channel = LinkChannelSchema.from_trusted(channel_id="LongFast", channel_num=0)
+
+        self.assertEqual(channel.channel_id, "LongFast")
+        self.assertEqual(channel.channel_num, 0)
+
+    def test_instances_are_frozen(self) -> None:
+        channel = LinkChannelSchema(channel_id="LongFast")
+
+        with self.assertRaises(ValidationError):
+            channel.channel_id = "MediumSlow"  # type: ignore[misc]
+
+    def test_encoders_match_model_dump(self) -> None:
+        channels = [
+            LinkChannelSchema.from_trusted(channel_id="LongFast", channel_num=0),
+            LinkChannelSchema.from_trusted(channel_id="MediumSlow", channel_num=1),
+        ]
+
+        self.assertEqual(
+            orjson.loads(LinkChannelSchema.encode(channels[0])),
+            channels[0].model_dump(mode="json"),
+        )
+        self.assertEqual(
+            orjson.loads(LinkChannelSchema.encode_list(channels)),
+            [channel.model_dump(mode="json") for channel in channels],
+        )
+        self.assertIs(
+            LinkChannelSchema._list_adapter(), LinkChannelSchema._list_adapter()
+        )
+
+    def test_json_schema_includes_field_docs(self) -> None:
+        properties = EdgeSchema.model_json_schema()["properties"]
+
+        self.assertEqual(
+            properties["source_node_id"]["description"], "ID of the source node."
+        )
+        self.assertEqual(
+            properties["last_rx_snr"]["description"],
+            "Last received SNR for the edge.",
+        )
+
+
+class SchemaWarmupTests(SimpleTestCase):
+    def test_every_schema_is_deferred(self) -> None:
+        for schema in iter_schemas():
+            if isinstance(schema, TypeAdapter):
+                continue
+            with self.subTest(schema=schema.__name__):
+                self.assertTrue(issubclass(schema, DeferredSchema))
+                self.assertTrue(schema.model_config.get("defer_build"))
+
+    def test_warm_up_builds_every_schema(self) -> None:
+        warm_schemas()
+
+        for schema in iter_schemas():
+            if isinstance(schema, TypeAdapter):
+                self.assertTrue(schema.pydantic_complete)
+            else:
+                self.assertTrue(schema.__pydantic_complete__, schema.__name__)
+        self.assertEqual(warm_schemas(), 0)
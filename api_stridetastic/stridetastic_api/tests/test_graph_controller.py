@@ -0,0 +1,76 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model  # type: ignore[import]
+from django.test import TestCase  # type: ignore[import]
+from ninja.testing import TestClient  # type: ignore[import]
+from ninja_jwt.tokens import AccessToken  # type: ignore[import]
+
+from ..api import api
+from ..models import Edge, Interface, Node
+from ..models.packet_models import Packet
+
+API_CLIENT = TestClient(api)
+
+
+class GraphEdgesAPITests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = API_CLIENT
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(
+            username="graphtester",
+            password="testpass123",
+        )
+        self.token = str(AccessToken.for_user(self.user))
+
+        self.source = Node.objects.create(
+            node_num=0x51,
+            node_id="!aaaa0051",
+            mac_address="00:00:00:00:aa:51",
+        )
+        self.target = Node.objects.create(
+            node_num=0x52,
+            node_id="!bbbb0052",
+            mac_address="00:00:00:00:bb:52",
+        )
+
+    def _get_edges(self):
+        return self.client.get(
+            "/graph/edges",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+
+    def test_returns_serialized_edges(self) -> None:
+        packet = Packet.objects.create(
+            from_node=self.source, to_node=self.target, packet_id=4242
+        )
+        interface = Interface.objects.create(name="mqtt-graph")
+        edge = Edge.objects.create(
+            source_node=self.source,
+            target_node=self.target,
+            last_packet=packet,
+            last_rx_rssi=-90,
+            last_rx_snr=Decimal("5.25"),
+            last_hops=1,
+        )
+        edge.interfaces.add(interface)
+
+        response = self._get_edges()
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["source_node_id"], self.source.id)
+        self.assertEqual(data[0]["target_node_id"], self.target.id)
+        self.assertEqual(data[0]["last_packet_id"], 4242)
+        self.assertEqual(data[0]["last_rx_rssi"], -90)
+        self.assertEqual(data[0]["last_rx_snr"], 5.25)
+        self.assertEqual(data[0]["last_hops"], 1)
+        self.assertEqual(data[0]["interfaces_names"], ["mqtt-graph"])
+        self.assertTrue(data[0]["first_seen"].endswith("Z"))
+
+    def test_returns_404_without_edges(self) -> None:
+        response = self._get_edges()
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["message"], "No edges found")
@@ -8,21 +8,25 @@ from ..schemas.keepalive_schemas import KeepaliveConfigUpdateSchema
 
 
 class KeepaliveControllerTests(TestCase):
-    def setUp(self) -> None:
-        self.controller = KeepaliveController()
+    @classmethod
+    def setUpTestData(cls) -> None:
         config = KeepaliveConfig.get_solo()
-        config.enabled = False
-        config.payload_type = KeepaliveConfig.PayloadTypes.REACHABILITY
-        config.from_node = ""
-        config.gateway_node = ""
-        config.channel_name = ""
-        config.channel_key = ""
-        config.hop_limit = 3
-        config.hop_start = 3
-        config.scope = KeepaliveConfig.Scope.ALL
-        config.save()
+        KeepaliveConfig.objects.filter(pk=config.pk).update(
+            enabled=False,
+            payload_type=KeepaliveConfig.PayloadTypes.REACHABILITY,
+            from_node="",
+            gateway_node="",
+            channel_name="",
+            channel_key="",
+            hop_limit=3,
+            hop_start=3,
+            scope=KeepaliveConfig.Scope.ALL,
+        )
         config.selected_nodes.clear()
 
+    def setUp(self) -> None:
+        self.controller = KeepaliveController()
+
     def test_update_config_saves_publish_settings(self):
         iface = Interface.objects.create(
             interface_type=Interface.Types.MQTT, name="mqtt-1"
@@ -57,7 +61,7 @@ class KeepaliveControllerTests(TestCase):
         self.assertEqual(response.config.hop_limit, 4)
         self.assertEqual(response.config.hop_start, 2)
         self.assertEqual(response.config.interface_id, iface.id)
-        self.assertEqual(response.config.selected_node_ids, [node.id])
+        self.assertEqual(response.config.selected_node_ids, (node.id,))
 
     def test_update_config_clears_fields(self):
         config = KeepaliveConfig.get_solo()
@@ -1,31 +1,46 @@
+import threading
 from datetime import timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.db import connection, connections, transaction
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from ..models import KeepaliveConfig, Node, NodePresenceHistory
-from ..services.keepalive_service import KeepaliveService
+from ..models import Interface, KeepaliveConfig, Node, NodePresenceHistory
+from ..services.keepalive_service import (
+    KeepaliveService,
+    _get_history_batch_size,
+    _write_history,
+    clear_schedule_cache,
+)
 
 
 class KeepaliveServiceTests(TestCase):
-    def setUp(self) -> None:
-        self.service = KeepaliveService()
+    @classmethod
+    def setUpTestData(cls) -> None:
+        # Created once per class; each test's transaction rolls back its edits.
         config = KeepaliveConfig.get_solo()
-        config.enabled = False
-        config.payload_type = KeepaliveConfig.PayloadTypes.REACHABILITY
-        config.from_node = ""
-        config.gateway_node = ""
-        config.channel_name = ""
-        config.channel_key = ""
-        config.hop_limit = 3
-        config.hop_start = 3
-        config.offline_after_seconds = 3600
-        config.check_interval_seconds = 60
-        config.scope = KeepaliveConfig.Scope.ALL
-        config.save()
+        KeepaliveConfig.objects.filter(pk=config.pk).update(
+            enabled=False,
+            payload_type=KeepaliveConfig.PayloadTypes.REACHABILITY,
+            from_node="",
+            gateway_node="",
+            channel_name="",
+            channel_key="",
+            hop_limit=3,
+            hop_start=3,
+            offline_after_seconds=3600,
+            check_interval_seconds=60,
+            scope=KeepaliveConfig.Scope.ALL,
+        )
         config.selected_nodes.clear()
+        cls.service = KeepaliveService()
+
+    def setUp(self) -> None:
+        clear_schedule_cache()
+        self.addCleanup(clear_schedule_cache)
 
     def _make_node(self, node_id: str, node_num: int) -> Node:
         return Node.objects.create(
@@ -34,11 +49,26 @@ class KeepaliveServiceTests(TestCase):
             mac_address=f"00:00:00:00:00:{node_num:02x}",
         )
 
+    def _make_stale_nodes(self, node_nums, last_seen) -> list[Node]:
+        # last_seen is auto_now, so it can only be backdated after the INSERT;
+        # one UPDATE covers the whole batch.
+        nodes = Node.objects.bulk_create(
+            Node(
+                node_num=node_num,
+                node_id=f"!{node_num:08x}",
+                mac_address=f"00:00:00:00:00:{node_num:02x}",
+            )
+            for node_num in node_nums
+        )
+        Node.objects.filter(pk__in=[node.pk for node in nodes]).update(
+            last_seen=last_seen
+        )
+        return nodes
+
     def test_records_transition_and_publishes_reachability(self):
         fixed_now = timezone.now()
-        target = self._make_node("!00000002", 2)
         last_seen = fixed_now - timedelta(seconds=3610)
-        Node.objects.filter(pk=target.pk).update(last_seen=last_seen)
+        [target] = self._make_stale_nodes([2], last_seen)
 
         config = KeepaliveConfig.get_solo()
         config.enabled = True
@@ -61,25 +91,26 @@ class KeepaliveServiceTests(TestCase):
         ), patch(
             "stridetastic_api.services.service_manager.ServiceManager.get_instance",
             return_value=service_manager,
+        ), self.assertNumQueries(
+            6
         ):
+            # Savepoint pair, locked config read, node cursor, history
+            # insert and the config update; probes go through the mock.
             count = self.service.run_check()
 
         self.assertEqual(count, 1)
         self.assertEqual(NodePresenceHistory.objects.count(), 1)
-        publisher_service.publish_reachability_probe.assert_called_once()
-        _, kwargs = publisher_service.publish_reachability_probe.call_args
+        publisher_service.publish_reachability_probe_bulk.assert_called_once()
+        _, kwargs = publisher_service.publish_reachability_probe_bulk.call_args
         self.assertEqual(kwargs["from_node"], config.from_node)
-        self.assertEqual(kwargs["to_node"], target.node_id)
+        self.assertEqual(kwargs["to_nodes"], [target.node_id])
         self.assertEqual(kwargs["channel_name"], config.channel_name)
         self.assertEqual(kwargs["channel_aes_key"], config.channel_key)
         self.assertEqual(kwargs["priority"], "ACK")
 
     def test_publishes_traceroute_when_selected(self):
         fixed_now = timezone.now()
-        target = self._make_node("!00000003", 3)
-        Node.objects.filter(pk=target.pk).update(
-            last_seen=fixed_now - timedelta(seconds=3615)
-        )
+        self._make_stale_nodes([3], fixed_now - timedelta(seconds=3615))
 
         config = KeepaliveConfig.get_solo()
         config.enabled = True
@@ -105,20 +136,15 @@ class KeepaliveServiceTests(TestCase):
             count = self.service.run_check()
 
         self.assertEqual(count, 1)
-        publisher_service.publish_traceroute.assert_called_once()
-        _, kwargs = publisher_service.publish_traceroute.call_args
+        publisher_service.publish_traceroute_bulk.assert_called_once()
+        _, kwargs = publisher_service.publish_traceroute_bulk.call_args
         self.assertEqual(kwargs["priority"], "ACK")
         self.assertTrue(kwargs["record_pending"])
 
     def test_selected_scope_filters_nodes(self):
         fixed_now = timezone.now()
-        target_a = self._make_node("!00000004", 4)
-        target_b = self._make_node("!00000005", 5)
-        Node.objects.filter(pk=target_a.pk).update(
-            last_seen=fixed_now - timedelta(seconds=3610)
-        )
-        Node.objects.filter(pk=target_b.pk).update(
-            last_seen=fixed_now - timedelta(seconds=3610)
+        target_a, target_b = self._make_stale_nodes(
+            [4, 5], fixed_now - timedelta(seconds=3610)
         )
 
         config = KeepaliveConfig.get_solo()
@@ -148,16 +174,82 @@ class KeepaliveServiceTests(TestCase):
 
         self.assertEqual(count, 1)
         self.assertEqual(NodePresenceHistory.objects.count(), 1)
-        _, kwargs = publisher_service.publish_reachability_probe.call_args
-        self.assertEqual(kwargs["to_node"], target_a.node_id)
+        _, kwargs = publisher_service.publish_reachability_probe_bulk.call_args
+        self.assertEqual(kwargs["to_nodes"], [target_a.node_id])
 
-    def test_missing_publish_config_sets_error(self):
+    def test_queries_do_not_grow_with_transitioned_nodes(self):
         fixed_now = timezone.now()
-        target = self._make_node("!00000006", 6)
-        Node.objects.filter(pk=target.pk).update(
-            last_seen=fixed_now - timedelta(seconds=3610)
+        interface = Interface.objects.create(
+            name="keepalive-mqtt", interface_type=Interface.Types.MQTT
+        )
+        config = KeepaliveConfig.get_solo()
+        config.enabled = True
+        config.payload_type = KeepaliveConfig.PayloadTypes.REACHABILITY
+        config.from_node = "!00000001"
+        config.channel_name = "LongFast"
+        config.interface = interface
+        config.save()
+
+        publisher_service = MagicMock()
+        service_manager = SimpleNamespace(
+            initialize_publisher_service=MagicMock(return_value=publisher_service),
+            resolve_publish_context=MagicMock(return_value=(None, None, None)),
         )
 
+        def run_with_transitions(node_nums) -> int:
+            self._make_stale_nodes(node_nums, fixed_now - timedelta(seconds=3610))
+            KeepaliveConfig.objects.filter(pk=config.pk).update(
+                last_run_at=fixed_now - timedelta(seconds=120)
+            )
+            clear_schedule_cache()
+            with patch(
+                "stridetastic_api.services.keepalive_service.timezone.now",
+                return_value=fixed_now,
+            ), patch(
+                "stridetastic_api.services.service_manager.ServiceManager.get_instance",
+                return_value=service_manager,
+            ), CaptureQueriesContext(
+                connection
+            ) as queries:
+                self.assertEqual(self.service.run_check(), len(node_nums))
+            Node.objects.all().delete()
+            return len(queries)
+
+        single = run_with_transitions([7])
+        several = run_with_transitions([8, 9, 10])
+
+        self.assertEqual(single, several)
+        service_manager.resolve_publish_context.assert_called_with(interface.pk)
+        _, kwargs = publisher_service.publish_reachability_probe_bulk.call_args
+        self.assertEqual(len(kwargs["to_nodes"]), 3)
+
+    def test_recent_run_skips_config_lookup_until_due(self):
+        fixed_now = timezone.now()
+        config = KeepaliveConfig.get_solo()
+        config.enabled = True
+        config.from_node = "!00000001"
+        config.channel_name = "LongFast"
+        config.last_run_at = fixed_now - timedelta(seconds=10)
+        config.save()
+
+        with patch(
+            "stridetastic_api.services.keepalive_service.timezone.now",
+            return_value=fixed_now,
+        ):
+            self.assertEqual(self.service.run_check(), 0)
+            with self.assertNumQueries(0):
+                self.assertEqual(KeepaliveService().run_check(), 0)
+
+    def test_disabled_config_is_remembered(self):
+        self.assertEqual(self.service.run_check(), 0)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.service.run_check(), 0)
+
+    def test_missing_publish_config_sets_error(self):
+        fixed_now = timezone.now()
+        self._make_stale_nodes([6], fixed_now - timedelta(seconds=3610))
+
         config = KeepaliveConfig.get_solo()
         config.enabled = True
         config.payload_type = KeepaliveConfig.PayloadTypes.REACHABILITY
@@ -175,3 +267,166 @@ class KeepaliveServiceTests(TestCase):
         config.refresh_from_db()
         self.assertEqual(count, 0)
         self.assertIn("incomplete", config.last_error_message)
+
+    def test_large_sweeps_are_written_in_chunks(self):
+        fixed_now = timezone.now()
+        self._make_stale_nodes(range(20, 25), fixed_now - timedelta(seconds=3610))
+        config = KeepaliveConfig.get_solo()
+        config.enabled = True
+        config.from_node = "!00000001"
+        config.channel_name = "LongFast"
+        config.last_run_at = fixed_now - timedelta(seconds=120)
+        config.save()
+
+        publisher_service = MagicMock()
+        service_manager = SimpleNamespace(
+            initialize_publisher_service=MagicMock(return_value=publisher_service),
+            resolve_publish_context=MagicMock(return_value=(None, None, None)),
+        )
+        with patch(
+            "stridetastic_api.services.keepalive_service.timezone.now",
+            return_value=fixed_now,
+        ), patch(
+            "stridetastic_api.services.keepalive_service._history_batch_size", 2
+        ), patch(
+            "stridetastic_api.services.keepalive_service.FAST_HISTORY_INSERT_SECONDS",
+            0,
+        ), patch(
+            "stridetastic_api.services.service_manager.ServiceManager.get_instance",
+            return_value=service_manager,
+        ), patch.object(
+            NodePresenceHistory.objects,
+            "bulk_create",
+            wraps=NodePresenceHistory.objects.bulk_create,
+        ) as bulk_create:
+            self.assertEqual(self.service.run_check(), 5)
+
+        self.assertEqual(
+            [len(call.args[0]) for call in bulk_create.call_args_list], [2, 2, 1]
+        )
+        self.assertEqual(NodePresenceHistory.objects.count(), 5)
+        _, kwargs = publisher_service.publish_reachability_probe_bulk.call_args
+        self.assertEqual(
+            sorted(kwargs["to_nodes"]), [f"!{num:08x}" for num in range(20, 25)]
+        )
+
+    def test_idle_sweeps_stretch_the_check_interval(self):
+        fixed_now = timezone.now()
+        config = KeepaliveConfig.get_solo()
+        config.enabled = True
+        config.from_node = "!00000001"
+        config.channel_name = "LongFast"
+        config.last_run_at = fixed_now - timedelta(seconds=120)
+        config.save()
+
+        def run_at(moment) -> int:
+            # Drop the remembered schedule but keep the idle multiplier.
+            with patch(
+                "stridetastic_api.services.keepalive_service._schedule", None
+            ), patch(
+                "stridetastic_api.services.keepalive_service.timezone.now",
+                return_value=moment,
+            ):
+                return self.service.run_check()
+
+        # Nothing is offline, so the next check waits 1.5x the interval.
+        self.assertEqual(run_at(fixed_now), 0)
+        config.refresh_from_db()
+        self.assertEqual(config.last_run_at, fixed_now)
+
+        run_at(fixed_now + timedelta(seconds=72))
+        config.refresh_from_db()
+        self.assertEqual(config.last_run_at, fixed_now)
+
+        later = fixed_now + timedelta(seconds=96)
+        run_at(later)
+        config.refresh_from_db()
+        self.assertEqual(config.last_run_at, later)
+
+    def test_history_batch_size_adapts_to_insert_time(self):
+        module = "stridetastic_api.services.keepalive_service"
+        node = self._make_node("!00000030", 0x30)
+
+        def events(count):
+            return [
+                NodePresenceHistory(
+                    node=node,
+                    last_seen=timezone.now(),
+                    offline_at=timezone.now(),
+                    reason="offline_threshold",
+                )
+                for _ in range(count)
+            ]
+
+        with patch(f"{module}._history_batch_size", 200):
+            with patch(f"{module}.time.perf_counter", side_effect=[0.0, 0.01]):
+                _write_history(events(200))
+            self.assertEqual(_get_history_batch_size(), 400)
+
+            with patch(f"{module}.time.perf_counter", side_effect=[0.0, 0.01]):
+                _write_history(events(3))
+            self.assertEqual(_get_history_batch_size(), 400)
+
+            with patch(f"{module}.time.perf_counter", side_effect=[0.0, 2.0]):
+                _write_history(events(400))
+            self.assertEqual(_get_history_batch_size(), 200)
+
+        with patch(f"{module}._history_batch_size", None), self.settings(
+            KEEPALIVE_HISTORY_BATCH_SIZE=1
+        ):
+            self.assertEqual(_get_history_batch_size(), 100)
+
+    def test_task_records_unexpected_errors_with_one_update(self):
+        from ..tasks.keepalive_tasks import run_keepalive_check
+
+        with patch.object(
+            KeepaliveService, "run_check", side_effect=RuntimeError("boom")
+        ), CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(run_keepalive_check(), 0)
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        config = KeepaliveConfig.objects.get(pk=1)
+        self.assertEqual(config.last_error_message, "boom")
+        self.assertIsNotNone(config.last_run_at)
+
+
+class KeepaliveLockTests(TransactionTestCase):
+    def setUp(self) -> None:
+        clear_schedule_cache()
+        self.addCleanup(clear_schedule_cache)
+        config = KeepaliveConfig.get_solo()
+        config.enabled = True
+        config.from_node = "!00000001"
+        config.channel_name = "LongFast"
+        config.last_run_at = timezone.now() - timedelta(seconds=120)
+        config.save()
+
+    def test_run_check_skips_while_another_worker_holds_the_config(self):
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_lock() -> None:
+            try:
+                with transaction.atomic():
+                    KeepaliveConfig.objects.select_for_update().get(pk=1)
+                    locked.set()
+                    release.wait(timeout=10)
+            finally:
+                connections.close_all()
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        self.addCleanup(holder.join)
+        self.addCleanup(release.set)
+        self.assertTrue(locked.wait(timeout=10))
+
+        with patch(
+            "stridetastic_api.services.service_manager.ServiceManager.get_instance"
+        ) as get_instance:
+            self.assertEqual(KeepaliveService().run_check(), 0)
+
+        get_instance.assert_not_called()
+        before = KeepaliveConfig.objects.get(pk=1).last_run_at
+        release.set()
+        holder.join()
+        self.assertEqual(KeepaliveConfig.objects.get(pk=1).last_run_at, before)
@@ -11,94 +11,100 @@ from ninja_jwt.tokens import AccessToken  # type: ignore[import]
 from ..api import api
 from ..models import Channel, Node, NodeLink
 from ..models.packet_models import Packet, PacketData
+from ..schemas import NodeLinkSchema
 
 API_CLIENT = TestClient(api)
 
 
 class LinkControllerAPITests(TestCase):
-    def setUp(self) -> None:
-        super().setUp()
-        self.client = API_CLIENT
+    @classmethod
+    def setUpTestData(cls) -> None:
         user_model = get_user_model()
-        self.user = user_model.objects.create_user(
+        cls.user = user_model.objects.create_user(
             username="linktester",
             password="testpass123",
         )
-        self.token = str(AccessToken.for_user(self.user))
-
-        self.node_a = Node.objects.create(
-            node_num=0x21,
-            node_id="!cccc0001",
-            mac_address="00:00:00:00:cc:01",
-        )
-        self.node_b = Node.objects.create(
-            node_num=0x22,
-            node_id="!dddd0002",
-            mac_address="00:00:00:00:dd:02",
-        )
-        self.node_c = Node.objects.create(
-            node_num=0x23,
-            node_id="!eeee0003",
-            mac_address="00:00:00:00:ee:03",
+        cls.token = str(AccessToken.for_user(cls.user))
+
+        cls.node_a, cls.node_b, cls.node_c = Node.objects.bulk_create(
+            [
+                Node(
+                    node_num=0x21,
+                    node_id="!cccc0001",
+                    mac_address="00:00:00:00:cc:01",
+                ),
+                Node(
+                    node_num=0x22,
+                    node_id="!dddd0002",
+                    mac_address="00:00:00:00:dd:02",
+                ),
+                Node(
+                    node_num=0x23,
+                    node_id="!eeee0003",
+                    mac_address="00:00:00:00:ee:03",
+                ),
+            ]
         )
 
-        self.channel = Channel.objects.create(
+        cls.channel = Channel.objects.create(
             channel_id="Alpha",
             channel_num=1,
         )
-        self.channel.members.add(self.node_a, self.node_b, self.node_c)
+        cls.channel.members.add(cls.node_a, cls.node_b, cls.node_c)
 
         first_packet_time = timezone.now() - timedelta(minutes=3)
         second_packet_time = timezone.now() - timedelta(minutes=1)
 
-        self.packet_ab = Packet.objects.create(
-            from_node=self.node_a,
-            to_node=self.node_b,
+        cls.packet_ab = Packet.objects.create(
+            from_node=cls.node_a,
+            to_node=cls.node_b,
             packet_id=1001,
+            channel=cls.channel,
+            time=first_packet_time,
         )
-        Packet.objects.filter(pk=self.packet_ab.pk).update(time=first_packet_time)
         PacketData.objects.create(
-            packet=self.packet_ab,
+            packet=cls.packet_ab,
             port="TEXT_MESSAGE_APP",
             portnum=portnums_pb2.PortNum.Value("TEXT_MESSAGE_APP"),
         )
-        self.packet_ab.refresh_from_db()
-        self.packet_ab.channels.add(self.channel)
 
-        self.packet_ba = Packet.objects.create(
-            from_node=self.node_b,
-            to_node=self.node_a,
+        cls.packet_ba = Packet.objects.create(
+            from_node=cls.node_b,
+            to_node=cls.node_a,
             packet_id=1002,
+            channel=cls.channel,
+            time=second_packet_time,
         )
-        Packet.objects.filter(pk=self.packet_ba.pk).update(time=second_packet_time)
         PacketData.objects.create(
-            packet=self.packet_ba,
+            packet=cls.packet_ba,
             port="POSITION_APP",
             portnum=portnums_pb2.PortNum.Value("POSITION_APP"),
         )
-        self.packet_ba.refresh_from_db()
-        self.packet_ba.channels.add(self.channel)
 
-        self.link_bidirectional = NodeLink.objects.create(
-            node_a=self.node_a,
-            node_b=self.node_b,
+        cls.link_bidirectional = NodeLink.objects.create(
+            node_a=cls.node_a,
+            node_b=cls.node_b,
             node_a_to_node_b_packets=2,
             node_b_to_node_a_packets=1,
             is_bidirectional=True,
             last_activity=second_packet_time,
-            last_packet=self.packet_ba,
+            last_packet=cls.packet_ba,
         )
-        self.link_bidirectional.channels.add(self.channel)
+        cls.link_bidirectional.channels.add(cls.channel)
 
-        self.link_unidirectional = NodeLink.objects.create(
-            node_a=self.node_a,
-            node_b=self.node_c,
+        cls.link_unidirectional = NodeLink.objects.create(
+            node_a=cls.node_a,
+            node_b=cls.node_c,
             node_a_to_node_b_packets=5,
             node_b_to_node_a_packets=0,
             is_bidirectional=False,
             last_activity=first_packet_time,
         )
 
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = API_CLIENT
+
     def _auth_headers(self) -> dict[str, str]:
         return {"Authorization": f"Bearer {self.token}"}
 
@@ -121,6 +127,11 @@ class LinkControllerAPITests(TestCase):
         self.assertTrue(bidirectional_entry["channels"])
         self.assertEqual(bidirectional_entry["channels"][0]["channel_id"], "Alpha")
 
+        # Rows are dumped without the schema; they must still match it exactly.
+        for entry in data:
+            self.assertEqual(set(entry), set(NodeLinkSchema.model_fields))
+            NodeLinkSchema.model_validate(entry)
+
     def test_list_links_filters_by_bidirectional_flag(self) -> None:
         response = self.client.get(
             "/links/?bidirectional=false",
@@ -1,3 +1,4 @@
+import json
 from datetime import timedelta
 from decimal import Decimal
 from types import SimpleNamespace
@@ -7,6 +8,7 @@ from django.utils import timezone  # type: ignore[import]
 
 from ..controllers.metrics_controller import MetricsController
 from ..models import Channel, Edge, Interface, NetworkOverviewSnapshot, Node, NodeLink
+from ..schemas import OverviewMetricsResponseSchema
 
 
 class MetricsControllerTests(TestCase):
@@ -57,60 +59,82 @@ class MetricsControllerTests(TestCase):
             last_activity=timezone.now(),
         )
 
+    def _overview(self, **params):
+        response = self.controller.get_overview_metrics(SimpleNamespace(), **params)
+        return response.status_code, json.loads(response.content)
+
     def test_overview_metrics_records_snapshot_and_history(self) -> None:
-        status, payload = self.controller.get_overview_metrics(SimpleNamespace())
+        status, payload = self._overview()
 
         self.assertEqual(status, 200)
-        self.assertEqual(payload.current.total_nodes, 2)
-        self.assertEqual(payload.current.active_nodes, 2)
-        self.assertEqual(payload.current.reachable_nodes, 1)
-        self.assertEqual(payload.current.active_connections, 1)
-        self.assertEqual(payload.current.channels, 1)
-        self.assertAlmostEqual(payload.current.avg_battery or 0.0, 50.0)
-        self.assertAlmostEqual(payload.current.avg_rssi or 0.0, -45.0)
-        self.assertAlmostEqual(payload.current.avg_snr or 0.0, 9.5)
+        self.assertEqual(payload["current"]["total_nodes"], 2)
+        self.assertEqual(payload["current"]["active_nodes"], 2)
+        self.assertEqual(payload["current"]["reachable_nodes"], 1)
+        self.assertEqual(payload["current"]["active_connections"], 1)
+        self.assertEqual(payload["current"]["channels"], 1)
+        self.assertAlmostEqual(payload["current"]["avg_battery"] or 0.0, 50.0)
+        self.assertAlmostEqual(payload["current"]["avg_rssi"] or 0.0, -45.0)
+        self.assertAlmostEqual(payload["current"]["avg_snr"] or 0.0, 9.5)
 
         self.assertEqual(NetworkOverviewSnapshot.objects.count(), 1)
-        self.assertEqual(len(payload.history), 1)
-        self.assertEqual(payload.history[0].reachable_nodes, 1)
+        self.assertEqual(len(payload["history"]), 1)
+        self.assertEqual(payload["history"][0]["reachable_nodes"], 1)
+
+    def test_history_entries_match_schema(self) -> None:
+        self._overview()
+        snapshot = NetworkOverviewSnapshot.objects.get()
+
+        status, payload = self._overview(record_snapshot=False)
+
+        self.assertEqual(status, 200)
+        parsed = OverviewMetricsResponseSchema.model_validate(payload)
+        self.assertEqual(parsed.history[0].timestamp, snapshot.time)
+        self.assertAlmostEqual(parsed.history[0].avg_snr or 0.0, 9.5)
+
+    def test_rewritten_snapshot_is_served_fresh(self) -> None:
+        self._overview()
+        NetworkOverviewSnapshot.objects.update(total_nodes=99)
+
+        status, payload = self._overview(record_snapshot=False)
+
+        self.assertEqual(status, 200)
+        self.assertEqual(payload["history"][0]["total_nodes"], 99)
 
     def test_history_filters_and_optional_snapshot(self) -> None:
-        self.controller.get_overview_metrics(SimpleNamespace())
+        self._overview()
         self.assertEqual(NetworkOverviewSnapshot.objects.count(), 1)
 
         ten_minutes_ago = timezone.now() - timedelta(minutes=10)
         NetworkOverviewSnapshot.objects.update(time=ten_minutes_ago)
 
-        status, payload = self.controller.get_overview_metrics(
-            SimpleNamespace(),
+        status, payload = self._overview(
             history_last="5min",
             record_snapshot=False,
         )
 
         self.assertEqual(status, 200)
         self.assertEqual(NetworkOverviewSnapshot.objects.count(), 1)
-        self.assertEqual(len(payload.history), 0)
+        self.assertEqual(len(payload["history"]), 0)
 
-        status, payload = self.controller.get_overview_metrics(
-            SimpleNamespace(),
+        status, payload = self._overview(
             include_history=True,
             history_last="1hour",
             record_snapshot=False,
         )
         self.assertEqual(status, 200)
-        self.assertEqual(len(payload.history), 1)
-        self.assertEqual(payload.history[0].reachable_nodes, 1)
+        self.assertEqual(len(payload["history"]), 1)
+        self.assertEqual(payload["history"][0]["reachable_nodes"], 1)
 
     def test_reachable_nodes_excludes_inactive_nodes(self) -> None:
         inactive_time = timezone.now() - timedelta(hours=2)
         Node.objects.filter(pk=self.node_a.pk).update(last_seen=inactive_time)
 
-        status, payload = self.controller.get_overview_metrics(SimpleNamespace())
+        status, payload = self._overview()
 
         self.assertEqual(status, 200)
-        self.assertEqual(payload.current.total_nodes, 2)
-        self.assertEqual(payload.current.active_nodes, 1)
-        self.assertEqual(payload.current.reachable_nodes, 0)
+        self.assertEqual(payload["current"]["total_nodes"], 2)
+        self.assertEqual(payload["current"]["active_nodes"], 1)
+        self.assertEqual(payload["current"]["reachable_nodes"], 0)
 
         snapshot = NetworkOverviewSnapshot.objects.order_by("-time").first()
         self.assertIsNotNone(snapshot)
@@ -3,6 +3,7 @@ from datetime import timezone as dt_timezone
 from django.test import TestCase  # type: ignore[import]
 from meshtastic.protobuf import mesh_pb2  # type: ignore[attr-defined]
 
+from ..mesh import node_cache
 from ..mesh.packet.handler import handle_neighborinfo
 from ..mesh.utils import id_to_num
 from ..models import Edge, Node, Packet
@@ -10,23 +11,33 @@ from ..models.packet_models import NeighborInfoPayload, PacketData
 
 
 class NeighborInfoHandlerTests(TestCase):
-    def setUp(self) -> None:
-        self.reporting_node = Node.objects.create(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.reporting_node = Node.objects.create(
             node_num=int("00000001", 16),
             node_id="!00000001",
             mac_address="00:00:00:00:00:01",
         )
-        self.destination_node = Node.objects.create(
+        cls.destination_node = Node.objects.create(
             node_num=int("00000002", 16),
             node_id="!00000002",
             mac_address="00:00:00:00:00:02",
         )
 
-        self.packet = Packet.objects.create(
-            from_node=self.reporting_node,
-            to_node=self.destination_node,
+        cls.packet = Packet.objects.create(
+            from_node=cls.reporting_node,
+            to_node=cls.destination_node,
+        )
+        cls.packet_data = PacketData.objects.create(packet=cls.packet)
+
+    def setUp(self) -> None:
+        # Start from a known cache so the query counts below are stable.
+        node_cache.clear_node_cache()
+        self.addCleanup(node_cache.clear_node_cache)
+        node_cache.remember_node(self.reporting_node.node_num, self.reporting_node.pk)
+        node_cache.remember_node(
+            self.destination_node.node_num, self.destination_node.pk
         )
-        self.packet_data = PacketData.objects.create(packet=self.packet)
 
     def test_neighborinfo_creates_payload_neighbors_and_edges(self) -> None:
         neighbor_info = mesh_pb2.NeighborInfo()
@@ -42,7 +53,8 @@ class NeighborInfoHandlerTests(TestCase):
 
         payload_bytes = neighbor_info.SerializeToString()
 
-        handle_neighborinfo(payload_bytes, self.packet_data)
+        with self.assertNumQueries(16):
+            handle_neighborinfo(payload_bytes, self.packet_data)
 
         payload = NeighborInfoPayload.objects.get(packet_data=self.packet_data)
         self.assertEqual(payload.reporting_node, self.reporting_node)
@@ -80,7 +92,8 @@ class NeighborInfoHandlerTests(TestCase):
         first_neighbor.node_id = self.destination_node.node_num
         first_neighbor.snr = 5.0
 
-        handle_neighborinfo(first_info.SerializeToString(), self.packet_data)
+        with self.assertNumQueries(15):
+            handle_neighborinfo(first_info.SerializeToString(), self.packet_data)
 
         # second payload should replace previous neighbor entries
         second_info = mesh_pb2.NeighborInfo()
@@ -89,7 +102,8 @@ class NeighborInfoHandlerTests(TestCase):
         new_neighbor.node_id = id_to_num("!00000003")
         new_neighbor.snr = 8.25
 
-        handle_neighborinfo(second_info.SerializeToString(), self.packet_data)
+        with self.assertNumQueries(16):
+            handle_neighborinfo(second_info.SerializeToString(), self.packet_data)
 
         payload = NeighborInfoPayload.objects.get(packet_data=self.packet_data)
         neighbors = list(payload.neighbors.all())
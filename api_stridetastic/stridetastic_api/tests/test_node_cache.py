@@ -0,0 +1,76 @@
+from django.test import TestCase  # type: ignore[import]
+
+from ..mesh import node_cache
+from ..mesh.packet.handler import _touch_node
+from ..models import Node
+from ..signals import node_signals  # noqa: F401 - connects the cache receivers
+
+
+class NodeCacheTests(TestCase):
+    def setUp(self) -> None:
+        node_cache.clear_node_cache()
+        self.addCleanup(node_cache.clear_node_cache)
+
+    def _create_node(self, node_num: int) -> Node:
+        return Node.objects.create(
+            node_num=node_num,
+            node_id=f"!{node_num:08x}",
+            mac_address=f"00:00:00:00:00:{node_num:02x}",
+        )
+
+    def test_saved_nodes_are_cached_and_deleted_nodes_forgotten(self) -> None:
+        node = self._create_node(0x41)
+        self.assertEqual(node_cache.get_node_pk(0x41), node.pk)
+
+        node.delete()
+        self.assertIsNone(node_cache.get_node_pk(0x41))
+
+    def test_renumbered_node_drops_previous_entry(self) -> None:
+        node = self._create_node(0x42)
+        node.node_num = 0x43
+        node.save()
+
+        self.assertIsNone(node_cache.get_node_pk(0x42))
+        self.assertEqual(node_cache.get_node_pk(0x43), node.pk)
+
+    def test_warm_loads_existing_nodes(self) -> None:
+        first = self._create_node(0x44)
+        second = self._create_node(0x45)
+        node_cache.clear_node_cache()
+
+        self.assertEqual(node_cache.warm_node_cache(), 2)
+        self.assertEqual(node_cache.get_node_pk(0x44), first.pk)
+        self.assertEqual(node_cache.get_node_pk(0x45), second.pk)
+
+    def test_touch_uses_cached_pk_with_single_update(self) -> None:
+        node = self._create_node(0x46)
+        previous_seen = node.last_seen
+
+        with self.assertNumQueries(1):
+            self.assertEqual(_touch_node(0x46), node.pk)
+
+        node.refresh_from_db()
+        self.assertGreater(node.last_seen, previous_seen)
+
+    def test_touch_recovers_from_stale_entry(self) -> None:
+        node_cache.remember_node(0x47, 987654)
+
+        node_pk = _touch_node(0x47)
+
+        node = Node.objects.get(node_num=0x47)
+        self.assertEqual(node_pk, node.pk)
+        self.assertEqual(node_cache.get_node_pk(0x47), node.pk)
+
+    def test_touch_backfills_identity_through_the_full_path(self) -> None:
+        node = Node.objects.create(
+            node_num=0x48,
+            node_id="!stale048",
+            mac_address="00:00:00:00:00:00",
+        )
+        node_cache.remember_node(0x48, node.pk)
+
+        self.assertEqual(_touch_node(0x48), node.pk)
+
+        node.refresh_from_db()
+        self.assertEqual(node.node_id, "!00000048")
+        self.assertEqual(node.mac_address, "00:00:00:00:00:48")
@@ -6,18 +6,23 @@ from ninja_jwt.tokens import AccessToken
 from ..api import api
 from ..models import Node
 
+API_CLIENT = TestClient(api)
+
 
 class NodeKeyHealthAPITests(TestCase):
-    def setUp(self) -> None:
-        self.client = TestClient(api)
+    @classmethod
+    def setUpTestData(cls) -> None:
         user_model = get_user_model()
-        self.user = user_model.objects.create_user(
+        cls.user = user_model.objects.create_user(
             username="key_health_tester",
             password="testpass123",
             email="tester@example.com",
         )
-        self.token = str(AccessToken.for_user(self.user))
-        self.headers = {"Authorization": f"Bearer {self.token}"}
+        cls.token = str(AccessToken.for_user(cls.user))
+        cls.headers = {"Authorization": f"Bearer {cls.token}"}
+
+    def setUp(self) -> None:
+        self.client = API_CLIENT
 
     def _create_node(self, **overrides) -> Node:
         base_index = Node.objects.count() + 1
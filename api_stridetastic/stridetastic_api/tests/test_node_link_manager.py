@@ -5,13 +5,14 @@ from ..models.packet_models import Packet
 
 
 class NodeLinkManagerTests(TestCase):
-    def setUp(self) -> None:
-        self.broadcast = Node.objects.create(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.broadcast = Node.objects.create(
             node_num=0xFFFFFFFF,
             node_id="!ffffffff",
             mac_address="FF:FF:FF:FF:FF:FF",
         )
-        self.first_node = Node.objects.create(
+        cls.first_node = Node.objects.create(
             node_num=0x00000001,
             node_id="!00000001",
             mac_address="00:00:00:00:00:01",
@@ -0,0 +1,73 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from ninja.testing import TestClient
+from ninja_jwt.tokens import AccessToken
+
+from ..api import api
+from ..models import Node
+from ..schemas import NodeSchema
+
+
+class NodeSummaryAPITests(TestCase):
+    def setUp(self) -> None:
+        self.client = TestClient(api)
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(
+            username="node_summary_tester",
+            password="testpass123",
+            email="tester@example.com",
+        )
+        self.token = str(AccessToken.for_user(self.user))
+        self.headers = {"Authorization": f"Bearer {self.token}"}
+        self.node = Node.objects.create(
+            node_num=4242,
+            node_id="!00001092",
+            mac_address="AA:BB:CC:00:10:92",
+            short_name="SUMM",
+            latitude=37.98,
+            longitude=23.72,
+            battery_level=87,
+            voltage=4.1,
+            temperature=21.5,
+        )
+
+    def test_summary_omits_telemetry_by_default(self) -> None:
+        response = self.client.get("/nodes/summary", headers=self.headers)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data), 1)
+        item = data[0]
+        self.assertEqual(item["node_id"], self.node.node_id)
+        self.assertEqual(item["short_name"], "SUMM")
+        self.assertAlmostEqual(item["latitude"], 37.98)
+        self.assertIsNone(item["telemetry"])
+        self.assertNotIn("public_key", item)
+        self.assertNotIn("battery_level", item)
+
+    def test_summary_includes_telemetry_on_request(self) -> None:
+        response = self.client.get(
+            "/nodes/summary?include_telemetry=true", headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 200)
+        telemetry = response.json()[0]["telemetry"]
+        self.assertEqual(telemetry["battery_level"], 87)
+        self.assertAlmostEqual(telemetry["voltage"], 4.1)
+        self.assertAlmostEqual(telemetry["temperature"], 21.5)
+        self.assertIsNone(telemetry["iaq"])
+
+    def test_summary_rejects_invalid_window(self) -> None:
+        response = self.client.get("/nodes/summary?last=bogus", headers=self.headers)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_full_listing_keeps_flat_telemetry(self) -> None:
+        response = self.client.get("/nodes/", headers=self.headers)
+
+        self.assertEqual(response.status_code, 200)
+        item = response.json()[0]
+        self.assertEqual(item["battery_level"], 87)
+        self.assertEqual(item["interfaces"], [])
+        self.assertEqual(set(item), set(NodeSchema.model_fields))
+        NodeSchema.model_validate(item)
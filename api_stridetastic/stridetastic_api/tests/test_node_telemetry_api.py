@@ -1,4 +1,4 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
@@ -8,8 +8,14 @@ from ninja.testing import TestClient
 from ninja_jwt.tokens import AccessToken
 
 from ..api import api
-from ..models import Node
-from ..models.packet_models import Packet, PacketData, TelemetryPayload
+from ..models import Node, NodeTelemetryHourly
+from ..models.packet_models import (
+    DeviceTelemetryPayload,
+    EnvironmentTelemetryPayload,
+    Packet,
+    PacketData,
+)
+from ..tasks.metrics_tasks import refresh_node_telemetry_rollups
 
 
 class NodeTelemetryHistoryAPITests(TestCase):
@@ -38,7 +44,8 @@ class NodeTelemetryHistoryAPITests(TestCase):
         self,
         *,
         idx: int,
-        minutes_ago: int,
+        minutes_ago: int = 0,
+        received_at: datetime | None = None,
         battery_level: int = 70,
         voltage: Decimal = Decimal("3.70"),
         temperature: Decimal = Decimal("22.5"),
@@ -48,16 +55,22 @@ class NodeTelemetryHistoryAPITests(TestCase):
             to_node=self.destination_node,
         )
         packet_data = PacketData.objects.create(packet=packet)
-        payload = TelemetryPayload.objects.create(
+        if received_at is None:
+            received_at = timezone.now() - timedelta(minutes=minutes_ago)
+        device = DeviceTelemetryPayload.objects.create(
             packet_data=packet_data,
             battery_level=battery_level,
             voltage=voltage + Decimal(idx) * Decimal("0.01"),
+            uptime_seconds=1000 + idx * 60,
+        )
+        environment = EnvironmentTelemetryPayload.objects.create(
+            packet_data=packet_data,
             temperature=temperature + Decimal(idx) * Decimal("0.1"),
             relative_humidity=Decimal("40.0") + idx,
-            uptime_seconds=1000 + idx * 60,
         )
-        payload.time = timezone.now() - timedelta(minutes=minutes_ago)
-        payload.save(update_fields=["time"])
+        for payload in (device, environment):
+            payload.time = received_at
+            payload.save(update_fields=["time"])
 
     def test_returns_telemetry_in_chronological_order(self) -> None:
         self._create_telemetry(idx=0, minutes_ago=30)
@@ -77,6 +90,8 @@ class NodeTelemetryHistoryAPITests(TestCase):
         self.assertAlmostEqual(data[-1]["voltage"], 3.72, places=2)
         self.assertEqual(data[-1]["battery_level"], 70)
         self.assertEqual(data[-1]["uptime_seconds"], 1000 + 2 * 60)
+        self.assertAlmostEqual(data[-1]["temperature"], 22.7, places=2)
+        self.assertAlmostEqual(data[-1]["relative_humidity"], 42.0, places=2)
 
     def test_respects_limit_parameter(self) -> None:
         for idx, minutes in enumerate([60, 45, 30, 15, 5]):
@@ -94,6 +109,84 @@ class NodeTelemetryHistoryAPITests(TestCase):
         self.assertAlmostEqual(voltages[0], 3.73, places=2)
         self.assertAlmostEqual(voltages[1], 3.74, places=2)
 
+    def test_merges_environment_only_packets(self) -> None:
+        self._create_telemetry(idx=0, minutes_ago=20)
+        packet = Packet.objects.create(
+            from_node=self.origin_node,
+            to_node=self.destination_node,
+        )
+        EnvironmentTelemetryPayload.objects.create(
+            packet_data=PacketData.objects.create(packet=packet),
+            temperature=Decimal("19.5"),
+        )
+
+        response = self.client.get(
+            f"/nodes/{self.origin_node.node_id}/telemetry",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]["battery_level"], 70)
+        self.assertAlmostEqual(data[0]["temperature"], 22.5, places=2)
+        self.assertIsNone(data[1]["battery_level"])
+        self.assertAlmostEqual(data[1]["temperature"], 19.5, places=2)
+
+    def test_hourly_resolution_reads_rollup_table(self) -> None:
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        earlier_hour = hour - timedelta(hours=2)
+        self._create_telemetry(
+            idx=0, received_at=earlier_hour + timedelta(minutes=5), battery_level=60
+        )
+        self._create_telemetry(
+            idx=2, received_at=earlier_hour + timedelta(minutes=35), battery_level=80
+        )
+        self._create_telemetry(
+            idx=4, received_at=hour + timedelta(seconds=30), battery_level=90
+        )
+        self.assertTrue(refresh_node_telemetry_rollups())
+
+        response = self.client.get(
+            f"/nodes/{self.origin_node.node_id}/telemetry?resolution=1h",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]["battery_level"], 70)
+        self.assertAlmostEqual(data[0]["voltage"], 3.71, places=2)
+        self.assertAlmostEqual(data[0]["temperature"], 22.6, places=2)
+        self.assertEqual(data[0]["uptime_seconds"], 1000 + 2 * 60)
+        self.assertEqual(data[1]["battery_level"], 90)
+
+    def test_rollup_refresh_upserts_only_recent_buckets(self) -> None:
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        self._create_telemetry(
+            idx=0, received_at=hour - timedelta(hours=5), battery_level=10
+        )
+        self._create_telemetry(idx=1, battery_level=90)
+        self.assertTrue(refresh_node_telemetry_rollups())
+
+        rollup = NodeTelemetryHourly.objects.get(node=self.origin_node)
+        self.assertEqual(rollup.bucket, hour)
+        self.assertEqual(rollup.sample_count, 1)
+
+        self._create_telemetry(idx=2, battery_level=70)
+        self.assertTrue(refresh_node_telemetry_rollups())
+
+        rollup = NodeTelemetryHourly.objects.get(node=self.origin_node)
+        self.assertEqual(rollup.sample_count, 2)
+        self.assertAlmostEqual(rollup.battery_level, 80.0)
+
+    def test_rejects_unknown_resolution(self) -> None:
+        response = self.client.get(
+            f"/nodes/{self.origin_node.node_id}/telemetry?resolution=5m",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(response.status_code, 400)
+
     def test_returns_empty_list_when_no_telemetry(self) -> None:
         response = self.client.get(
             f"/nodes/{self.origin_node.node_id}/telemetry",
@@ -3,6 +3,7 @@ from datetime import timedelta
 from django.test import TestCase  # type: ignore[import]
 from django.utils import timezone  # type: ignore[import]
 from meshtastic.protobuf import portnums_pb2  # type: ignore[attr-defined]
+from pydantic import TypeAdapter
 
 from ..models import Node
 from ..models.packet_models import (
@@ -14,8 +15,12 @@ from ..models.packet_models import (
     RouteDiscoveryRoute,
     RoutingPayload,
 )
+from ..schemas import OpaquePayloadSchema, PacketPayloadSchema
+from ..schemas.payload_schemas import TextMessagePayloadSchema
 from ..utils.packet_payloads import build_packet_payload_schema
 
+PAYLOAD_ADAPTER = TypeAdapter(PacketPayloadSchema | None)
+
 
 class PacketPayloadSchemaTests(TestCase):
     def setUp(self) -> None:
@@ -56,7 +61,7 @@ class PacketPayloadSchemaTests(TestCase):
 
         assert schema is not None
         self.assertEqual(schema.payload_type, "text_message")
-        self.assertEqual(schema.fields.get("text"), "Hello mesh!")
+        self.assertEqual(schema.fields.text, "Hello mesh!")
 
     def test_neighbor_info_payload_serializes_neighbors(self) -> None:
         packet_data = self._make_packet_data(port="NEIGHBORINFO_APP")
@@ -80,15 +85,15 @@ class PacketPayloadSchemaTests(TestCase):
 
         assert schema is not None
         self.assertEqual(schema.payload_type, "neighbor_info")
-        self.assertEqual(schema.fields.get("neighbors_count"), 1)
-        neighbors = schema.fields.get("neighbors")
+        self.assertEqual(schema.fields.neighbors_count, 1)
+        neighbors = schema.fields.neighbors
         self.assertIsInstance(neighbors, list)
         assert isinstance(neighbors, list)
         self.assertGreater(len(neighbors), 0)
         neighbor_entry = neighbors[0]
         self.assertIsInstance(neighbor_entry, dict)
         self.assertEqual(neighbor_entry.get("advertised_node_id"), self.node_b.node_id)
-        reporting = schema.fields.get("reporting_node")
+        reporting = schema.fields.reporting_node
         self.assertIsInstance(reporting, dict)
         assert isinstance(reporting, dict)
         self.assertEqual(reporting.get("node_id"), self.node_a.node_id)
@@ -110,11 +115,11 @@ class PacketPayloadSchemaTests(TestCase):
 
         assert schema is not None
         self.assertEqual(schema.payload_type, "route_discovery")
-        towards = schema.fields.get("route_towards")
+        towards = schema.fields.route_towards
         self.assertIsInstance(towards, dict)
         assert isinstance(towards, dict)
         self.assertEqual(towards.get("hops"), 2)
-        snr_list = schema.fields.get("snr_towards")
+        snr_list = schema.fields.snr_towards
         self.assertEqual(snr_list, [0.75, 0.5])
 
     def test_routing_payload_includes_error_reason_and_metadata(self) -> None:
@@ -132,6 +137,32 @@ class PacketPayloadSchemaTests(TestCase):
 
         assert schema is not None
         self.assertEqual(schema.payload_type, "routing")
-        self.assertEqual(schema.fields.get("error_reason"), "NO_ROUTE")
-        self.assertEqual(schema.fields.get("source"), self.node_a.node_num)
-        self.assertEqual(schema.fields.get("dest"), self.node_b.node_num)
+        self.assertEqual(schema.fields.error_reason, "NO_ROUTE")
+        self.assertEqual(schema.fields.source, self.node_a.node_num)
+        self.assertEqual(schema.fields.dest, self.node_b.node_num)
+
+    def test_payload_fields_dump_only_observed_values(self) -> None:
+        packet_data = self._make_packet_data(
+            port="TEXT_MESSAGE_APP",
+            raw_payload="Hello mesh!",
+            source=self.node_a.node_num,
+        )
+
+        schema = build_packet_payload_schema(packet_data)
+
+        self.assertIsInstance(schema, TextMessagePayloadSchema)
+        self.assertEqual(
+            PAYLOAD_ADAPTER.dump_python(schema),
+            {
+                "payload_type": "text_message",
+                "fields": {"source": self.node_a.node_num, "text": "Hello mesh!"},
+            },
+        )
+
+    def test_unknown_payload_type_falls_back_to_opaque(self) -> None:
+        payload = PAYLOAD_ADAPTER.validate_python(
+            {"payload_type": "store_forward", "fields": {"history": [1, 2]}}
+        )
+
+        self.assertIsInstance(payload, OpaquePayloadSchema)
+        self.assertEqual(payload.fields, {"history": [1, 2]})
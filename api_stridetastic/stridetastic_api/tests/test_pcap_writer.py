@@ -1,4 +1,5 @@
 import struct
+from datetime import datetime, timezone
 
 from stridetastic_api.utils.pcap_writer import PcapNgWriter
 
@@ -89,3 +90,54 @@ def test_pcapng_writer_context_manager(tmp_path):
     assert output_path.exists()
     file_size = output_path.stat().st_size
     assert writer.bytes_written == file_size
+
+
+def test_pcapng_writer_buffers_until_flush(tmp_path):
+    output_path = tmp_path / "buffered.pcapng"
+
+    writer = PcapNgWriter(output_path, buffer_size=4096)
+    writer.write_mesh_packet(b"\x08\x96\x01")
+
+    assert output_path.stat().st_size == 0
+    assert writer.bytes_written > 0
+
+    writer.flush()
+    assert output_path.stat().st_size == writer.bytes_written
+
+    writer.write_data_packet(b"\x12\x03abc")
+    writer.close()
+    blocks = list(_iter_pcapng_blocks(output_path.read_bytes()))
+    assert len(blocks) == 5
+    assert writer.bytes_written == output_path.stat().st_size
+
+
+def test_pcapng_writer_writes_through_when_buffer_fills(tmp_path):
+    output_path = tmp_path / "threshold.pcapng"
+
+    writer = PcapNgWriter(output_path, buffer_size=256)
+    writer.write_mesh_packet(b"\x00" * 300)
+
+    assert output_path.stat().st_size == writer.bytes_written
+    writer.close()
+
+
+def test_pcapng_writer_packet_group_matches_individual_writes(tmp_path):
+    timestamp = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    extras = [("meshtastic.protobuf.Position", b"\x0d\x01\x00\x00\x00")]
+
+    separate = PcapNgWriter(tmp_path / "separate.pcapng")
+    separate.write_mesh_packet(b"\x08\x96\x01", timestamp)
+    separate.write_data_packet(b"\x12\x03abc", timestamp)
+    for message_type, payload in extras:
+        separate.write_packet(
+            message_type=message_type, payload=payload, timestamp=timestamp
+        )
+    separate.close()
+
+    grouped = PcapNgWriter(tmp_path / "grouped.pcapng")
+    grouped.write_packet_group(b"\x08\x96\x01", b"\x12\x03abc", extras, timestamp)
+    grouped.close()
+
+    assert (tmp_path / "grouped.pcapng").read_bytes() == (
+        tmp_path / "separate.pcapng"
+    ).read_bytes()
@@ -2,9 +2,11 @@ import base64
 from types import SimpleNamespace
 
 import pytest
+from meshtastic.protobuf import mesh_pb2
 from stridetastic_api.mesh.encryption import pkc
 from stridetastic_api.models import Node
-from stridetastic_api.services.pki_service import PKIService
+from stridetastic_api.services.pki_service import PKIService, clear_public_key_cache
+from stridetastic_api.signals import node_signals  # noqa: F401 - connects receivers
 
 PRIVATE_KEY_HEX = "a00330633e63522f8a4d81ec6d9d1e6617f6c8ffd3a4c698229537d44e522277"
 REMOTE_PUBLIC_HEX = "db18fc50eea47f00251cb784819a3cf5fc361882597f589f0d7ff820e8064457"
@@ -26,6 +28,13 @@ def test_decrypt_with_private_key_meshtastic_vector():
     assert plaintext == bytes.fromhex(PLAINTEXT_HEX)
 
 
+@pytest.fixture(autouse=True)
+def _empty_public_key_cache():
+    clear_public_key_cache()
+    yield
+    clear_public_key_cache()
+
+
 @pytest.mark.django_db
 def test_pki_service_decrypts_packet():
     service = PKIService()
@@ -57,3 +66,126 @@ def test_pki_service_decrypts_packet():
 
     assert result.success is True
     assert result.plaintext == bytes.fromhex(PLAINTEXT_HEX)
+
+
+@pytest.mark.django_db
+def test_remote_public_keys_are_cached_until_the_key_changes(
+    django_assert_num_queries,
+):
+    service = PKIService()
+    assert service._resolve_remote_public_key(0x0930) is None
+
+    remote_node = Node.objects.create(
+        node_num=0x0930,
+        node_id="!00000930",
+        mac_address="AA:00:00:00:09:30",
+        public_key=base64.b64encode(bytes.fromhex(REMOTE_PUBLIC_HEX)).decode("ascii"),
+    )
+    # Creating the node evicts the cached miss.
+    assert service._resolve_remote_public_key(0x0930) == bytes.fromhex(
+        REMOTE_PUBLIC_HEX
+    )
+
+    remote_node.save(update_fields=["last_seen"])
+    with django_assert_num_queries(0):
+        assert service._resolve_remote_public_key(0x0930) == bytes.fromhex(
+            REMOTE_PUBLIC_HEX
+        )
+
+    remote_node.public_key = ""
+    remote_node.save(update_fields=["public_key"])
+    assert service._resolve_remote_public_key(0x0930) is None
+
+
+@pytest.mark.django_db
+def test_cached_public_key_survives_saves_that_keep_the_key(
+    django_assert_num_queries,
+):
+    service = PKIService()
+    public_key = base64.b64encode(bytes.fromhex(REMOTE_PUBLIC_HEX)).decode("ascii")
+    Node.objects.create(
+        node_num=0x0931,
+        node_id="!00000931",
+        mac_address="AA:00:00:00:09:31",
+        public_key=public_key,
+    )
+    assert service._resolve_remote_public_key(0x0931) == bytes.fromhex(
+        REMOTE_PUBLIC_HEX
+    )
+
+    remote_node = Node.objects.get(node_num=0x0931)
+    remote_node.update_last_seen()
+    remote_node.long_name = "Renamed"
+    remote_node.save()
+    with django_assert_num_queries(0):
+        assert service._resolve_remote_public_key(0x0931) == bytes.fromhex(
+            REMOTE_PUBLIC_HEX
+        )
+
+    remote_node.public_key = ""
+    remote_node.save()
+    assert service._resolve_remote_public_key(0x0931) is None
+
+
+@pytest.mark.django_db
+def test_pki_service_rejects_short_payload_before_metadata():
+    service = PKIService()
+    target_node = Node.objects.create(
+        node_num=0x0002,
+        node_id="!00000002",
+        mac_address="AA:00:00:00:00:02",
+        private_key=base64.b64encode(bytes.fromhex(PRIVATE_KEY_HEX)).decode("ascii"),
+    )
+    # No "from" attribute: the length check must reject the packet first.
+    packet = SimpleNamespace(id=1, to=target_node.node_num, encrypted=b"\x01" * 12)
+
+    result = service.decrypt_packet(packet, target_node)
+
+    assert result.success is False
+    assert result.reason == "Encrypted payload too short for PKI decryption"
+
+
+@pytest.mark.django_db
+def test_pki_service_decrypts_mesh_packet_with_embedded_key(
+    django_assert_num_queries,
+):
+    service = PKIService()
+    target_node = Node.objects.create(
+        node_num=0x0003,
+        node_id="!00000003",
+        mac_address="AA:00:00:00:00:03",
+        private_key=base64.b64encode(bytes.fromhex(PRIVATE_KEY_HEX)).decode("ascii"),
+    )
+    packet = mesh_pb2.MeshPacket(
+        id=0x13B2D662,
+        to=target_node.node_num,
+        encrypted=bytes.fromhex(ENCRYPTED_HEX),
+        public_key=bytes.fromhex(REMOTE_PUBLIC_HEX),
+        pki_encrypted=True,
+    )
+    setattr(packet, "from", 0x0929)
+
+    # The embedded sender key needs no lookup.
+    with django_assert_num_queries(0):
+        result = service.decrypt_packet(packet, target_node)
+
+    assert result.success is True
+    assert result.plaintext == bytes.fromhex(PLAINTEXT_HEX)
+
+
+@pytest.mark.django_db
+def test_pki_service_requires_loaded_private_key(django_assert_num_queries):
+    service = PKIService()
+    target_node = Node.objects.create(
+        node_num=0x0004,
+        node_id="!00000004",
+        mac_address="AA:00:00:00:00:04",
+    )
+    packet = SimpleNamespace(id=1, to=target_node.node_num, encrypted=b"\x01" * 32)
+    setattr(packet, "from", 0x0929)
+
+    with django_assert_num_queries(0):
+        result = service.decrypt_packet(packet, target_node)
+
+    assert result.success is False
+    assert result.reason == "Private key not available for target node"
@@ -1,7 +1,7 @@
 from datetime import timedelta
 
 from django.contrib.auth import get_user_model  # type: ignore[import]
-from django.test import TestCase  # type: ignore[import]
+from django.test import SimpleTestCase, TestCase  # type: ignore[import]
 from django.utils import timezone  # type: ignore[import]
 from meshtastic.protobuf import portnums_pb2  # type: ignore[attr-defined]
 from ninja.testing import TestClient  # type: ignore[import]
@@ -9,7 +9,18 @@ from ninja_jwt.tokens import AccessToken  # type: ignore[import]
 
 from ..api import api
 from ..models import Node  # type: ignore[import]
-from ..models.packet_models import Packet, PacketData, TelemetryPayload
+from ..models.packet_models import (
+    DeviceTelemetryPayload,
+    EnvironmentTelemetryPayload,
+    Packet,
+    PacketData,
+)
+from ..schemas import PortActivitySchema
+from ..utils.ports import (
+    PORT_DISPLAY_NAMES,
+    port_display_name,
+    resolve_port_identity,
+)
 
 
 class PortActivityAPITests(TestCase):
@@ -122,7 +133,7 @@ class PortActivityAPITests(TestCase):
             receiver=self.node_b,
             port="TELEMETRY_APP",
         )
-        TelemetryPayload.objects.create(
+        DeviceTelemetryPayload.objects.create(
             packet_data=telemetry_sent,
             battery_level=87,
             voltage=4.15,
@@ -134,7 +145,7 @@ class PortActivityAPITests(TestCase):
             port="TELEMETRY_APP",
             minutes_ago=5,
         )
-        TelemetryPayload.objects.create(
+        EnvironmentTelemetryPayload.objects.create(
             packet_data=telemetry_received,
             temperature=21.5,
             relative_humidity=48.2,
@@ -209,3 +220,30 @@ class PortActivityAPITests(TestCase):
 
         self.assertEqual(response.status_code, 400)
         self.assertIn("Port identifier", response.json()["message"])
+
+
+class PortDisplayNameTests(SimpleTestCase):
+    def test_known_ports_share_interned_labels(self) -> None:
+        port, label = resolve_port_identity(None, portnums_pb2.TEXT_MESSAGE_APP)
+
+        self.assertEqual(port, "TEXT_MESSAGE_APP")
+        self.assertIs(label, PORT_DISPLAY_NAMES["TEXT_MESSAGE_APP"])
+        self.assertIs(port_display_name(port), label)
+
+    def test_unknown_ports_get_a_humanized_label(self) -> None:
+        self.assertEqual(
+            resolve_port_identity(None, 4242), ("UNKNOWN_4242", "Unknown 4242")
+        )
+        self.assertEqual(resolve_port_identity(None, None), ("UNKNOWN", "Unknown"))
+
+    def test_unknown_ports_are_not_cached(self) -> None:
+        known = len(PORT_DISPLAY_NAMES)
+        for value in range(9000, 9010):
+            port_display_name(f"UNKNOWN_{value}")
+            resolve_port_identity(f"CLIENT_SUPPLIED_{value}", None)
+        self.assertEqual(len(PORT_DISPLAY_NAMES), known)
+
+    def test_schema_derives_display_name_from_port(self) -> None:
+        entry = PortActivitySchema.from_trusted(port="UNKNOWN", total_packets=3)
+
+        self.assertEqual(entry.model_dump()["display_name"], "Unknown")
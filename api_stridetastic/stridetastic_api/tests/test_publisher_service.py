@@ -1,8 +1,10 @@
 from datetime import timedelta
+from threading import Barrier
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
 from meshtastic.protobuf import portnums_pb2
 
 from ..mesh.packet import handler
@@ -25,27 +27,6 @@ class DummyInterfaceRelation:
         return list(self._interfaces)
 
 
-class DummyChannelRelation:
-    def __init__(self, channels):
-        self._channels = list(channels)
-
-    def all(self):
-        return self
-
-    def filter(self, interfaces=None):
-        if interfaces is None:
-            return DummyChannelRelation(self._channels)
-        filtered = [
-            channel
-            for channel in self._channels
-            if interfaces in getattr(channel, "interfaces", [])
-        ]
-        return DummyChannelRelation(filtered)
-
-    def first(self):
-        return self._channels[0] if self._channels else None
-
-
 class DummyNodeRelation:
     def __init__(self, nodes):
         self._nodes = list(nodes)
@@ -144,7 +125,7 @@ class PublisherServiceReactiveTests(TestCase):
         gateway_stub = SimpleNamespace(node_id="!gateway0001")
         packet_obj = SimpleNamespace(
             interfaces=DummyInterfaceRelation([interface_stub]),
-            channels=DummyChannelRelation([channel_stub]),
+            channel=channel_stub,
             gateway_nodes=DummyNodeRelation([gateway_stub]),
         )
 
@@ -198,7 +179,7 @@ class PublisherServiceReactiveTests(TestCase):
         gateway_stub = SimpleNamespace(node_id="!gateway0001")
         packet_obj = SimpleNamespace(
             interfaces=DummyInterfaceRelation([interface_stub]),
-            channels=DummyChannelRelation([channel_stub]),
+            channel=channel_stub,
             gateway_nodes=DummyNodeRelation([gateway_stub]),
         )
 
@@ -272,7 +253,7 @@ class PublisherServiceReactiveTests(TestCase):
         gateway_stub = SimpleNamespace(node_id="!gateway0001")
         packet_obj = SimpleNamespace(
             interfaces=DummyInterfaceRelation([interface_stub]),
-            channels=DummyChannelRelation([channel_stub]),
+            channel=channel_stub,
             gateway_nodes=DummyNodeRelation([gateway_stub]),
         )
 
@@ -332,7 +313,7 @@ class PublisherServiceReactiveTests(TestCase):
         )
         packet_obj = SimpleNamespace(
             interfaces=DummyInterfaceRelation([interface_stub]),
-            channels=DummyChannelRelation([channel_stub]),
+            channel=channel_stub,
             gateway_nodes=DummyNodeRelation([]),
         )
 
@@ -399,6 +380,145 @@ class PublisherServiceReactiveTests(TestCase):
             self.assertEqual(entry.probe_message_id, 1337)
             self.assertIsNone(entry.responded_at)
 
+    def test_publish_reachability_probe_bulk_records_pending_together(self):
+        targets = [
+            Node.objects.create(
+                node_num=int(f"eeee000{index}", 16),
+                node_id=f"!eeee000{index}",
+                mac_address=f"ee:ee:ee:ee:ee:0{index}",
+            )
+            for index in range(1, 4)
+        ]
+        to_nodes = [node.node_id for node in targets] + ["!ffffffff"]
+
+        # Ids are handed out in order before publishing; probes then go out
+        # concurrently, so results are keyed by target node.
+        published_to = {
+            "!eeee0001": True,
+            "!eeee0002": False,
+            "!eeee0003": True,
+            "!ffffffff": True,
+        }
+        with patch.object(
+            self.service, "_get_global_message_id", side_effect=[11, 12, 13, 14]
+        ), patch.object(
+            self.service,
+            "_send_reachability_probe",
+            side_effect=lambda *, to_node, **kwargs: published_to[to_node],
+        ) as mock_send:
+            published = self.service.publish_reachability_probe_bulk(
+                from_node="!aaaa0001",
+                to_nodes=to_nodes,
+                channel_name="LongFast",
+                channel_aes_key="",
+            )
+
+        self.assertEqual(published, 3)
+        self.assertEqual(mock_send.call_count, 4)
+        history = dict(
+            NodeLatencyHistory.objects.values_list("node__node_id", "probe_message_id")
+        )
+        self.assertEqual(history, {"!eeee0001": 11, "!eeee0003": 13})
+        self.assertEqual(
+            set(
+                Node.objects.filter(latency_reachable=False).values_list(
+                    "node_id", flat=True
+                )
+            ),
+            {"!eeee0001", "!eeee0003"},
+        )
+
+    def test_failed_probe_restores_previous_node_state(self):
+        target = Node.objects.create(
+            node_num=int("eeee0021", 16),
+            node_id="!eeee0021",
+            mac_address="ee:ee:ee:ee:ee:21",
+            latency_reachable=True,
+            latency_ms=120,
+        )
+
+        with patch.object(self.service, "publish", return_value=False):
+            success, message_id = self.service.publish_traceroute(
+                from_node="!aaaa0001",
+                to_node=target.node_id,
+                channel_name="LongFast",
+                channel_aes_key="",
+            )
+        self.assertFalse(success)
+        self.assertIsNone(message_id)
+
+        with patch.object(
+            self.service, "publish", side_effect=RuntimeError("broker down")
+        ), self.assertRaises(RuntimeError):
+            self.service.publish_reachability_probe(
+                from_node="!aaaa0001",
+                to_node=target.node_id,
+                channel_name="LongFast",
+                channel_aes_key="",
+            )
+
+        self.assertFalse(NodeLatencyHistory.objects.filter(node=target).exists())
+        target.refresh_from_db()
+        self.assertTrue(target.latency_reachable)
+        self.assertEqual(target.latency_ms, 120)
+
+    def test_reply_during_bulk_publish_resolves_its_pending_probe(self):
+        first = Node.objects.create(
+            node_num=int("eeee0031", 16),
+            node_id="!eeee0031",
+            mac_address="ee:ee:ee:ee:ee:31",
+        )
+
+        def publish(**kwargs) -> bool:
+            # The target answers before the publish call has returned.
+            handler._update_latency_history(
+                node=first,
+                probe_message_id=21,
+                latency_ms=80,
+                responded_at=None,
+                request_time=None,
+            )
+            Node.objects.filter(pk=first.pk).update(
+                latency_reachable=True, latency_ms=80
+            )
+            return True
+
+        with patch.object(
+            self.service, "_get_global_message_id", return_value=21
+        ), patch.object(self.service, "publish", side_effect=publish):
+            published = self.service.publish_reachability_probe_bulk(
+                from_node="!aaaa0001",
+                to_nodes=[first.node_id],
+                channel_name="LongFast",
+                channel_aes_key="",
+            )
+
+        self.assertEqual(published, 1)
+        history = NodeLatencyHistory.objects.filter(node=first)
+        self.assertEqual(history.count(), 1)
+        self.assertTrue(history.get().reachable)
+        first.refresh_from_db()
+        self.assertTrue(first.latency_reachable)
+
+    def test_bulk_probes_are_published_concurrently(self):
+        to_nodes = ["!eeee0011", "!eeee0012", "!eeee0013"]
+        # Every publish waits for the others; a serial loop would time out.
+        barrier = Barrier(len(to_nodes), timeout=5)
+
+        def publish(**kwargs) -> bool:
+            barrier.wait()
+            return True
+
+        with patch.object(self.service, "publish", side_effect=publish):
+            published = self.service.publish_reachability_probe_bulk(
+                from_node="!aaaa0001",
+                to_nodes=to_nodes,
+                channel_name="LongFast",
+                channel_aes_key="",
+            )
+
+        self.assertEqual(published, 3)
+
     def test_publish_traceroute_records_pending_by_default(self):
         target_node = Node.objects.create(
             node_num=int("dddd0004", 16),
@@ -482,9 +602,9 @@ class PublisherServiceReactiveTests(TestCase):
             packet_id=1234,
             from_node=sender,
             to_node=recipient,
+            channel=channel,
         )
         packet_obj.interfaces.add(interface)
-        packet_obj.channels.add(channel)
 
         with patch.object(
             self.service, "publish_traceroute", return_value=(True, 4242)
@@ -695,3 +815,42 @@ class PublisherServiceDispatchTests(TestCase):
             handler.on_message(None, None, normalized, iface="MQTT")
 
             dispatch_mock.assert_called_once()
+
+
+class PublisherServiceConcurrentProbeTests(TransactionTestCase):
+    def test_pending_rows_are_committed_before_pool_publishes(self):
+        targets = [
+            Node.objects.create(
+                node_num=int(f"eeee004{index}", 16),
+                node_id=f"!eeee004{index}",
+                mac_address=f"ee:ee:ee:ee:ee:4{index}",
+            )
+            for index in range(1, 5)
+        ]
+        service = PublisherService(publisher=MagicMock(name="publisher"))
+        pending_seen: list[bool] = []
+
+        def publish(**kwargs) -> bool:
+            # Runs on a pool thread with its own connection, as a reply
+            # handler would; every probe's row must already be visible.
+            try:
+                pending_seen.append(
+                    NodeLatencyHistory.objects.filter(
+                        node__in=targets, reachable=False
+                    ).count()
+                    == len(targets)
+                )
+            finally:
+                connection.close()
+            return True
+
+        with patch.object(service, "publish", side_effect=publish):
+            published = service.publish_traceroute_bulk(
+                from_node="!aaaa0001",
+                to_nodes=[node.node_id for node in targets],
+                channel_name="LongFast",
+                channel_aes_key="",
+            )
+
+        self.assertEqual(published, len(targets))
+        self.assertEqual(pending_seen, [True] * len(targets))
@@ -0,0 +1,32 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from django.test import SimpleTestCase  # type: ignore[import]
+
+from ..renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_renders_native_and_fallback_types(self) -> None:
+        rendered = ORJSONRenderer().render(
+            None,
+            {
+                "time": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+                "id": UUID("12345678-1234-5678-1234-567812345678"),
+                "voltage": Decimal("3.70"),
+                1: "non-string key",
+            },
+            response_status=200,
+        )
+
+        self.assertEqual(
+            json.loads(rendered),
+            {
+                "time": "2025-01-02T03:04:05Z",
+                "id": "12345678-1234-5678-1234-567812345678",
+                "voltage": "3.70",
+                "1": "non-string key",
+            },
+        )
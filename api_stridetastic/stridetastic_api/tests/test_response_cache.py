@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+from ninja.testing import TestClient
+from ninja_jwt.tokens import AccessToken
+
+from ..api import api
+from ..models import NetworkOverviewSnapshot
+from ..models.packet_models import PacketData
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "response-cache-tests",
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ResponseCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.client = TestClient(api)
+        user_model = get_user_model()
+        self.user = user_model.objects.create_user(
+            username="cache_tester",
+            password="testpass123",
+        )
+        self.token = str(AccessToken.for_user(self.user))
+        self.headers = {"Authorization": f"Bearer {self.token}"}
+
+    def test_second_request_is_served_from_cache(self) -> None:
+        first = self.client.get("/ports/activity", headers=self.headers)
+        second = self.client.get("/ports/activity", headers=self.headers)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+        self.assertEqual(second["Cache-Control"], "private, max-age=5")
+
+    def test_matching_etag_returns_not_modified(self) -> None:
+        first = self.client.get("/ports/activity", headers=self.headers)
+
+        revalidated = self.client.get(
+            "/ports/activity",
+            headers={**self.headers, "If-None-Match": first["ETag"]},
+        )
+
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b"")
+
+    def test_error_responses_are_not_cached(self) -> None:
+        first = self.client.get("/ports/%20/nodes", headers=self.headers)
+        second = self.client.get("/ports/%20/nodes", headers=self.headers)
+
+        self.assertEqual(first.status_code, 400)
+        self.assertEqual(second.status_code, 400)
+        self.assertFalse(second.has_header("X-Cache"))
+
+    @override_settings(RESPONSE_CACHE_TTLS={"short": 0, "normal": 0, "long": 0})
+    def test_stale_entry_is_served_when_database_fails(self) -> None:
+        fresh = self.client.get("/ports/activity", headers=self.headers)
+
+        with patch.object(
+            PacketData.objects, "filter", side_effect=OperationalError("db down")
+        ):
+            stale = self.client.get("/ports/activity", headers=self.headers)
+
+        self.assertEqual(stale.status_code, 200)
+        self.assertEqual(stale["X-Cache"], "STALE")
+        self.assertEqual(stale.content, fresh.content)
+
+    def test_requests_that_record_snapshots_bypass_the_cache(self) -> None:
+        for _ in range(2):
+            response = self.client.get("/metrics/overview", headers=self.headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse(response.has_header("X-Cache"))
+        self.assertEqual(NetworkOverviewSnapshot.objects.count(), 2)
+
+        url = "/metrics/overview?record_snapshot=false"
+        self.client.get(url, headers=self.headers)
+        second = self.client.get(url, headers=self.headers)
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(NetworkOverviewSnapshot.objects.count(), 2)
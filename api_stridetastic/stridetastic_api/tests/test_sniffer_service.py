@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from ..services.sniffer_service import SnifferService
+
+
+class SnifferServiceTests(SimpleTestCase):
+    def _mqtt_interface(self) -> MagicMock:
+        mqtt_interface = MagicMock()
+        mqtt_interface.is_connected.return_value = False
+        mqtt_interface.client._thread = None
+        return mqtt_interface
+
+    def test_start_is_idempotent_until_stopped(self) -> None:
+        mqtt_interface = self._mqtt_interface()
+        service = SnifferService(mqtt_interface=mqtt_interface)
+
+        service.start()
+        service.start()
+
+        mqtt_interface.connect.assert_called_once()
+        mqtt_interface.start.assert_called_once()
+
+        service.stop()
+        service.start()
+
+        mqtt_interface.disconnect.assert_called_once()
+        self.assertEqual(mqtt_interface.start.call_count, 2)
+
+    def test_running_loop_thread_is_not_restarted(self) -> None:
+        mqtt_interface = self._mqtt_interface()
+        mqtt_interface.is_connected.return_value = True
+        mqtt_interface.client._thread = MagicMock()
+        mqtt_interface.client._thread.is_alive.return_value = True
+        service = SnifferService(mqtt_interface=mqtt_interface)
+
+        service.start()
+
+        mqtt_interface.connect.assert_not_called()
+        mqtt_interface.start.assert_not_called()
+
+    def test_serial_task_is_queued_once(self) -> None:
+        service = SnifferService(serial_config={"port": "/dev/ttyUSB0"})
+
+        with patch(
+            "stridetastic_api.services.sniffer_service.run_serial_interface"
+        ) as task:
+            service.start()
+            service.start()
+
+        task.delay.assert_called_once_with(port="/dev/ttyUSB0")
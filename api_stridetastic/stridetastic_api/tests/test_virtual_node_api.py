@@ -9,6 +9,7 @@ from ninja_jwt.tokens import AccessToken
 from ..api import api
 from ..mesh.utils import id_to_num, num_to_mac
 from ..models import Node
+from ..schemas import VirtualNodeOptionsSchema
 from ..services.virtual_node_service import VirtualNodeService
 
 
@@ -52,6 +53,15 @@ class VirtualNodeAPITests(TestCase):
         self.assertTrue(node.is_virtual)
         self.assertTrue(node.has_private_key)
 
+    def test_create_virtual_node_rejects_overlong_names(self) -> None:
+        response = self.client.post(
+            "/nodes/virtual",
+            headers=self.auth_headers,
+            json={"short_name": "TOOLONG", "long_name": "Virtual Node"},  # type: ignore[arg-type]
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertFalse(Node.objects.filter(is_virtual=True).exists())
+
     def test_list_virtual_nodes_returns_created_entries(self) -> None:
         created = self._create_virtual_node({"long_name": "Listable"})
         response = self.client.get("/nodes/virtual", headers=self.auth_headers)
@@ -159,6 +169,8 @@ class VirtualNodeAPITests(TestCase):
         self.assertTrue(
             any(option["value"] == data["default_role"] for option in data["roles"])
         )
+        # The pre-encoded body must still honour the documented schema.
+        VirtualNodeOptionsSchema.model_validate(data)
 
     def test_virtual_node_prefill_endpoint(self) -> None:
         response = self.client.get("/nodes/virtual/prefill", headers=self.auth_headers)
@@ -1,8 +1,10 @@
 import base64
+import hashlib
 from typing import List, Tuple
 
 import pytest
 from cryptography.hazmat.primitives.asymmetric import x25519
+from stridetastic_api.mesh.utils import num_to_mac
 from stridetastic_api.models import Node
 from stridetastic_api.services.virtual_node_service import (
     VirtualNodeError,
@@ -19,6 +21,9 @@ class _DummyPublicKey:
     ):  # noqa: ANN001 - signature dictated by cryptography API
         return self._raw
 
+    def public_bytes_raw(self):
+        return self._raw
+
 
 class _DummyPrivateKey:
     def __init__(self, private_raw: bytes, public_raw: bytes) -> None:
@@ -30,6 +35,9 @@ class _DummyPrivateKey:
     ):  # noqa: ANN001 - signature dictated by API
         return self._private_raw
 
+    def private_bytes_raw(self):
+        return self._private_raw
+
     def public_key(self):
         return self._public_key
 
@@ -105,3 +113,202 @@ def test_generate_key_pair_raises_when_unique_material_unavailable(monkeypatch):
 
     with pytest.raises(VirtualNodeError):
         VirtualNodeService.generate_key_pair()
+
+
+@pytest.mark.django_db
+def test_generate_key_pair_checks_uniqueness_in_one_query(django_assert_num_queries):
+    with django_assert_num_queries(1):
+        secrets = VirtualNodeService.generate_key_pair()
+
+    assert len(base64.b64decode(secrets.public_key)) == 32
+    assert len(base64.b64decode(secrets.private_key)) == 32
+
+
+@pytest.mark.django_db
+def test_key_material_in_use_matches_either_half():
+    private_b64 = base64.b64encode(bytes([5] * 32)).decode("ascii")
+    public_b64 = base64.b64encode(bytes([6] * 32)).decode("ascii")
+    existing = Node.objects.create(
+        node_num=VirtualNodeService.VIRTUAL_NODE_NUM_START + 2,
+        node_id="!dupe0003",
+        mac_address="AA:BB:CC:DD:EE:03",
+        public_key=public_b64,
+        is_virtual=True,
+    )
+    existing.store_private_key(private_b64)
+    other = base64.b64encode(bytes([7] * 32)).decode("ascii")
+
+    assert VirtualNodeService._key_material_in_use(public_b64, other)
+    assert VirtualNodeService._key_material_in_use(other, private_b64)
+    assert not VirtualNodeService._key_material_in_use(other, other)
+    assert not VirtualNodeService._key_material_in_use(
+        public_b64, private_b64, exclude_pk=existing.pk
+    )
+
+
+@pytest.mark.django_db
+def test_resolve_identity_skips_taken_candidates_in_one_query(
+    monkeypatch, django_assert_num_queries
+):
+    start = VirtualNodeService.VIRTUAL_NODE_NUM_START + 100
+    Node.objects.create(
+        node_num=start,
+        node_id=VirtualNodeService._default_node_id(start),
+        mac_address=VirtualNodeService._default_mac(start),
+        is_virtual=True,
+    )
+    # Only the MAC of the next number is taken, by an unrelated node.
+    Node.objects.create(
+        node_num=start + 50,
+        node_id="!feed0001",
+        mac_address=VirtualNodeService._default_mac(start + 1),
+    )
+    monkeypatch.setattr(
+        VirtualNodeService,
+        "_next_available_node_num",
+        classmethod(lambda cls, start_at=None: start),
+    )
+
+    with django_assert_num_queries(1):
+        identity = VirtualNodeService._resolve_identity(
+            node_num=None, node_id=None, mac_address=None
+        )
+
+    assert identity.node_num == start + 2
+    assert identity.node_id == VirtualNodeService._default_node_id(start + 2)
+    assert identity.mac_address == VirtualNodeService._default_mac(start + 2)
+
+
+@pytest.mark.django_db
+def test_resolve_identity_rejects_taken_node_number():
+    start = VirtualNodeService.VIRTUAL_NODE_NUM_START + 200
+    Node.objects.create(
+        node_num=start,
+        node_id="!feed0002",
+        mac_address="AA:BB:CC:DD:EE:20",
+    )
+
+    with pytest.raises(VirtualNodeError, match="Node number is already in use"):
+        VirtualNodeService._resolve_identity(
+            node_num=start, node_id=None, mac_address=None
+        )
+
+
+@pytest.mark.django_db
+def test_create_virtual_node_checks_new_keys_once(monkeypatch):
+    calls = []
+    original = VirtualNodeService._key_material_in_use.__func__
+
+    def _counting(cls, public_key, private_key, *, exclude_pk=None):
+        calls.append(public_key)
+        return original(cls, public_key, private_key, exclude_pk=exclude_pk)
+
+    monkeypatch.setattr(
+        VirtualNodeService, "_key_material_in_use", classmethod(_counting)
+    )
+
+    node, secrets = VirtualNodeService.create_virtual_node({"long_name": "Once"})
+
+    assert calls == [secrets.public_key]
+    assert node.private_key == secrets.private_key
+    assert (
+        secrets.fingerprint
+        == node.private_key_fingerprint
+        == hashlib.sha256(secrets.private_key.encode("utf-8")).hexdigest()
+    )
+
+
+def test_virtual_node_options_are_serialized_once():
+    first = VirtualNodeService.get_virtual_node_options()
+    second = VirtualNodeService.get_virtual_node_options()
+
+    assert first == second
+    assert first["roles"] is not second["roles"]
+    assert first["roles"][0] is second["roles"][0]
+    assert {"value": "CLIENT", "label": "Client"} in first["roles"]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("!00ABcd12", "!00abcd12"), ("deadbeef", "!deadbeef")],
+)
+def test_normalize_node_id_accepts_hex(value, expected):
+    assert VirtualNodeService._normalize_node_id(value) == expected
+
+
+@pytest.mark.parametrize("value", ["!00zz0001", "!0000é001", "! 1"])
+def test_normalize_node_id_rejects_non_hex(value):
+    with pytest.raises(VirtualNodeError, match="hexadecimal"):
+        VirtualNodeService._normalize_node_id(value)
+
+
+def test_normalize_mac_validates_hex_digits():
+    assert VirtualNodeService._normalize_mac("aa-bb-cc-00-11-22") == (
+        "AA:BB:CC:00:11:22"
+    )
+    with pytest.raises(VirtualNodeError, match="hexadecimal characters"):
+        VirtualNodeService._normalize_mac("AA:BB:CC:00:11:GG")
+    with pytest.raises(VirtualNodeError, match="hexadecimal characters"):
+        VirtualNodeService._normalize_mac("AA:BB:CC:00:11:2é")
+
+
+@pytest.mark.django_db
+def test_next_available_node_num_finds_first_gap(django_assert_num_queries):
+    start = VirtualNodeService.VIRTUAL_NODE_NUM_START + 300
+    for offset in (0, 1, 2, 4):
+        Node.objects.create(
+            node_num=start + offset,
+            node_id=f"!gap{offset:05d}",
+            mac_address=f"AA:BB:CC:DD:E1:{offset:02X}",
+        )
+
+    with django_assert_num_queries(2):
+        assert VirtualNodeService._next_available_node_num(start) == start + 3
+    with django_assert_num_queries(1):
+        assert VirtualNodeService._next_available_node_num(start + 3) == start + 3
+    with django_assert_num_queries(1):
+        assert VirtualNodeService._next_available_node_num() == start + 5
+
+
+@pytest.mark.django_db
+def test_created_and_updated_nodes_match_the_database():
+    node, _ = VirtualNodeService.create_virtual_node({"long_name": "Fresh"})
+    stored = Node.objects.get(pk=node.pk)
+    for field in ("node_num", "node_id", "public_key", "private_key_fingerprint"):
+        assert getattr(node, field) == getattr(stored, field)
+    assert node.private_key_updated_at == stored.private_key_updated_at
+
+    node, secrets = VirtualNodeService.update_virtual_node(
+        stored, {"short_name": "FRSH"}, regenerate_keys=True
+    )
+    stored = Node.objects.get(pk=node.pk)
+    assert node.short_name == stored.short_name == "FRSH"
+    assert node.public_key == stored.public_key == secrets.public_key
+    assert node.is_low_entropy_public_key == stored.is_low_entropy_public_key
+
+
+def test_default_identity_formatting_matches_num_to_mac():
+    for num in (
+        0,
+        1,
+        0x0929,
+        VirtualNodeService.VIRTUAL_NODE_NUM_START,
+        (1 << 48) - 1,
+        1 << 48,
+    ):
+        assert VirtualNodeService._default_mac(num) == num_to_mac(num).upper()
+        assert VirtualNodeService._default_node_id(num) == f"!{num & 0xFFFFFFFF:08x}"
+
+
+@pytest.mark.django_db
+def test_create_and_update_leave_the_payload_untouched():
+    data = {"node_id": "!0badc0de", "long_name": "Original", "unknown": 1}
+    snapshot = dict(data)
+    node, _ = VirtualNodeService.create_virtual_node(data)
+    assert data == snapshot
+    assert node.node_id == "!0badc0de"
+
+    update = {"mac_address": "AA:BB:CC:DD:EE:01", "short_name": "ORIG"}
+    snapshot = dict(update)
+    VirtualNodeService.update_virtual_node(node, update)
+    assert update == snapshot
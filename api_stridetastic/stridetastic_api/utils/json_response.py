@@ -0,0 +1,38 @@
+from typing import Any, Iterable
+
+from django.http import HttpResponse
+
+from ..renderers import ORJSONRenderer
+from ..schemas import FastSchema
+
+_renderer = ORJSONRenderer()
+
+
+def trusted_json_response(data: Any, status: int = 200) -> HttpResponse:
+    """Encode ``data`` straight to a JSON response.
+
+    Ninja passes ``HttpResponse`` objects through untouched, so this skips
+    building and re-validating response schemas. Only use it for payloads
+    assembled from ORM rows; the route's declared response schema still
+    documents the shape in OpenAPI.
+    """
+    return HttpResponse(
+        _renderer.render(None, data, response_status=status),
+        status=status,
+        content_type=_renderer.media_type,
+    )
+
+
+def schema_list_response(
+    schema: type[FastSchema], rows: Iterable[FastSchema], status: int = 200
+) -> HttpResponse:
+    """Dump a list of already-built schema instances with the schema's encoder.
+
+    pydantic-core serializes the whole list in one call instead of ninja
+    validating and dumping each row again.
+    """
+    return HttpResponse(
+        schema.encode_list(rows),
+        status=status,
+        content_type=_renderer.media_type,
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import Any, Optional
 
 from ..models import NodeLink
 from ..models.channel_models import Channel
@@ -10,14 +10,13 @@ from ..schemas import (
     LinkChannelSchema,
     LinkNodeSchema,
     NodeLinkPacketSchema,
-    NodeLinkSchema,
 )
 from .packet_payloads import build_packet_payload_schema
 from .ports import resolve_port_identity
 
 
 def _serialize_node(node: Node) -> LinkNodeSchema:
-    return LinkNodeSchema(
+    return LinkNodeSchema.from_trusted(
         id=node.pk,
         node_id=node.node_id,
         node_num=node.node_num,
@@ -27,22 +26,31 @@ def _serialize_node(node: Node) -> LinkNodeSchema:
 
 
 def _serialize_channel(channel: Channel) -> LinkChannelSchema:
-    return LinkChannelSchema(
+    return LinkChannelSchema.from_trusted(
         channel_id=channel.channel_id,
         channel_num=channel.channel_num,
     )
 
 
-def _first_or_none(items: Iterable[Channel]) -> Optional[Channel]:
-    for item in items:
-        return item
-    return None
+def _link_node_row(node: Node) -> dict[str, Any]:
+    return {
+        "id": node.pk,
+        "node_id": node.node_id,
+        "node_num": node.node_num,
+        "short_name": node.short_name,
+        "long_name": node.long_name,
+    }
 
 
-def serialize_node_link(link: NodeLink) -> NodeLinkSchema:
+def _link_channel_row(channel: Channel) -> dict[str, Any]:
+    return {"channel_id": channel.channel_id, "channel_num": channel.channel_num}
+
+
+def node_link_row(link: NodeLink) -> dict[str, Any]:
+    """Plain ``NodeLinkSchema``-shaped dict for a link, ready for orjson."""
     last_port: Optional[str] = None
     last_port_display: Optional[str] = None
-    last_channel_schema: Optional[LinkChannelSchema] = None
+    last_channel: Optional[dict[str, Any]] = None
 
     last_packet = link.last_packet
     if last_packet is not None:
@@ -51,28 +59,26 @@ def serialize_node_link(link: NodeLink) -> NodeLinkSchema:
             last_port, last_port_display = resolve_port_identity(
                 packet_data.port, packet_data.portnum
             )
-        channel_instance = _first_or_none(last_packet.channels.all())
+        channel_instance = last_packet.channel
         if channel_instance is not None:
-            last_channel_schema = _serialize_channel(channel_instance)
-
-    channels = [_serialize_channel(channel) for channel in link.channels.all()]
-
-    return NodeLinkSchema(
-        id=link.pk,
-        node_a=_serialize_node(link.node_a),
-        node_b=_serialize_node(link.node_b),
-        node_a_to_node_b_packets=link.node_a_to_node_b_packets,
-        node_b_to_node_a_packets=link.node_b_to_node_a_packets,
-        total_packets=link.total_packets,
-        is_bidirectional=link.is_bidirectional,
-        first_seen=link.first_seen,
-        last_activity=link.last_activity,
-        last_packet_id=getattr(last_packet, "packet_id", None) if last_packet else None,
-        last_packet_port=last_port,
-        last_packet_port_display=last_port_display,
-        last_packet_channel=last_channel_schema,
-        channels=channels,
-    )
+            last_channel = _link_channel_row(channel_instance)
+
+    return {
+        "id": link.pk,
+        "node_a": _link_node_row(link.node_a),
+        "node_b": _link_node_row(link.node_b),
+        "node_a_to_node_b_packets": link.node_a_to_node_b_packets,
+        "node_b_to_node_a_packets": link.node_b_to_node_a_packets,
+        "total_packets": link.total_packets,
+        "is_bidirectional": link.is_bidirectional,
+        "first_seen": link.first_seen,
+        "last_activity": link.last_activity,
+        "last_packet_id": last_packet.packet_id if last_packet else None,
+        "last_packet_port": last_port,
+        "last_packet_port_display": last_port_display,
+        "last_packet_channel": last_channel,
+        "channels": [_link_channel_row(channel) for channel in link.channels.all()],
+    }
 
 
 def serialize_link_packet(packet: Packet, link: NodeLink) -> NodeLinkPacketSchema:
@@ -87,7 +93,7 @@ def serialize_link_packet(packet: Packet, link: NodeLink) -> NodeLinkPacketSchem
         )
         payload = build_packet_payload_schema(packet_data)
 
-    channel_instance = _first_or_none(packet.channels.all())
+    channel_instance = packet.channel
     channel_schema = _serialize_channel(channel_instance) if channel_instance else None
 
     direction = "unknown"
@@ -98,7 +104,7 @@ def serialize_link_packet(packet: Packet, link: NodeLink) -> NodeLinkPacketSchem
     elif packet.from_node_id == node_b_pk and packet.to_node_id == node_a_pk:
         direction = "node_b_to_node_a"
 
-    return NodeLinkPacketSchema(
+    return NodeLinkPacketSchema.from_trusted(
         packet_id=packet.packet_id,
         timestamp=packet.time,
         direction=direction,
@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Any, Dict, Optional
 
 from ..models.packet_models import PacketData
-from ..schemas import PacketPayloadSchema
+from ..schemas import PAYLOAD_REGISTRY, PacketPayloadSchema
 
 
 def _coerce_value(value: Any) -> Any:
@@ -78,30 +78,44 @@ def _serialize_route_section(route: Any) -> Optional[Dict[str, Any]]:
     )
 
 
+def _payload(payload_type: str, fields: Dict[str, Any]) -> PacketPayloadSchema:
+    schema = PAYLOAD_REGISTRY[payload_type]
+    fields_schema = schema.model_fields["fields"].annotation
+    return schema.from_trusted(fields=fields_schema.from_trusted(**fields))
+
+
 def build_packet_payload_schema(
     packet_data: PacketData,
 ) -> Optional[PacketPayloadSchema]:
     base_fields = _base_payload_fields(packet_data)
 
-    telemetry = getattr(packet_data, "telemetry_payload", None)
-    if telemetry:
-        telemetry_fields = _filter_fields(
-            {
-                "battery_level": telemetry.battery_level,
-                "voltage": telemetry.voltage,
-                "channel_utilization": telemetry.channel_utilization,
-                "air_util_tx": telemetry.air_util_tx,
-                "uptime_seconds": telemetry.uptime_seconds,
-                "temperature": telemetry.temperature,
-                "relative_humidity": telemetry.relative_humidity,
-                "barometric_pressure": telemetry.barometric_pressure,
-                "gas_resistance": telemetry.gas_resistance,
-                "iaq": telemetry.iaq,
-            }
-        )
+    device_telemetry = getattr(packet_data, "device_telemetry_payload", None)
+    environment_telemetry = getattr(packet_data, "environment_telemetry_payload", None)
+    if device_telemetry or environment_telemetry:
+        telemetry_values = {}
+        if device_telemetry:
+            telemetry_values.update(
+                {
+                    "battery_level": device_telemetry.battery_level,
+                    "voltage": device_telemetry.voltage,
+                    "channel_utilization": device_telemetry.channel_utilization,
+                    "air_util_tx": device_telemetry.air_util_tx,
+                    "uptime_seconds": device_telemetry.uptime_seconds,
+                }
+            )
+        if environment_telemetry:
+            telemetry_values.update(
+                {
+                    "temperature": environment_telemetry.temperature,
+                    "relative_humidity": environment_telemetry.relative_humidity,
+                    "barometric_pressure": environment_telemetry.barometric_pressure,
+                    "gas_resistance": environment_telemetry.gas_resistance,
+                    "iaq": environment_telemetry.iaq,
+                }
+            )
         fields = dict(base_fields)
-        fields.update(telemetry_fields)
-        return PacketPayloadSchema(payload_type="telemetry", fields=fields)
+        fields.update(_filter_fields(telemetry_values))
+        return _payload("telemetry", fields)
 
     position = getattr(packet_data, "position_payload", None)
     if position:
@@ -117,7 +131,7 @@ def build_packet_payload_schema(
         )
         fields = dict(base_fields)
         fields.update(position_fields)
-        return PacketPayloadSchema(payload_type="position", fields=fields)
+        return _payload("position", fields)
 
     node_info = getattr(packet_data, "node_info_payload", None)
     if node_info:
@@ -134,7 +148,7 @@ def build_packet_payload_schema(
         )
         fields = dict(base_fields)
         fields.update(node_info_fields)
-        return PacketPayloadSchema(payload_type="node_info", fields=fields)
+        return _payload("node_info", fields)
 
     neighbor_info = getattr(packet_data, "neighbor_info_payload", None)
     if neighbor_info:
@@ -196,7 +210,7 @@ def build_packet_payload_schema(
 
         fields["neighbors"] = neighbors_data
         fields["neighbors_count"] = len(neighbors_data)
-        return PacketPayloadSchema(payload_type="neighbor_info", fields=fields)
+        return _payload("neighbor_info", fields)
 
     route_discovery = getattr(packet_data, "route_discovery_payload", None)
     if route_discovery:
@@ -215,7 +229,7 @@ def build_packet_payload_schema(
             fields["snr_towards"] = snr_towards
         if snr_back is not None:
             fields["snr_back"] = snr_back
-        return PacketPayloadSchema(payload_type="route_discovery", fields=fields)
+        return _payload("route_discovery", fields)
 
     routing = getattr(packet_data, "routing_payload", None)
     if routing:
@@ -227,7 +241,7 @@ def build_packet_payload_schema(
                 }
             )
         )
-        return PacketPayloadSchema(payload_type="routing", fields=fields)
+        return _payload("routing", fields)
 
     if (
         getattr(packet_data, "port", None) == "TEXT_MESSAGE_APP"
@@ -235,7 +249,7 @@ def build_packet_payload_schema(
     ):
         fields = dict(base_fields)
         fields["text"] = packet_data.raw_payload
-        return PacketPayloadSchema(payload_type="text_message", fields=fields)
+        return _payload("text_message", fields)
 
     raw_payload = packet_data.raw_payload or getattr(
         packet_data.packet, "raw_data", None
@@ -243,9 +257,9 @@ def build_packet_payload_schema(
     if raw_payload:
         fields = dict(base_fields)
         fields["raw_payload"] = raw_payload
-        return PacketPayloadSchema(payload_type="raw", fields=fields)
+        return _payload("raw", fields)
 
     if base_fields:
-        return PacketPayloadSchema(payload_type="metadata", fields=base_fields)
+        return _payload("metadata", base_fields)
 
     return None
@@ -6,7 +6,7 @@ import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 
 class PcapNgWriter:
@@ -16,6 +16,12 @@ class PcapNgWriter:
     message type (e.g. ``type=meshtastic.MeshPacket``). The Wireshark dissector can
     read this comment to drive protobuf decoding while keeping the capture format
     compact and standards compliant.
+
+    With ``buffer_size`` set, encoded blocks are collected in memory and written
+    once that many bytes are pending, on :meth:`flush` or on :meth:`close`.
+    ``bytes_written`` always includes buffered blocks.
+    :meth:`write_packet_group` writes a MeshPacket and its decoded layers with a
+    single lock acquisition and timestamp conversion.
     """
 
     _SECTION_HEADER_BLOCK = 0x0A0D0D0A
@@ -38,11 +44,14 @@ class PcapNgWriter:
 
     _TS_RESOLUTION = 1_000_000  # microsecond resolution
 
-    def __init__(self, path: Path | str):
+    def __init__(self, path: Path | str, *, buffer_size: int = 0):
         self.path = Path(path)
         self._lock = threading.Lock()
         self._file = self.path.open("wb")
+        self._buffer = bytearray()
+        self._buffer_size = max(0, buffer_size)
         self._bytes_written = 0
+        self._comment_options: Dict[str, bytes] = {}
         self._next_interface_id = 0
         self._write_section_header_block()
         self._mesh_interface_id = self._write_interface_description_block(
@@ -56,14 +65,24 @@ class PcapNgWriter:
             "protobuf.meshtastic.Data",
         )
 
-    def _write_block(self, block_type: int, body: bytes) -> None:
-        block_total_length = 12 + len(body)
-        block = struct.pack("<II", block_type, block_total_length)
-        block += body
-        block += struct.pack("<I", block_total_length)
-        self._file.write(block)
-        self._file.flush()
-        self._bytes_written += len(block)
+    def _write_block(self, block_type: int, *body: bytes) -> None:
+        # The body arrives in parts so large payloads are copied only once,
+        # straight into the output buffer.
+        block_total_length = 12 + sum(len(part) for part in body)
+        buffer = self._buffer
+        buffer += struct.pack("<II", block_type, block_total_length)
+        for part in body:
+            buffer += part
+        buffer += struct.pack("<I", block_total_length)
+        self._bytes_written += block_total_length
+        if len(buffer) >= self._buffer_size:
+            self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._file.flush()
 
     def _write_section_header_block(self) -> None:
         body = struct.pack(
@@ -102,40 +121,51 @@ class PcapNgWriter:
         self._next_interface_id += 1
         return interface_id
 
+    def _timestamp_words(self, timestamp: Optional[datetime]) -> Tuple[int, int]:
+        ts = timestamp or datetime.fromtimestamp(time.time())
+        total_ticks = int(ts.timestamp() * self._TS_RESOLUTION)
+        return (total_ticks >> 32) & 0xFFFFFFFF, total_ticks & 0xFFFFFFFF
+
+    def _epb_options(self, message_type: Optional[str]) -> bytes:
+        # Only a handful of message types exist, so each comment is encoded once.
+        options = self._comment_options.get(message_type or "")
+        if options is None:
+            options = b""
+            if message_type:
+                comment_bytes = f"type={message_type}".encode("utf-8")
+                options = self._encode_option(self._EPB_COMMENT_OPTION, comment_bytes)
+            # End of options
+            options += struct.pack("<HH", 0, 0)
+            self._comment_options[message_type or ""] = options
+        return options
+
     def _write_enhanced_packet_block(
         self,
         interface_id: int,
         message_type: Optional[str],
         payload: bytes,
-        timestamp: Optional[datetime] = None,
+        timestamp_words: Tuple[int, int],
     ) -> None:
         if not isinstance(payload, (bytes, bytearray)):
             raise TypeError("Payload must be bytes")
 
-        ts = timestamp or datetime.fromtimestamp(time.time())
-        total_ticks = int(ts.timestamp() * self._TS_RESOLUTION)
-        timestamp_high = (total_ticks >> 32) & 0xFFFFFFFF
-        timestamp_low = total_ticks & 0xFFFFFFFF
         captured_length = len(payload)
         padded_length = (captured_length + 3) & ~0x03
         padding = b"\x00" * (padded_length - captured_length)
-        body = struct.pack(
+        header = struct.pack(
             "<IIIII",
             interface_id,
-            timestamp_high,
-            timestamp_low,
+            *timestamp_words,
             captured_length,
             captured_length,
         )
-        body += bytes(payload) + padding
-
-        if message_type:
-            comment_bytes = f"type={message_type}".encode("utf-8")
-            body += self._encode_option(self._EPB_COMMENT_OPTION, comment_bytes)
-
-        # End of options
-        body += struct.pack("<HH", 0, 0)
-        self._write_block(self._ENHANCED_PACKET_BLOCK, body)
+        self._write_block(
+            self._ENHANCED_PACKET_BLOCK,
+            header,
+            payload,
+            padding,
+            self._epb_options(message_type),
+        )
 
     def write_packet(
         self,
@@ -149,13 +179,45 @@ class PcapNgWriter:
             raise ValueError("message_type must be a non-empty string")
         if interface_id is None:
             interface_id = self._mesh_interface_id
+        timestamp_words = self._timestamp_words(timestamp)
+        with self._lock:
+            self._write_enhanced_packet_block(
+                interface_id, message_type, payload, timestamp_words
+            )
+
+    def write_packet_group(
+        self,
+        mesh_payload: bytes,
+        data_payload: Optional[bytes] = None,
+        extra_payloads: Iterable[Tuple[str, bytes]] = (),
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """Write a MeshPacket, its Data layer and decoded port payloads.
+
+        Equivalent to calling :meth:`write_mesh_packet`, :meth:`write_data_packet`
+        and :meth:`write_packet` in turn with the same timestamp.
+        """
+        timestamp_words = self._timestamp_words(timestamp)
         with self._lock:
             self._write_enhanced_packet_block(
-                interface_id=interface_id,
-                message_type=message_type,
-                payload=payload,
-                timestamp=timestamp,
+                self._mesh_interface_id,
+                "meshtastic.MeshPacket",
+                mesh_payload,
+                timestamp_words,
             )
+            if data_payload:
+                self._write_enhanced_packet_block(
+                    self._data_interface_id,
+                    "meshtastic.Data",
+                    data_payload,
+                    timestamp_words,
+                )
+            for message_type, payload in extra_payloads:
+                if not message_type:
+                    raise ValueError("message_type must be a non-empty string")
+                self._write_enhanced_packet_block(
+                    self._mesh_interface_id, message_type, payload, timestamp_words
+                )
 
     def write_mesh_packet(
         self, payload: bytes, timestamp: Optional[datetime] = None
@@ -177,10 +239,15 @@ class PcapNgWriter:
             timestamp=timestamp,
         )
 
+    def flush(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._flush_buffer()
+
     def close(self) -> None:
         with self._lock:
             if not self._file.closed:
-                self._file.flush()
+                self._flush_buffer()
                 self._file.close()
 
     @property
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import Optional, Tuple
 
 from meshtastic.protobuf import portnums_pb2  # type: ignore[attr-defined]
@@ -25,24 +26,46 @@ def _humanize_port_name(port_name: str) -> str:
     return pretty
 
 
+def _label_for(port_name: str) -> str:
+    return (
+        _PORT_CHOICE_LABELS.get(port_name)
+        or _PORT_LABEL_OVERRIDES.get(port_name)
+        or _humanize_port_name(port_name)
+    )
+
+
+# Interned port key -> display label for every known Meshtastic port, so list
+# responses share one string object per port instead of one per row.
+PORT_DISPLAY_NAMES: dict[str, str] = {
+    sys.intern(name): sys.intern(_label_for(name))
+    for name in portnums_pb2.PortNum.keys()
+}
+PORT_DISPLAY_NAMES["UNKNOWN"] = "Unknown"
+
+
+def port_display_name(port: str) -> str:
+    """Return the display label for a canonical port key."""
+    label = PORT_DISPLAY_NAMES.get(port)
+    if label is None:
+        # Unknown keys can come from request input; label them without caching
+        # so clients cannot grow the table.
+        label = _label_for(port)
+    return label
+
+
 def resolve_port_identity(
     port: Optional[str], portnum: Optional[int]
 ) -> Tuple[str, str]:
     """Return a canonical port key and display label for the given values."""
     if port:
-        label = _PORT_CHOICE_LABELS.get(port) or _PORT_LABEL_OVERRIDES.get(port)
-        if not label:
-            label = _humanize_port_name(port)
-        return port, label
-
-    if portnum is not None:
+        name = port
+    elif portnum is not None:
         try:
             name = portnums_pb2.PortNum.Name(portnum)
         except ValueError:
             name = f"UNKNOWN_{portnum}"
-        label = _PORT_CHOICE_LABELS.get(name) or _PORT_LABEL_OVERRIDES.get(name)
-        if not label:
-            label = _humanize_port_name(name)
-        return name, label
-
-    return "UNKNOWN", "Unknown"
+    else:
+        name = "UNKNOWN"
+    if name in PORT_DISPLAY_NAMES:
+        name = sys.intern(name)
+    return name, port_display_name(name)
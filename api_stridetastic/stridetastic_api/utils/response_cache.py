@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import time
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.http import HttpRequest, HttpResponse
+
+from ..renderers import ORJSONRenderer
+
+logger = logging.getLogger(__name__)
+
+_renderer = ORJSONRenderer()
+_KEY_PREFIX = "response-cache"
+
+
+def _cache_key(request: HttpRequest) -> str:
+    user = getattr(request, "auth", None) or getattr(request, "user", None)
+    subject = getattr(user, "pk", None)
+    raw = f"{request.path}?{request.META.get('QUERY_STRING', '')}|{subject}"
+    return f"{_KEY_PREFIX}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+
+def _cache_get(key: str) -> Optional[dict[str, Any]]:
+    try:
+        return cache.get(key)
+    except Exception as exc:  # Redis down must not take the API with it
+        logger.warning("Response cache read failed: %s", exc)
+        return None
+
+
+def _cache_set(key: str, entry: dict[str, Any], timeout: int) -> None:
+    try:
+        cache.set(key, entry, timeout=timeout)
+    except Exception as exc:
+        logger.warning("Response cache write failed: %s", exc)
+
+
+def _render(result: Any) -> tuple[int, bytes, str]:
+    status = 200
+    if isinstance(result, HttpResponse):
+        return result.status_code, result.content, result["Content-Type"]
+    if isinstance(result, tuple) and len(result) == 2:
+        status, result = result
+    body = _renderer.render(None, result, response_status=status)
+    return status, body, _renderer.media_type
+
+
+def _respond(
+    request: HttpRequest, entry: dict[str, Any], ttl: int, state: str
+) -> HttpResponse:
+    if request.headers.get("If-None-Match") == entry["etag"]:
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(
+            entry["body"], status=entry["status"], content_type=entry["content_type"]
+        )
+    response["ETag"] = entry["etag"]
+    response["Cache-Control"] = f"private, max-age={ttl}"
+    response["X-Cache"] = state
+    return response
+
+
+def cache_response(
+    policy: str = "normal",
+    *,
+    bypass: Optional[Callable[[dict[str, Any]], bool]] = None,
+) -> Callable:
+    """Cache a controller route's rendered 200 responses in the default cache.
+
+    ``policy`` picks a TTL from ``settings.RESPONSE_CACHE_TTLS``. Entries are
+    keyed by path, query string and authenticated user, carry an ETag so
+    clients can revalidate with ``If-None-Match``, and are kept for
+    ``RESPONSE_CACHE_STALE_SECS`` past expiry so a stale copy can be served
+    when the database raises.
+
+    ``bypass`` receives the view's keyword arguments; when it returns true the
+    view runs uncached. Use it for requests with side effects.
+    """
+    if policy not in settings.RESPONSE_CACHE_TTLS:
+        raise ValueError(f"Unknown response cache policy: {policy}")
+
+    def decorator(view: Callable) -> Callable:
+        @functools.wraps(view)
+        def wrapper(self, *args, **kwargs):
+            context = getattr(self, "context", None)
+            if context is None or context.request is None:
+                # Called directly rather than routed; nothing to key on.
+                return view(self, *args, **kwargs)
+            if bypass is not None and bypass(kwargs):
+                return view(self, *args, **kwargs)
+
+            request = context.request
+            ttl = settings.RESPONSE_CACHE_TTLS[policy]
+            key = _cache_key(request)
+            entry = _cache_get(key)
+            now = time.time()
+            if entry is not None and now < entry["stale_at"]:
+                return _respond(request, entry, ttl, "HIT")
+
+            try:
+                result = view(self, *args, **kwargs)
+            except DatabaseError:
+                if entry is None:
+                    raise
+                logger.warning("Serving stale response for %s", request.path)
+                return _respond(request, entry, ttl, "STALE")
+
+            status, body, content_type = _render(result)
+            if status != 200:
+                return HttpResponse(body, status=status, content_type=content_type)
+
+            entry = {
+                "body": body,
+                "etag": f'"{hashlib.sha1(body).hexdigest()}"',
+                "status": status,
+                "content_type": content_type,
+                "generated_at": now,
+                "stale_at": now + ttl,
+            }
+            _cache_set(key, entry, ttl + settings.RESPONSE_CACHE_STALE_SECS)
+            return _respond(request, entry, ttl, "MISS")
+
+        return wrapper
+
+    return decorator
@@ -464,7 +464,7 @@ function Overview() {
         interfacesResponse,
         portsResponse,
       ] = await Promise.all([
-        apiClient.getOverviewMetrics({ history_limit: 250 }),
+        apiClient.getOverviewMetrics({ history_limit: 250, record_snapshot: false }),
         apiClient.getNodes(),
         apiClient.getChannelStatistics(),
         apiClient.getInterfaces(),